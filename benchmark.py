@@ -0,0 +1,281 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from control_surface import SURFACE_RESOLUTIONS, ControlSurface
+from fuzzy_engine import INPUT_NAMES, VectorizedEngine
+from fuzzy_model import resample_outputs
+from fuzzy_system import TireFuzzySystem
+from startup_check import MEASURE_GUI, MEASURE_HEADLESS, GUI_DEFERRED, HEADLESS_FORBIDDEN, run_measurement
+
+BATCH_SIZES = (1000, 100000, 1000000)
+QUICK_BATCH_SIZES = (1000, 10000)
+
+# Analitik centroid ile karşılaştırılan örneklenmiş çıktı evreni adımları
+ACCURACY_STEPS = (1.0, 0.1, 0.01)
+ACCURACY_ROWS = 500
+
+# Temel ölçüme göre izin verilen göreli yavaşlama; tek seferlik veya alt süreçli ölçümler daha gürültülüdür
+DEFAULT_THRESHOLD = 0.2
+METRIC_THRESHOLDS = {
+    'show_output_graph_first': 0.5,
+    'cold_import_fuzzy_system': 0.5,
+    'cold_start': 0.5,
+    'cold_import_final': 0.5
+}
+# Doğruluk ölçümleri sabit tohumlarla belirlenimlidir; oranla değil mutlak farkla karşılaştırılır
+ACCURACY_TOLERANCE = 1e-6
+DEFAULT_REPEATS = 100
+# 100 bin ve üzeri satırlık toplu ölçümlerdeki tekrar sayısı
+LARGE_BATCH_REPEATS = 3
+STARTUP_REPEATS = 5
+
+
+def random_inputs(system, size, seed=0):
+    rng = np.random.default_rng(seed)
+    return {name: rng.uniform(system.engine.antecedents[name][0][0], system.engine.antecedents[name][0][-1], size)
+            for name in INPUT_NAMES}
+
+
+def measure(func, repeats, warmup=1):
+    # Isınma çalıştırmaları (önbellekler, bellek ayırıcı) sayılmaz; en iyi süre arka plan gürültüsünden en az etkilenendir
+    for _ in range(warmup):
+        func()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def metric(value, unit, better='lower'):
+    return {'value': value, 'unit': unit, 'better': better}
+
+
+def bench_inference(system, results, repeats):
+    # Isınma çalıştırması için bir satır fazla
+    samples = random_inputs(system, repeats + 1)
+    rows = [{name: float(samples[name][i]) for name in INPUT_NAMES} for i in range(repeats + 1)]
+
+    # skfuzzy referans simülasyonu (girdiler her seferinde farklı, skfuzzy önbelleği devre dışı kalır)
+    simulation = system.simulation
+    iterator = iter(rows)
+
+    def skfuzzy_compute():
+        for name, value in next(iterator).items():
+            simulation.input[name] = value
+        simulation.compute()
+
+    results['skfuzzy_compute_latency'] = metric(measure(skfuzzy_compute, repeats), 's')
+
+    # Tekil compute() (sonuç önbelleği her seferinde temizlenir)
+    iterator = iter(rows)
+
+    def engine_compute():
+        system.result_cache.clear()
+        system.compute(next(iterator))
+
+    results['compute_latency'] = metric(measure(engine_compute, repeats), 's')
+
+
+def bench_batch(system, results, sizes, repeats):
+    for size in sizes:
+        inputs = random_inputs(system, size)
+        elapsed = measure(lambda: system.engine.compute(inputs), LARGE_BATCH_REPEATS if size >= 100000 else repeats,
+                          warmup=0 if size >= 100000 else 1)
+        results[f'batch_throughput_{size}'] = metric(size / elapsed, 'rows/s', better='higher')
+
+
+def max_error(outputs, reference):
+    return max(float(np.nanmax(np.abs(outputs[label] - reference[label]))) for label in reference)
+
+
+def bench_defuzzification(system, results, sizes, repeats):
+    analytic = VectorizedEngine(system.control_system, rule_weights=system.rule_weights, defuzzify='analytic')
+    for size in sizes:
+        inputs = random_inputs(system, size)
+        elapsed = measure(lambda: analytic.compute(inputs), LARGE_BATCH_REPEATS if size >= 100000 else repeats,
+                          warmup=0 if size >= 100000 else 1)
+        results[f'analytic_throughput_{size}'] = metric(size / elapsed, 'rows/s', better='higher')
+
+    # Doğruluk: örneklenmiş centroid (adım 1.0, skfuzzy ile aynı) evren inceldikçe analitik sonuca yaklaşır
+    inputs = random_inputs(system, ACCURACY_ROWS, seed=2)
+    exact = analytic.compute(inputs)
+    for step in ACCURACY_STEPS:
+        sampled = VectorizedEngine(resample_outputs(system.control_system, step), rule_weights=system.rule_weights,
+                                   chunk_size=256)
+        results[f'sampled_error_step_{step:g}'] = metric(max_error(sampled.compute(inputs), exact), 'abs')
+
+    # skfuzzy ControlSystemSimulation sonucuna göre doğrudan karşılaştırma; satır sayısı tekrar sayısından
+    # bağımsızdır, aksi halde farklı --repeats ile alınan ölçümler karşılaştırılamaz
+    simulation = system.simulation
+    reference = {label: np.full(ACCURACY_ROWS, np.nan) for label in exact}
+    for i in range(ACCURACY_ROWS):
+        for name in INPUT_NAMES:
+            simulation.input[name] = inputs[name][i]
+        simulation.compute()
+        for label in reference:
+            reference[label][i] = simulation.output.get(label, np.nan)
+    results['analytic_vs_skfuzzy_error'] = metric(max_error(exact, reference), 'abs')
+
+
+def bench_startup(system, results, repeats):
+    # Alt süreç ölçümleri pahalıdır; en iyi sonuç için birkaç tekrar yeterlidir
+    headless = run_measurement(MEASURE_HEADLESS % (HEADLESS_FORBIDDEN,), STARTUP_REPEATS)
+    gui = run_measurement(MEASURE_GUI % (GUI_DEFERRED,), STARTUP_REPEATS)
+    results['cold_import_fuzzy_system'] = metric(headless['import_fuzzy_system'], 's')
+    results['cold_start'] = metric(headless['cold_start'], 's')
+    results['cold_import_final'] = metric(gui['import_final'], 's')
+    results['create_fuzzy_system'] = metric(measure(system.create_fuzzy_system, max(1, repeats // 5)), 's')
+
+
+def make_headless_app():
+    # Tk penceresi açmadan arayüz çizim yollarını Agg tuvali üzerinde çalıştırır
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from final import TireMaintenanceApp
+
+    app = TireMaintenanceApp.__new__(TireMaintenanceApp)
+    TireFuzzySystem.__init__(app)
+    app.current_output_var = 'maintenance_priority'
+    app.figure = Figure(figsize=(20, 10), dpi=100)
+    app.canvas = FigureCanvasAgg(app.figure)
+    app.canvas.mpl_connect('draw_event', app.on_graph_draw)
+    app.clear_graph()
+    return app, Figure, FigureCanvasAgg
+
+
+def bench_rendering(results, repeats):
+    app, Figure, FigureCanvasAgg = make_headless_app()
+    samples = random_inputs(app, repeats + 2, seed=1)
+    outputs = [app.compute({name: float(samples[name][i]) for name in INPUT_NAMES}) for i in range(repeats + 2)]
+
+    # İlk çizim: eksenler ve üyelik eğrileri oluşturulur
+    app.outputs = outputs[0]
+    start = time.perf_counter()
+    app.show_output_graph('maintenance_priority')
+    results['show_output_graph_first'] = metric(time.perf_counter() - start, 's')
+
+    # Sonraki hesaplamalar: yalnızca sonuç işaretleri güncellenir
+    iterator = iter(outputs[1:])
+
+    def update():
+        app.outputs = next(iterator)
+        app.show_output_graph('maintenance_priority')
+
+    results['show_output_graph_update'] = metric(measure(update, repeats), 's')
+
+    def membership_figures():
+        fig_input = Figure(figsize=(10, 8), dpi=100)
+        app.plot_input_memberships(fig_input)
+        FigureCanvasAgg(fig_input).draw()
+        fig_output = Figure(figsize=(10, 4), dpi=100)
+        app.plot_output_memberships(fig_output)
+        FigureCanvasAgg(fig_output).draw()
+
+    # Pencere açmadan yalnızca şekil çizimi: plot_*_memberships + Agg tuvali (show_membership_functions değil)
+    results['membership_figures_agg'] = metric(measure(membership_figures, max(1, repeats // 10)), 's')
+
+    # Kontrol yüzeyi: önbelleksiz ince ızgara hesabı ve ısı haritası çizimi
+    resolution = SURFACE_RESOLUTIONS[-1]
+
+    def surface_grid():
+        ControlSurface(app).compute('average_speed', 'tire_pressure', app.default_values, resolution)
+
+    results['control_surface_grid'] = metric(measure(surface_grid, max(1, repeats // 10)), 's')
+    surface = ControlSurface(app).compute('average_speed', 'tire_pressure', app.default_values, resolution)
+
+    def surface_figure():
+        fig = Figure(figsize=(9, 6.5), dpi=100)
+        app.plot_control_surface(fig, surface, 'average_speed', 'tire_pressure', 'change_probability', 'heatmap')
+        FigureCanvasAgg(fig).draw()
+
+    results['control_surface_figure'] = metric(measure(surface_figure, max(1, repeats // 10)), 's')
+
+
+def run_benchmarks(quick=False, repeats=DEFAULT_REPEATS):
+    system = TireFuzzySystem()
+    results = {}
+    bench_inference(system, results, repeats)
+    bench_batch(system, results, QUICK_BATCH_SIZES if quick else BATCH_SIZES, max(5, repeats // 10))
+    bench_defuzzification(system, results, QUICK_BATCH_SIZES if quick else BATCH_SIZES, max(5, repeats // 10))
+    bench_startup(system, results, repeats)
+    bench_rendering(results, repeats)
+    return results
+
+
+def slowdown(current, previous, better):
+    # Göreli yavaşlama oranı; sıfır değerler (ölçülemeyecek kadar kısa süre vb.) bölme hatasına yol açmaz
+    worse, better_value = (current, previous) if better == 'lower' else (previous, current)
+    if better_value <= 0:
+        return float('inf') if worse > 0 else 1.0
+    return worse / better_value
+
+
+def compare(results, baseline, threshold=None):
+    # Doğruluk ölçümleri ('abs') mutlak toleransla, süreler metriğe özgü göreli eşikle karşılaştırılır;
+    # threshold verilirse tüm süre ölçümlerinde metriğe özgü eşiklerin yerine kullanılır.
+    # Dönüş: (ad, önceki, şimdiki, oran veya mutlak fark, 'x' veya 'abs')
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current['unit'] == 'abs':
+            difference = current['value'] - previous['value']
+            if current['better'] == 'higher':
+                difference = -difference
+            if difference > ACCURACY_TOLERANCE:
+                regressions.append((name, previous['value'], current['value'], difference, 'abs'))
+            continue
+        limit = METRIC_THRESHOLDS.get(name, DEFAULT_THRESHOLD) if threshold is None else threshold
+        ratio = slowdown(current['value'], previous['value'], current['better'])
+        if ratio > 1 + limit:
+            regressions.append((name, previous['value'], current['value'], ratio, 'x'))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Çıkarım, toplu hesaplama, başlangıç ve çizim performansını ölçer.")
+    parser.add_argument('--output', help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument('--baseline', help="Karşılaştırılacak temel ölçüm JSON dosyası")
+    parser.add_argument('--threshold', type=float,
+                        help="Tüm süre ölçümlerinde izin verilen göreli yavaşlama (varsayılan: metriğe özgü eşikler)")
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS, help="Gecikme ölçümlerindeki tekrar sayısı")
+    parser.add_argument('--quick', action='store_true', help="Büyük toplu ölçümleri atla")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(quick=args.quick, repeats=args.repeats)
+    for name, result in results.items():
+        print(f"{name:<32} {result['value']:>14.6g} {result['unit']}")
+
+    document = {
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'platform': sys.platform,
+        'cpu_count': os.cpu_count(),
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for name, previous, current, change, kind in regressions:
+            detail = f"+{change:.3g}" if kind == 'abs' else f"{change:.2f}x"
+            print(f"GERİLEME: {name}: {previous:.6g} -> {current:.6g} ({detail})", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+import numpy as np
+
+from fuzzy_engine import INPUT_NAMES
+from result_cache import ResultCache
+
+# İlerlemeli hesaplama çözünürlükleri: kaba ızgara hemen gösterilir, ardından ince ızgara
+SURFACE_RESOLUTIONS = (15, 60)
+
+
+class ControlSurface:
+    def __init__(self, system, cache_size=64):
+        self.system = system
+        # Izgaralar tanım özetine bağlıdır; sistem yeniden kurulunca geçersiz olur
+        self.cache = ResultCache(cache_size)
+
+    def axis(self, name, resolution):
+        universe = getattr(self.system, name).universe
+        return np.linspace(float(universe[0]), float(universe[-1]), resolution)
+
+    def make_key(self, x_name, y_name, fixed, resolution):
+        others = ResultCache.make_key({name: fixed[name] for name in INPUT_NAMES if name not in (x_name, y_name)})
+        return (x_name, y_name, others, resolution, self.system.lookup is not None)
+
+    def is_cached(self, x_name, y_name, fixed, resolution):
+        self.cache.bind(self.system.definition_fingerprint)
+        return self.cache.contains(self.make_key(x_name, y_name, fixed, resolution))
+
+    def compute(self, x_name, y_name, fixed, resolution):
+        if x_name == y_name:
+            raise ValueError("X ve Y eksenleri farklı girdiler olmalıdır.")
+        fingerprint = self.system.definition_fingerprint
+        self.cache.bind(fingerprint)
+        key = self.make_key(x_name, y_name, fixed, resolution)
+        surface = self.cache.get(key)
+        if surface is not None:
+            return surface
+
+        # Tek bir toplu çağrı: X satır, Y sütun vektörü olarak yayınlanır, diğer girdiler sabit
+        xs, ys = self.axis(x_name, resolution), self.axis(y_name, resolution)
+        inputs = {name: float(fixed[name]) for name in INPUT_NAMES}
+        inputs[x_name] = xs[None, :]
+        inputs[y_name] = ys[:, None]
+        outputs = self.system.compute_batch(inputs)
+
+        surface = {'x': xs, 'y': ys}
+        surface.update({label: np.broadcast_to(values, (len(ys), len(xs))) for label, values in outputs.items()})
+        self.cache.put(key, surface, fingerprint)
+        return surface
+
+    def progressive(self, x_name, y_name, fixed, resolutions=SURFACE_RESOLUTIONS):
+        # Kabadan inceye ızgaralar; en ince ızgara önbellekteyse yalnızca o döner
+        if self.is_cached(x_name, y_name, fixed, resolutions[-1]):
+            resolutions = resolutions[-1:]
+        for resolution in resolutions:
+            yield resolution, self.compute(x_name, y_name, fixed, resolution)
@@ -0,0 +1,27 @@
+import numpy as np
+
+from fuzzy_engine import INPUT_NAMES
+
+
+def read_chunks(reader, chunk_size):
+    chunk = []
+    for row in reader:
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def parse_inputs(rows, first_line):
+    inputs = {}
+    for name in INPUT_NAMES:
+        values = np.empty(len(rows))
+        for i, row in enumerate(rows):
+            try:
+                values[i] = float(row[name])
+            except (TypeError, ValueError):
+                raise ValueError(f"Satır {first_line + i}: '{name}' değeri geçersiz: {row[name]!r}")
+        inputs[name] = values
+    return inputs
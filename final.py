@@ -1,26 +1,59 @@
+import argparse
+import queue
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
 import numpy as np
-import skfuzzy as fuzz
-from skfuzzy import control as ctrl
 import tkinter as tk
-from tkinter import ttk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-from matplotlib import cm
+from tkinter import ttk, filedialog
+from control_surface import SURFACE_RESOLUTIONS, ControlSurface
+from fleet_store import CHANGE_THRESHOLD, STORE_DIR, FleetStore
+from fuzzy_engine import INPUT_NAMES, OUTPUT_NAMES
+from fuzzy_system import TireFuzzySystem
+from uncertainty import UncertaintyAnalyzer, describe
+
+# Canlı modda kaydırıcı olaylarının birleştirildiği aralık (~60 fps)
+LIVE_UPDATE_INTERVAL_MS = 16
+# Sistem tanımı dosyasının değişiklik denetim aralığı
+DEFINITION_POLL_MS = 1000
+# Arka planda oluşturulan önceden hesaplanmış tablonun ilerleme denetim aralığı
+LOOKUP_POLL_MS = 500
+
+# Kontrol yüzeyi eksen ve renk çubuğu etiketleri
+VARIABLE_LABELS = {
+    'usage_time': "Günlük Kullanım Süresi (saat)",
+    'road_type': "Yol Sertliği",
+    'temperature': "Sıcaklık (°C)",
+    'average_speed': "Ortalama Hız (km/s)",
+    'tire_pressure': "Lastik Basıncı (PSI)",
+    'maintenance_priority': "Bakım Önceliği",
+    'change_probability': "Değişim İhtimali (%)"
+}
+
+# Filo listesi sorguları (görünen ad: sorgu)
+FLEET_QUERIES = {
+    "En yüksek bakım önceliği": 'priority',
+    f"Değişim ihtimali ≥ {CHANGE_THRESHOLD:.0f}": 'change'
+}
+FLEET_COLUMNS = ('tire_id', 'maintenance_priority', 'priority_level', 'change_probability', 'probability_level') + tuple(INPUT_NAMES)
 
 def check_dependencies():
-    try:
-        import numpy
-        import skfuzzy
-        import matplotlib
-    except ImportError as e:
+    # Modüller yüklenmeden yalnızca kurulu olup olmadıkları kontrol edilir
+    missing = [name for name in ('numpy', 'skfuzzy', 'matplotlib') if importlib.util.find_spec(name) is None]
+    if missing:
         print("Eksik bağımlılıklar tespit edildi. Lütfen şu komutu çalıştırın:")
         print("pip install -r requirements.txt")
-        raise e
+        raise ImportError(f"Eksik modüller: {', '.join(missing)}")
+
 
+def load_plotting():
+    # matplotlib ve Tk arka ucu yalnızca ilk grafik istendiğinde yüklenir
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    return Figure, FigureCanvasTkAgg
 
-class TireMaintenanceApp:
-    def __init__(self, root):
+
+class TireMaintenanceApp(TireFuzzySystem):
+    def __init__(self, root, definition=None, store=None):
         self.root = root
         self.root.title("Lastik Bakım Analiz Sistemi")
         self.root.geometry("1200x800")
@@ -28,8 +61,36 @@ class TireMaintenanceApp:
         self.style.theme_use('clam')
         self.configure_styles()
         
-        self.create_fuzzy_system()
+        super().__init__(definition=definition)
+        
+        # Canlı hesaplama: çıkarım ayrı bir iş parçacığında, sonuçlar root.after ile ana iş parçacığında işlenir
+        self.live_executor = ThreadPoolExecutor(max_workers=1)
+        self.live_results = queue.Queue()
+        self.live_request_id = 0
+        self.live_after_id = None
+        self.live_busy = False
+        # Kontrol yüzeyi: kaba ve ince ızgara kendi işçisinde sırayla hesaplanır; canlı sonuçları bekletmez
+        self.surface = ControlSurface(self)
+        self.surface_executor = ThreadPoolExecutor(max_workers=1)
+        self.surface_results = queue.Queue()
+        self.surface_request_id = 0
+        self.surface_after_id = None
+        self.surface_busy = False
+        self.surface_pending = None
+        # Filo sonuç deposu ilk kullanımda açılır
+        self.fleet_store_path = store or STORE_DIR
+        self.fleet_store = None
+        # Hesapla düğmesinde isteğe bağlı sensör gürültüsü analizi
+        self.uncertainty = UncertaintyAnalyzer(self)
+        self.current_output_var = 'maintenance_priority'
+        self.cached_windows = {}
+        # Son gösterilen tanım hatası; aynı hata her yoklamada yeniden gösterilmez
+        self.definition_error = None
+        self.lookup_poll_id = None
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         self.setup_ui()
+        self.root.after(DEFINITION_POLL_MS, self.poll_definition)
         
     def configure_styles(self):
         self.style.configure('TFrame', background='#f0f0f0')
@@ -46,105 +107,6 @@ class TireMaintenanceApp:
                       foreground=[('pressed', 'white'), ('active', 'white')],
                       background=[('pressed', '#2980b9'), ('active', '#3498db')])
     
-    def create_fuzzy_system(self):
-        # Girdiler
-        self.usage_time = ctrl.Antecedent(np.arange(0, 11, 1), 'usage_time')
-        self.road_type = ctrl.Antecedent(np.arange(0, 11, 1), 'road_type')
-        self.temperature = ctrl.Antecedent(np.arange(-10, 51, 1), 'temperature')
-        self.average_speed = ctrl.Antecedent(np.arange(0, 181, 1), 'average_speed')
-        self.tire_pressure = ctrl.Antecedent(np.arange(20, 41, 1), 'tire_pressure')
-
-        # Çıktılar
-        self.maintenance_priority = ctrl.Consequent(np.arange(0, 11, 1), 'maintenance_priority')
-        self.change_probability = ctrl.Consequent(np.arange(0, 101, 1), 'change_probability')
-
-        # Üyelik fonksiyonları - Girdiler
-        self.usage_time['low'] = fuzz.trimf(self.usage_time.universe, [0, 0, 3])
-        self.usage_time['medium'] = fuzz.trimf(self.usage_time.universe, [2, 5, 8])
-        self.usage_time['high'] = fuzz.trimf(self.usage_time.universe, [6, 10, 10])
-
-        self.road_type['soft'] = fuzz.trimf(self.road_type.universe, [0, 0, 3])
-        self.road_type['medium'] = fuzz.trimf(self.road_type.universe, [2, 5, 8])
-        self.road_type['hard'] = fuzz.trimf(self.road_type.universe, [6, 10, 10])
-
-        self.temperature['cold'] = fuzz.trimf(self.temperature.universe, [-10, -10, 10])
-        self.temperature['moderate'] = fuzz.trimf(self.temperature.universe, [5, 20, 30])
-        self.temperature['hot'] = fuzz.trimf(self.temperature.universe, [25, 50, 50])
-
-        self.average_speed['slow'] = fuzz.trimf(self.average_speed.universe, [0, 0, 60])
-        self.average_speed['moderate'] = fuzz.trimf(self.average_speed.universe, [40, 90, 140])
-        self.average_speed['fast'] = fuzz.trimf(self.average_speed.universe, [120, 180, 180])
-
-        self.tire_pressure['low'] = fuzz.trimf(self.tire_pressure.universe, [20, 20, 28])
-        self.tire_pressure['optimal'] = fuzz.trimf(self.tire_pressure.universe, [26, 30, 34])
-        self.tire_pressure['high'] = fuzz.trimf(self.tire_pressure.universe, [32, 40, 40])
-
-        # Üyelik fonksiyonları - Çıktılar
-        self.maintenance_priority['low'] = fuzz.trimf(self.maintenance_priority.universe, [0, 0, 3])
-        self.maintenance_priority['medium'] = fuzz.trimf(self.maintenance_priority.universe, [2, 5, 8])
-        self.maintenance_priority['high'] = fuzz.trimf(self.maintenance_priority.universe, [7, 10, 10])
-
-        self.change_probability['low'] = fuzz.trimf(self.change_probability.universe, [0, 0, 30])
-        self.change_probability['medium'] = fuzz.trimf(self.change_probability.universe, [20, 50, 80])
-        self.change_probability['high'] = fuzz.trimf(self.change_probability.universe, [70, 100, 100])
-
-        # Kurallar
-        self.rules = [
-            {
-                'rule': ctrl.Rule(self.usage_time['high'] & self.road_type['hard'], self.maintenance_priority['high']),
-                'desc': "Eğer kullanım süresi yüksek VE yol sert ise, bakım önceliği yüksektir.",
-                'weight': 1.0
-            },
-            {
-                'rule': ctrl.Rule(self.usage_time['medium'] & self.road_type['medium'], self.maintenance_priority['medium']),
-                'desc': "Eğer kullanım süresi orta VE yol orta sertlikte ise, bakım önceliği ortadır.",
-                'weight': 1.0
-            },
-            {
-                'rule': ctrl.Rule(self.usage_time['low'] & self.road_type['soft'], self.maintenance_priority['low']),
-                'desc': "Eğer kullanım süresi düşük VE yol yumuşak ise, bakım önceliği düşüktür.",
-                'weight': 1.0
-            },
-            {
-                'rule': ctrl.Rule(self.average_speed['fast'] | self.temperature['hot'] | self.tire_pressure['low'], self.change_probability['high']),
-                'desc': "Eğer ortalama hız yüksek VEYA sıcaklık yüksek VEYA lastik basıncı düşük ise, değişim ihtimali yüksektir.",
-                'weight': 1.0
-            },
-            {
-                'rule': ctrl.Rule(self.average_speed['moderate'] & self.tire_pressure['optimal'], self.change_probability['medium']),
-                'desc': "Eğer ortalama hız orta VE lastik basıncı optimal ise, değişim ihtimali ortadır.",
-                'weight': 1.0
-            },
-            {
-                'rule': ctrl.Rule(self.average_speed['slow'] & self.tire_pressure['optimal'], self.change_probability['low']),
-                'desc': "Eğer ortalama hız düşük VE lastik basıncı optimal ise, değişim ihtimali düşüktür.",
-                'weight': 1.0
-            },
-            {
-                'rule': ctrl.Rule(self.temperature['cold'] & self.tire_pressure['high'], self.maintenance_priority['medium']),
-                'desc': "Eğer sıcaklık düşük VE lastik basıncı yüksek ise, bakım önceliği ortadır.",
-                'weight': 1.0
-            },
-            {
-                'rule': ctrl.Rule(self.usage_time['high'] & self.tire_pressure['low'], self.change_probability['high']),
-                'desc': "Eğer kullanım süresi yüksek VE lastik basıncı düşük ise, değişim ihtimali yüksektir.",
-                'weight': 1.0
-            }
-        ]
-        
-        # Kontrol sistemi
-        self.control_system = ctrl.ControlSystem([r['rule'] for r in self.rules])
-        self.simulation = ctrl.ControlSystemSimulation(self.control_system)
-        
-        # Varsayılan değerler
-        self.default_values = {
-            'usage_time': 5,
-            'road_type': 5,
-            'temperature': 20,
-            'average_speed': 90,
-            'tire_pressure': 30
-        }
-    
     def setup_ui(self):
         # Ana çerçeveler
         self.main_frame = ttk.Frame(self.root, padding="10")
@@ -187,6 +149,28 @@ class TireMaintenanceApp:
         ttk.Button(button_frame, text="Varsayılanlar", command=self.load_default_values).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Üyelik Fonksiyonları", command=self.show_membership_functions).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Kurallar", command=self.show_rules).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Kontrol Yüzeyi", command=self.show_control_surface).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Filo Listesi", command=self.show_fleet_list).pack(side=tk.LEFT, padx=5)
+        
+        self.live_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.input_frame, text="Canlı Hesaplama (kaydırıcı hareket ettikçe)", variable=self.live_var,
+                        command=self.schedule_live_update).grid(row=7, column=0, columnspan=2, sticky=tk.W)
+        
+        # Ölçüm ve profil araçları
+        tools_frame = ttk.Frame(self.input_frame)
+        tools_frame.grid(row=8, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
+        self.instrument_var = tk.BooleanVar(value=False)
+        self.profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(tools_frame, text="Aşama Ölçümü", variable=self.instrument_var,
+                        command=self.update_instrumentation).pack(side=tk.LEFT, padx=5)
+        ttk.Checkbutton(tools_frame, text="cProfile", variable=self.profile_var,
+                        command=self.update_instrumentation).pack(side=tk.LEFT, padx=5)
+        ttk.Button(tools_frame, text="Ölçümleri Dışa Aktar", command=self.export_instrumentation).pack(side=tk.LEFT, padx=5)
+        self.lookup_status = ttk.Label(self.input_frame, text="")
+        self.lookup_status.grid(row=9, column=0, columnspan=2, sticky=tk.W)
+        self.uncertainty_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(tools_frame, text="Belirsizlik Analizi", variable=self.uncertainty_var).pack(side=tk.LEFT, padx=5)
     
     def create_slider_input(self, label_text, variable_name, from_, to, resolution, row):
         label = ttk.Label(self.input_frame, text=label_text)
@@ -210,6 +194,121 @@ class TireMaintenanceApp:
         rounded_value = round(float(value) / resolution) * resolution
         getattr(self, f"{variable_name}_var").set(rounded_value)
         getattr(self, f"{variable_name}_label").config(text=f"{rounded_value:.1f}")
+        self.schedule_live_update()
+        self.schedule_surface_update()
+    
+    def schedule_live_update(self):
+        if not self.live_var.get():
+            return
+        # Her konum değişikliği yeni bir istek; bir kare içindeki olaylar tek hesaplamada birleşir
+        self.live_request_id += 1
+        if self.live_after_id is None:
+            self.live_after_id = self.root.after(LIVE_UPDATE_INTERVAL_MS, self.start_live_compute)
+    
+    def start_live_compute(self):
+        self.live_after_id = None
+        if self.live_busy:
+            # Önceki hesaplama bitince en güncel konum için yeniden başlatılır
+            return
+        self.live_busy = True
+        self.live_executor.submit(self.live_compute, self.live_request_id, self.get_inputs())
+        self.root.after(LIVE_UPDATE_INTERVAL_MS, self.poll_live_results)
+    
+    def live_compute(self, request_id, inputs):
+        # İşçi iş parçacığı: Tk nesnelerine dokunmaz, sonucu kuyruğa bırakır
+        try:
+            self.live_results.put((request_id, inputs, self.compute(inputs), None))
+        except Exception as e:
+            self.live_results.put((request_id, inputs, None, e))
+    
+    def poll_live_results(self):
+        try:
+            request_id, inputs, outputs, error = self.live_results.get_nowait()
+        except queue.Empty:
+            self.root.after(LIVE_UPDATE_INTERVAL_MS, self.poll_live_results)
+            return
+        
+        self.live_busy = False
+        if request_id != self.live_request_id:
+            # Kaydırıcı bu arada hareket etti: eski sonucu at, en güncel konumu hesapla
+            if self.live_var.get():
+                self.start_live_compute()
+            return
+        
+        if error is not None:
+            self.show_error(error)
+        else:
+            self.outputs = outputs
+            self.show_results(inputs, outputs, self.current_output_var)
+    
+    def start_lookup(self):
+        # Tablo arka planda hazırlanır; hazır olana kadar motor kullanılır, ilerleme durum satırında gösterilir
+        self.lookup_progress = (0, 0)
+        self.enable_lookup(background=True, progress=self.set_lookup_progress)
+        self.poll_lookup()
+    
+    def set_lookup_progress(self, done, total):
+        self.lookup_progress = (done, total)
+    
+    def poll_lookup(self):
+        if self.lookup_thread.is_alive():
+            done, total = self.lookup_progress
+            if total:
+                text = f"Önceden hesaplanmış tablo oluşturuluyor: %{100 * done / total:.0f} (şimdilik doğrudan hesaplanıyor)"
+            else:
+                text = "Önceden hesaplanmış tablo yükleniyor..."
+            self.lookup_status.config(text=text)
+            self.lookup_poll_id = self.root.after(LOOKUP_POLL_MS, self.poll_lookup)
+        elif self.lookup_error is not None:
+            self.lookup_status.config(text=f"Önceden hesaplanmış tablo oluşturulamadı, doğrudan hesaplanıyor: {self.lookup_error}")
+        else:
+            self.lookup_status.config(text="Önceden hesaplanmış tablo kullanılıyor.")
+    
+    def update_instrumentation(self):
+        self.set_instrumentation(self.instrument_var.get(), profile=self.profile_var.get())
+    
+    def export_instrumentation(self):
+        path = filedialog.asksaveasfilename(parent=self.root, title="Ölçümleri Kaydet", defaultextension=".json",
+                                            filetypes=[("JSON", "*.json")])
+        if not path:
+            return
+        # cProfile açıksa istatistikler aynı adla .prof dosyasına yazılır
+        profile_path = path.rsplit('.', 1)[0] + '.prof'
+        self.instrumentation.save(path, profile_path)
+    
+    def poll_definition(self):
+        # Tanım dosyası düzenlendiyse sistem yeniden kurulur; sonuçlar ve açık pencereler yenilenir
+        try:
+            reloaded = self.reload_definition()
+        except Exception as e:
+            message = f"Sistem tanımı yüklenemedi, önceki tanım kullanılıyor: {e}"
+            if message != self.definition_error:
+                self.show_error(message)
+            self.definition_error = message
+            reloaded = False
+        else:
+            self.definition_error = None
+        if reloaded and self.lookup_settings is not None:
+            # Tablo yeni tanım için yeniden hazırlanıyor; durum satırı baştan izlenir
+            if self.lookup_poll_id is not None:
+                self.root.after_cancel(self.lookup_poll_id)
+            self.lookup_progress = (0, 0)
+            self.poll_lookup()
+        if reloaded:
+            self.clear_graph()
+            self.calculate()
+            views = {'membership': self.show_membership_functions, 'rules': self.show_rules,
+                     'surface': self.show_control_surface, 'fleet': self.show_fleet_list}
+            for name, (_, top) in list(self.cached_windows.items()):
+                if top.winfo_exists() and top.winfo_viewable():
+                    views[name]()
+        self.root.after(DEFINITION_POLL_MS, self.poll_definition)
+    
+    def on_close(self):
+        # Bekleyen istekler en fazla bir hesaplama sürer; sonuçları istek numarasıyla zaten yok sayılır
+        self.live_executor.shutdown(wait=False)
+        self.surface_executor.shutdown(wait=False)
+        self.root.destroy()
     
     def create_output_controls(self):
         # Başlık
@@ -240,45 +339,64 @@ class TireMaintenanceApp:
         self.graph_frame = ttk.Frame(self.root, style='Graph.TFrame', padding="10")
         self.graph_frame.pack(fill=tk.BOTH, expand=True)
         
+        # Başlangıçta boş bir grafik alanı göster; çizim alanı ilk grafikte oluşturulur
+        self.figure = None
+        self.canvas = None
+        self.clear_graph()
+    
+    def create_graph_canvas(self):
+        if self.figure is not None:
+            return
+        Figure, FigureCanvasTkAgg = load_plotting()
         self.figure = Figure(figsize=(20, 10), dpi=100)
         self.canvas = FigureCanvasTkAgg(self.figure, master=self.graph_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Başlangıçta boş bir grafik göster
-        self.clear_graph()
+        self.canvas.mpl_connect('draw_event', self.on_graph_draw)
     
     def clear_graph(self):
-        self.figure.clear()
-        self.canvas.draw()
+        self.graph_artists = {}
+        self.graph_shown = None
+        self.graph_background = None
+        if self.figure is not None:
+            self.figure.clear()
+            self.canvas.draw()
     
     def load_default_values(self):
         for var_name, value in self.default_values.items():
             getattr(self, f"{var_name}_var").set(value)
             getattr(self, f"{var_name}_label").config(text=f"{value:.1f}")
+        self.schedule_live_update()
+        self.schedule_surface_update()
+    
+    def get_inputs(self):
+        return {
+            'usage_time': self.usage_time_var.get(),
+            'road_type': self.road_type_var.get(),
+            'temperature': self.temperature_var.get(),
+            'average_speed': self.average_speed_var.get(),
+            'tire_pressure': self.tire_pressure_var.get()
+        }
     
     def calculate(self):
         try:
             # Girdileri al
-            inputs = {
-                'usage_time': self.usage_time_var.get(),
-                'road_type': self.road_type_var.get(),
-                'temperature': self.temperature_var.get(),
-                'average_speed': self.average_speed_var.get(),
-                'tire_pressure': self.tire_pressure_var.get()
-            }
+            inputs = self.get_inputs()
             
             # Hesaplamayı yap
-            self.simulation.input['usage_time'] = inputs['usage_time']
-            self.simulation.input['road_type'] = inputs['road_type']
-            self.simulation.input['temperature'] = inputs['temperature']
-            self.simulation.input['average_speed'] = inputs['average_speed']
-            self.simulation.input['tire_pressure'] = inputs['tire_pressure']
+            self.outputs = self.compute(inputs)
             
-            self.simulation.compute()
+            # Sonuçları göster, bakım önceliği grafiğiyle birlikte
+            self.show_results(inputs, self.outputs, 'maintenance_priority')
+            if self.uncertainty_var.get():
+                self.show_uncertainty(inputs)
             
-            # Sonuçları göster
-            maintenance_val = self.simulation.output['maintenance_priority']
-            change_val = self.simulation.output['change_probability']
+        except Exception as e:
+            self.show_error(e)
+    
+    def show_results(self, inputs, outputs, output_var):
+        try:
+            maintenance_val = outputs['maintenance_priority']
+            change_val = outputs['change_probability']
             
             self.maintenance_result.config(text=f"{maintenance_val:.2f} - {self.get_priority_level(maintenance_val)}")
             self.change_result.config(text=f"{change_val:.2f}% - {self.get_probability_level(change_val)}")
@@ -288,28 +406,21 @@ class TireMaintenanceApp:
             self.result_explanation.delete(1.0, tk.END)
             self.result_explanation.insert(tk.END, explanation)
             
-            # Bakım önceliği grafiğini göster
-            self.show_output_graph('maintenance_priority')
+            self.show_output_graph(output_var)
             
         except Exception as e:
-            self.result_explanation.delete(1.0, tk.END)
-            self.result_explanation.insert(tk.END, f"Hata oluştu: {str(e)}")
+            self.show_error(e)
     
-    def get_priority_level(self, value):
-        if value <= 3:
-            return "Düşük Öncelik"
-        elif value <= 7:
-            return "Orta Öncelik"
-        else:
-            return "Yüksek Öncelik"
+    def show_uncertainty(self, inputs):
+        # Basınç ve sıcaklık gürültüsüyle bozulmuş örneklerin tek toplu değerlendirmesi
+        results = self.uncertainty.analyze({name: [value] for name, value in inputs.items()})
+        noise = ", ".join(f"{VARIABLE_LABELS[name]} ±{scale:g}" for name, (_, scale) in self.uncertainty.noise.items())
+        self.result_explanation.insert(tk.END, f"\n\nSensör Belirsizliği ({self.uncertainty.samples} örnek; {noise}):\n"
+                                               + describe(results))
     
-    def get_probability_level(self, value):
-        if value <= 30:
-            return "Düşük İhtimal"
-        elif value <= 70:
-            return "Orta İhtimal"
-        else:
-            return "Yüksek İhtimal"
+    def show_error(self, error):
+        self.result_explanation.delete(1.0, tk.END)
+        self.result_explanation.insert(tk.END, f"Hata oluştu: {str(error)}")
     
     def generate_explanation(self, inputs, maintenance_val, change_val):
         explanation = "Girilen Parametreler:\n"
@@ -340,62 +451,148 @@ class TireMaintenanceApp:
         return explanation
     
     def show_output_graph(self, output_var):
-        self.figure.clear()
+        self.current_output_var = output_var
+        self.create_graph_canvas()
+        artists = self.get_output_artists(output_var)
+        
+        # Diğer çıktının eksenini gizle; gösterilen eksen değiştiyse saklı arka plan geçersizdir
+        if self.graph_shown != output_var:
+            self.graph_shown = output_var
+            self.graph_background = None
+            for name, other in self.graph_artists.items():
+                other['ax'].set_visible(name == output_var)
+        
+        changed = self.update_output_result(artists, self.outputs.get(output_var, 0))
+        
+        if self.graph_background is None:
+            self.canvas.draw_idle()
+        elif changed:
+            self.blit_output_graph()
+    
+    def get_output_artists(self, output_var):
+        # Üyelik eğrileri her çıktı için yalnızca bir kez çizilir; sonuç işaretleri sonradan güncellenir
+        if output_var in self.graph_artists:
+            return self.graph_artists[output_var]
         
         if output_var == 'maintenance_priority':
             var = self.maintenance_priority
             title = "Bakım Önceliği Üyelik Fonksiyonları ve Sonuç"
-            output_value = self.simulation.output.get('maintenance_priority', 0)
         else:
             var = self.change_probability
             title = "Değişim İhtimali Üyelik Fonksiyonları ve Sonuç"
-            output_value = self.simulation.output.get('change_probability', 0)
         
-        ax = self.figure.add_subplot(111)
+        ax = self.figure.add_subplot(111, label=output_var)
         
         # Üyelik fonksiyonlarını çiz
+        colors = {}
         for term in var.terms:
-            ax.plot(var.universe, fuzz.interp_membership(var.universe, var[term].mf, var.universe), 
-                   linewidth=1.5, label=term)
+            line, = ax.plot(var.universe, np.interp(var.universe, var.universe, var[term].mf), 
+                            linewidth=1.5, label=term)
+            colors[term] = line.get_color()
+        
+        ax.set_title(title)
+        ax.legend()
+        ax.set_ylim(0, 1.1)
+        ax.grid(True)
+        
+        # Sonuç işaretleri: animasyonlu sanatçılar tam çizime girmez, blitting ile çizilir
+        artists = {
+            'ax': ax,
+            'var': var,
+            'colors': colors,
+            'value': None,
+            'fills': [],
+            'vline': ax.vlines([], 0, 0, color='k', linestyle='--', linewidth=2, animated=True),
+            'marker': ax.plot([], [], 'ko', markersize=8, animated=True)[0],
+            'annotation': ax.annotate('', xy=(0, 0), xytext=(0, 0),
+                                      arrowprops=dict(facecolor='black', shrink=0.05), animated=True)
+        }
+        self.graph_artists[output_var] = artists
+        return artists
+    
+    def update_output_result(self, artists, output_value):
+        if output_value == artists['value']:
+            return False
+        artists['value'] = output_value
+        
+        ax, var = artists['ax'], artists['var']
+        for fill in artists['fills']:
+            fill.remove()
+        artists['fills'] = []
         
         # Sonucu işaretle
-        if output_value > 0:
+        visible = output_value > 0
+        if visible:
             # Aktivasyon seviyelerini hesapla
             activations = {}
             for term in var.terms:
-                activations[term] = fuzz.interp_membership(var.universe, var[term].mf, output_value)
+                activations[term] = np.interp(output_value, var.universe, var[term].mf)
             
             # En yüksek aktivasyonu bul
             max_activation_term = max(activations, key=activations.get)
             max_activation = activations[max_activation_term]
             
-            # Sonucu çiz
-            ax.vlines(output_value, 0, max_activation, color='k', linestyle='--', linewidth=2)
-            ax.plot(output_value, max_activation, 'ko', markersize=8)
-            ax.annotate(f'Sonuç: {output_value:.2f}', 
-                       xy=(output_value, max_activation), 
-                       xytext=(output_value+5, max_activation+0.1),
-                       arrowprops=dict(facecolor='black', shrink=0.05))
+            # Sonucu güncelle
+            artists['vline'].set_segments([[(output_value, 0), (output_value, max_activation)]])
+            artists['marker'].set_data([output_value], [max_activation])
+            artists['annotation'].set_text(f'Sonuç: {output_value:.2f}')
+            artists['annotation'].xy = (output_value, max_activation)
+            artists['annotation'].set_position((output_value+5, max_activation+0.1))
             
             # Alanları doldur
-            for term in var.terms:
-                activation = fuzz.interp_membership(var.universe, var[term].mf, output_value)
+            for term, activation in activations.items():
                 if activation > 0:
-                    ax.fill_between(var.universe, 0, 
-                                   np.fmin(var[term].mf, activation), 
-                                   alpha=0.3)
+                    artists['fills'].append(ax.fill_between(var.universe, 0, 
+                                                            np.fmin(var[term].mf, activation), 
+                                                            color=artists['colors'][term], alpha=0.3, animated=True))
         
-        ax.set_title(title)
-        ax.legend()
-        ax.set_ylim(0, 1.1)
-        ax.grid(True)
-        
-        self.canvas.draw()
+        for name in ('vline', 'marker', 'annotation'):
+            artists[name].set_visible(visible)
+        return True
     
-    def show_membership_functions(self):
+    def draw_output_result(self):
+        artists = self.graph_artists.get(self.current_output_var)
+        if artists is None or not artists['ax'].get_visible():
+            return
+        for artist in artists['fills'] + [artists['vline'], artists['marker'], artists['annotation']]:
+            self.figure.draw_artist(artist)
+    
+    def on_graph_draw(self, event):
+        # Tam çizimden sonra statik arka planı sakla ve sonuç işaretlerini üzerine çiz
+        self.graph_background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_output_result()
+    
+    def blit_output_graph(self):
+        # Yalnızca değişen sonuç işaretlerini saklı arka planın üzerine çiz
+        self.canvas.restore_region(self.graph_background)
+        self.draw_output_result()
+        self.canvas.blit(self.figure.bbox)
+    
+    def get_cached_window(self, name):
+        # Pencere tanım değişmediyse yeniden oluşturulmaz, gizlendiği yerden geri getirilir
+        fingerprint, top = self.cached_windows.get(name, (None, None))
+        if top is not None and top.winfo_exists():
+            if fingerprint == self.definition_fingerprint:
+                top.deiconify()
+                top.lift()
+                top.focus_set()
+                return top
+            top.destroy()
+        return None
+    
+    def create_cached_window(self, name, title, geometry):
         top = tk.Toplevel(self.root)
-        top.title("Üyelik Fonksiyonları")
-        top.geometry("1000x700")
+        top.title(title)
+        top.geometry(geometry)
+        # Kapatıldığında yok edilmez, bir sonraki açılış için gizlenir
+        top.protocol("WM_DELETE_WINDOW", top.withdraw)
+        self.cached_windows[name] = (self.definition_fingerprint, top)
+        return top
+    
+    def show_membership_functions(self):
+        if self.get_cached_window('membership') is not None:
+            return
+        top = self.create_cached_window('membership', "Üyelik Fonksiyonları", "1000x700")
         
         notebook = ttk.Notebook(top)
         notebook.pack(fill=tk.BOTH, expand=True)
@@ -404,10 +601,33 @@ class TireMaintenanceApp:
         input_frame = ttk.Frame(notebook)
         notebook.add(input_frame, text="Girdi Fonksiyonları")
         
+        # Çıktı fonksiyonları
+        output_frame = ttk.Frame(notebook)
+        notebook.add(output_frame, text="Çıktı Fonksiyonları")
+        
+        # Sekmeler ilk seçildiklerinde çizilir
+        renderers = {
+            str(input_frame): lambda: self.render_input_memberships(input_frame),
+            str(output_frame): lambda: self.render_output_memberships(output_frame)
+        }
+        notebook.bind('<<NotebookTabChanged>>', lambda e: self.render_selected_tab(notebook, renderers))
+        self.render_selected_tab(notebook, renderers)
+    
+    def render_selected_tab(self, notebook, renderers):
+        renderer = renderers.pop(notebook.select(), None)
+        if renderer is not None:
+            renderer()
+    
+    def render_input_memberships(self, input_frame):
+        Figure, FigureCanvasTkAgg = load_plotting()
         fig_input = Figure(figsize=(10, 8), dpi=100)
         canvas_input = FigureCanvasTkAgg(fig_input, master=input_frame)
         canvas_input.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
+        self.plot_input_memberships(fig_input)
+        canvas_input.draw()
+    
+    def plot_input_memberships(self, fig_input):
         # Girdi fonksiyonlarını çiz
         ax1 = fig_input.add_subplot(321)
         self.plot_membership(self.usage_time, ax1, "Günlük Kullanım Süresi (saat)")
@@ -425,16 +645,17 @@ class TireMaintenanceApp:
         self.plot_membership(self.tire_pressure, ax5, "Lastik Basıncı (PSI)")
         
         fig_input.tight_layout()
-        canvas_input.draw()
-        
-        # Çıktı fonksiyonları
-        output_frame = ttk.Frame(notebook)
-        notebook.add(output_frame, text="Çıktı Fonksiyonları")
-        
+    
+    def render_output_memberships(self, output_frame):
+        Figure, FigureCanvasTkAgg = load_plotting()
         fig_output = Figure(figsize=(10, 4), dpi=100)
         canvas_output = FigureCanvasTkAgg(fig_output, master=output_frame)
         canvas_output.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
+        self.plot_output_memberships(fig_output)
+        canvas_output.draw()
+    
+    def plot_output_memberships(self, fig_output):
         # Çıktı fonksiyonlarını çiz
         ax6 = fig_output.add_subplot(121)
         self.plot_membership(self.maintenance_priority, ax6, "Bakım Önceliği")
@@ -443,7 +664,6 @@ class TireMaintenanceApp:
         self.plot_membership(self.change_probability, ax7, "Değişim İhtimali (%)")
         
         fig_output.tight_layout()
-        canvas_output.draw()
     
     def plot_membership(self, var, ax, title):
         for term in var.terms:
@@ -454,10 +674,256 @@ class TireMaintenanceApp:
         ax.grid(True)
         ax.set_ylim(0, 1.1)
     
+    def show_control_surface(self):
+        if self.get_cached_window('surface') is not None:
+            self.schedule_surface_update()
+            return
+        top = self.create_cached_window('surface', "Kontrol Yüzeyi", "1000x750")
+        
+        controls = ttk.Frame(top, padding=5)
+        controls.pack(fill=tk.X)
+        
+        # Eksenler ve çıktı; diğer girdiler ana penceredeki kaydırıcılardan sabitlenir
+        labels = {name: VARIABLE_LABELS[name] for name in INPUT_NAMES + OUTPUT_NAMES}
+        self.surface_names = {label: name for name, label in labels.items()}
+        self.surface_x_var = tk.StringVar(value=labels['average_speed'])
+        self.surface_y_var = tk.StringVar(value=labels['tire_pressure'])
+        self.surface_output_var = tk.StringVar(value=labels['change_probability'])
+        self.surface_mode_var = tk.StringVar(value='heatmap')
+        
+        for text, variable, names in (("X:", self.surface_x_var, INPUT_NAMES), ("Y:", self.surface_y_var, INPUT_NAMES),
+                                      ("Çıktı:", self.surface_output_var, OUTPUT_NAMES)):
+            ttk.Label(controls, text=text).pack(side=tk.LEFT, padx=(5, 2))
+            combo = ttk.Combobox(controls, textvariable=variable, values=[labels[name] for name in names],
+                                 state='readonly', width=26)
+            combo.pack(side=tk.LEFT)
+            combo.bind('<<ComboboxSelected>>', lambda e: self.schedule_surface_update())
+        
+        ttk.Radiobutton(controls, text="Isı Haritası", variable=self.surface_mode_var, value='heatmap',
+                        command=self.schedule_surface_update).pack(side=tk.LEFT, padx=(10, 2))
+        ttk.Radiobutton(controls, text="3B Yüzey", variable=self.surface_mode_var, value='surface3d',
+                        command=self.schedule_surface_update).pack(side=tk.LEFT, padx=2)
+        self.surface_status = ttk.Label(top, text="", padding=(10, 0))
+        self.surface_status.pack(fill=tk.X)
+        
+        Figure, FigureCanvasTkAgg = load_plotting()
+        self.surface_figure = Figure(figsize=(9, 6.5), dpi=100)
+        self.surface_canvas = FigureCanvasTkAgg(self.surface_figure, master=top)
+        self.surface_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.schedule_surface_update()
+    
+    def schedule_surface_update(self):
+        _, top = self.cached_windows.get('surface', (None, None))
+        if top is None or not top.winfo_exists() or not top.winfo_viewable():
+            return
+        # Kaydırıcı olayları bir kare içinde birleştirilir (canlı hesaplama ile aynı)
+        self.surface_request_id += 1
+        if self.surface_after_id is None:
+            self.surface_after_id = self.root.after(LIVE_UPDATE_INTERVAL_MS, self.update_surface)
+    
+    def get_surface_selection(self):
+        return (self.surface_names[self.surface_x_var.get()], self.surface_names[self.surface_y_var.get()],
+                self.surface_names[self.surface_output_var.get()])
+    
+    def update_surface(self):
+        self.surface_after_id = None
+        x_name, y_name, output = self.get_surface_selection()
+        if x_name == y_name:
+            self.surface_status.config(text="X ve Y eksenleri farklı girdiler olmalıdır.")
+            return
+        fixed = self.get_inputs()
+        coarse, fine = SURFACE_RESOLUTIONS[0], SURFACE_RESOLUTIONS[-1]
+        
+        if self.surface.is_cached(x_name, y_name, fixed, fine):
+            self.surface_pending = None
+            self.draw_surface(self.surface.compute(x_name, y_name, fixed, fine), fixed, fine)
+            return
+        
+        # Kaba ve ince ızgara işçi iş parçacığında; ana iş parçacığı yalnızca çizer
+        self.surface_pending = (self.surface_request_id, x_name, y_name, fixed, (coarse, fine))
+        self.start_surface_refine()
+    
+    def start_surface_refine(self):
+        if self.surface_busy or self.surface_pending is None:
+            return
+        self.surface_busy = True
+        self.surface_executor.submit(self.surface_compute, *self.surface_pending)
+        self.root.after(LIVE_UPDATE_INTERVAL_MS, self.poll_surface_results)
+    
+    def surface_compute(self, request_id, x_name, y_name, fixed, resolutions):
+        # Her çözünürlük hazır oldukça kuyruğa bırakılır; istek eskidiyse ince ızgaraya geçilmez
+        try:
+            for resolution in resolutions:
+                surface = self.surface.compute(x_name, y_name, fixed, resolution)
+                done = resolution == resolutions[-1] or request_id != self.surface_request_id
+                self.surface_results.put((request_id, fixed, resolution, surface, None, done))
+                if done:
+                    break
+        except Exception as e:
+            self.surface_results.put((request_id, fixed, resolutions[-1], None, e, True))
+    
+    def poll_surface_results(self):
+        try:
+            request_id, fixed, resolution, surface, error, done = self.surface_results.get_nowait()
+        except queue.Empty:
+            self.root.after(LIVE_UPDATE_INTERVAL_MS, self.poll_surface_results)
+            return
+        
+        if done:
+            self.surface_busy = False
+        else:
+            self.root.after(LIVE_UPDATE_INTERVAL_MS, self.poll_surface_results)
+        if self.surface_pending is None or request_id != self.surface_pending[0]:
+            # Seçim veya sabit değerler bu arada değişti: en güncel ızgarayı hesapla
+            if done:
+                self.start_surface_refine()
+            return
+        if done:
+            self.surface_pending = None
+        if error is not None:
+            self.surface_status.config(text=f"Hata oluştu: {error}")
+        elif request_id == self.surface_request_id:
+            self.draw_surface(surface, fixed, resolution)
+    
+    def draw_surface(self, surface, fixed, resolution):
+        x_name, y_name, output = self.get_surface_selection()
+        self.plot_control_surface(self.surface_figure, surface, x_name, y_name, output,
+                                  self.surface_mode_var.get(), (fixed[x_name], fixed[y_name]))
+        self.surface_canvas.draw_idle()
+        
+        state = "ince" if resolution == SURFACE_RESOLUTIONS[-1] else "kaba, ince ızgara hesaplanıyor..."
+        others = ", ".join(f"{VARIABLE_LABELS[name]} = {fixed[name]:.1f}" for name in INPUT_NAMES
+                           if name not in (x_name, y_name))
+        self.surface_status.config(text=f"{resolution}x{resolution} ({state}) | Sabit: {others}")
+    
+    def plot_control_surface(self, fig, surface, x_name, y_name, output, mode, point=None):
+        fig.clear()
+        universe = getattr(self, output).universe
+        # Renk aralığı çıktı evrenine sabitlenir; kaba ve ince ızgara arasında renkler kaymaz
+        limits = dict(cmap='viridis', vmin=float(universe[0]), vmax=float(universe[-1]))
+        values = np.ma.masked_invalid(surface[output])
+        
+        if mode == 'surface3d':
+            ax = fig.add_subplot(111, projection='3d')
+            grid_x, grid_y = np.meshgrid(surface['x'], surface['y'])
+            mappable = ax.plot_surface(grid_x, grid_y, values.filled(np.nan), linewidth=0, antialiased=False, **limits)
+            ax.set_zlabel(VARIABLE_LABELS[output])
+            ax.set_zlim(limits['vmin'], limits['vmax'])
+        else:
+            ax = fig.add_subplot(111)
+            mappable = ax.pcolormesh(surface['x'], surface['y'], values, shading='auto', **limits)
+            if point is not None:
+                # Ana penceredeki mevcut çalışma noktası
+                ax.plot([point[0]], [point[1]], 'wo', markeredgecolor='k', markersize=8)
+        
+        ax.set_xlabel(VARIABLE_LABELS[x_name])
+        ax.set_ylabel(VARIABLE_LABELS[y_name])
+        ax.set_title(f"{VARIABLE_LABELS[output]} Kontrol Yüzeyi")
+        fig.colorbar(mappable, ax=ax, label=VARIABLE_LABELS[output], pad=0.12 if mode == 'surface3d' else 0.05)
+    
+    def show_fleet_list(self):
+        if self.get_cached_window('fleet') is not None:
+            self.refresh_fleet_list()
+            return
+        top = self.create_cached_window('fleet', "Filo Listesi", "1200x600")
+        
+        controls = ttk.Frame(top, padding=5)
+        controls.pack(fill=tk.X)
+        self.fleet_query_var = tk.StringVar(value=next(iter(FLEET_QUERIES)))
+        self.fleet_limit_var = tk.IntVar(value=100)
+        self.fleet_tire_var = tk.StringVar()
+        
+        combo = ttk.Combobox(controls, textvariable=self.fleet_query_var, values=list(FLEET_QUERIES),
+                             state='readonly', width=28)
+        combo.pack(side=tk.LEFT, padx=5)
+        combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_fleet_list())
+        ttk.Label(controls, text="En fazla:").pack(side=tk.LEFT, padx=(10, 2))
+        ttk.Spinbox(controls, from_=1, to=100000, textvariable=self.fleet_limit_var, width=7,
+                    command=self.refresh_fleet_list).pack(side=tk.LEFT)
+        ttk.Button(controls, text="Yenile", command=self.refresh_fleet_list).pack(side=tk.LEFT, padx=5)
+        ttk.Button(controls, text="Depo Seç...", command=self.choose_fleet_store).pack(side=tk.LEFT, padx=5)
+        
+        # Ana penceredeki girdiler ve sonuç bu lastik numarasıyla depoya eklenir
+        ttk.Label(controls, text="Lastik No:").pack(side=tk.LEFT, padx=(20, 2))
+        ttk.Entry(controls, textvariable=self.fleet_tire_var, width=14).pack(side=tk.LEFT)
+        ttk.Button(controls, text="Mevcut Sonucu Kaydet", command=self.save_current_result).pack(side=tk.LEFT, padx=5)
+        
+        self.fleet_status = ttk.Label(top, text="", padding=(10, 0))
+        self.fleet_status.pack(fill=tk.X)
+        
+        tree_frame = ttk.Frame(top, padding=5)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        headings = dict(VARIABLE_LABELS, tire_id="Lastik No", priority_level="Öncelik Seviyesi",
+                        probability_level="İhtimal Seviyesi")
+        self.fleet_tree = ttk.Treeview(tree_frame, columns=FLEET_COLUMNS, show='headings')
+        for name in FLEET_COLUMNS:
+            self.fleet_tree.heading(name, text=headings[name])
+            self.fleet_tree.column(name, width=120, anchor=tk.W if name == 'tire_id' else tk.E)
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.fleet_tree.yview)
+        self.fleet_tree.configure(yscrollcommand=scrollbar.set)
+        self.fleet_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.refresh_fleet_list()
+    
+    def get_fleet_store(self):
+        if self.fleet_store is None:
+            self.fleet_store = FleetStore(self.fleet_store_path)
+        return self.fleet_store
+    
+    def fleet_rows(self, query, limit):
+        # Sorgular depodaki sıralı dizinlerden yanıtlanır; tüm kayıtlar taranmaz
+        store = self.get_fleet_store()
+        rows = store.top_priority(limit) if query == 'priority' else store.change_at_least()[:limit]
+        result = []
+        for record in store.records(rows):
+            priority = record.outputs['maintenance_priority']
+            probability = record.outputs['change_probability']
+            result.append((record.tire_id,
+                           '' if np.isnan(priority) else f"{priority:.2f}",
+                           '' if np.isnan(priority) else self.get_priority_level(priority),
+                           '' if np.isnan(probability) else f"{probability:.2f}",
+                           '' if np.isnan(probability) else self.get_probability_level(probability)) +
+                          tuple(f"{record.inputs[name]:.1f}" for name in INPUT_NAMES))
+        return result
+    
+    def refresh_fleet_list(self):
+        try:
+            rows = self.fleet_rows(FLEET_QUERIES[self.fleet_query_var.get()], self.fleet_limit_var.get())
+        except (OSError, ValueError, tk.TclError) as e:
+            self.fleet_status.config(text=f"Hata oluştu: {e}")
+            return
+        self.fleet_tree.delete(*self.fleet_tree.get_children())
+        for values in rows:
+            self.fleet_tree.insert('', tk.END, values=values)
+        self.fleet_status.config(text=f"{len(rows)} lastik gösteriliyor | Depoda {len(self.fleet_store)} lastik "
+                                      f"({self.fleet_store_path})")
+    
+    def choose_fleet_store(self):
+        path = filedialog.askdirectory(title="Filo Deposu Seç", initialdir=self.fleet_store_path)
+        if path:
+            self.fleet_store_path = path
+            self.fleet_store = None
+            self.refresh_fleet_list()
+    
+    def save_current_result(self):
+        tire_id = self.fleet_tire_var.get().strip()
+        if not tire_id:
+            self.fleet_status.config(text="Kaydetmek için bir lastik numarası girin.")
+            return
+        try:
+            inputs = self.get_inputs()
+            outputs = self.compute(inputs)
+            self.get_fleet_store().append([tire_id], {name: [value] for name, value in inputs.items()},
+                                          {name: [outputs.get(name, np.nan)] for name in OUTPUT_NAMES})
+        except (OSError, ValueError) as e:
+            self.fleet_status.config(text=f"Hata oluştu: {e}")
+            return
+        self.refresh_fleet_list()
+    
     def show_rules(self):
-        top = tk.Toplevel(self.root)
-        top.title("Kurallar ve Açıklamaları")
-        top.geometry("1200x900")
+        if self.get_cached_window('rules') is not None:
+            return
+        top = self.create_cached_window('rules', "Kurallar ve Açıklamaları", "1200x900")
         
         main_frame = ttk.Frame(top)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -510,8 +976,20 @@ class TireMaintenanceApp:
         scrollable_frame.update_idletasks()
         canvas.config(scrollregion=canvas.bbox("all"))
     
-if __name__ == "__main__":
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lastik bakım analizi arayüzünü başlatır.")
+    parser.add_argument('--definition', help="JSON/YAML sistem tanımı (varsayılan: tire_system.json)")
+    parser.add_argument('--store', metavar='DIR', help=f"Filo deposu (varsayılan: {STORE_DIR})")
+    parser.add_argument('--lookup', action='store_true', help="Önceden hesaplanmış tabloyu arka planda hazırlayıp kullan")
+    args = parser.parse_args(argv)
+
     check_dependencies()
     root = tk.Tk()
-    app = TireMaintenanceApp(root)
-    root.mainloop()
\ No newline at end of file
+    app = TireMaintenanceApp(root, args.definition, args.store)
+    if args.lookup:
+        app.start_lookup()
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import argparse
+import csv
+import os
+import sys
+import time
+
+import numpy as np
+
+from csv_input import parse_inputs, read_chunks
+from fleet_store import FleetStore
+from fuzzy_engine import INPUT_NAMES
+from fuzzy_system import TireFuzzySystem
+from lookup_table import report_lookup_progress
+from parallel_scoring import ParallelScorer
+
+OUTPUT_COLUMNS = ['maintenance_priority', 'change_probability', 'priority_level', 'probability_level']
+
+
+def score_chunk(system, rows, first_line, scorer=None, store=None):
+    inputs = parse_inputs(rows, first_line)
+    outputs = (scorer or system).compute_batch(inputs)
+    priorities = outputs['maintenance_priority']
+    probabilities = outputs['change_probability']
+    if store is not None:
+        # tire_id sütunu yoksa satır numarası lastik numarası olarak kullanılır
+        store.append([row.get('tire_id') or first_line + i for i, row in enumerate(rows)], inputs, outputs)
+
+    for row, priority, probability in zip(rows, priorities, probabilities):
+        # Hesaplanamayan (hiçbir kuralın ateşlenmediği) çıktılar boş bırakılır
+        if np.isnan(priority):
+            row['maintenance_priority'] = row['priority_level'] = ''
+        else:
+            row['maintenance_priority'] = f"{priority:.2f}"
+            row['priority_level'] = system.get_priority_level(priority)
+        if np.isnan(probability):
+            row['change_probability'] = row['probability_level'] = ''
+        else:
+            row['change_probability'] = f"{probability:.2f}"
+            row['probability_level'] = system.get_probability_level(probability)
+    return rows
+
+
+def score_file(system, input_file, output_file, chunk_size=10000, progress=sys.stderr, scorer=None, store=None):
+    reader = csv.DictReader(input_file)
+    missing = [name for name in INPUT_NAMES if name not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"Eksik sütunlar: {', '.join(missing)}")
+
+    fieldnames = list(reader.fieldnames) + [c for c in OUTPUT_COLUMNS if c not in reader.fieldnames]
+    writer = csv.DictWriter(output_file, fieldnames=fieldnames)
+    writer.writeheader()
+
+    total = 0
+    start = time.perf_counter()
+    for rows in read_chunks(reader, chunk_size):
+        writer.writerows(score_chunk(system, rows, total + 2, scorer, store))
+        total += len(rows)
+        if progress is not None:
+            elapsed = time.perf_counter() - start
+            print(f"{total} satır işlendi ({total / elapsed:.0f} satır/sn)", file=progress, flush=True)
+
+    return total, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Filo lastik verilerini CSV dosyasından toplu olarak hesaplar.")
+    parser.add_argument('input', help="Girdi CSV dosyası ('-' standart girdi)")
+    parser.add_argument('output', help="Çıktı CSV dosyası ('-' standart çıktı)")
+    parser.add_argument('--chunk-size', type=int, default=10000, help="Tek seferde işlenecek satır sayısı")
+    parser.add_argument('--lookup', action='store_true', help="Önceden hesaplanmış tabloyu kullan")
+    parser.add_argument('--definition', help="JSON/YAML sistem tanımı (varsayılan: tire_system.json)")
+    parser.add_argument('--analytic', action='store_true', help="Üçgen çıktı kümeleri için kapalı biçim centroid kullan")
+    parser.add_argument('--workers', type=int, default=1, help="Paralel işçi işlem sayısı (0: tüm çekirdekler)")
+    parser.add_argument('--instrument', metavar='JSON', help="Aşama sürelerini ve kural ateşlemelerini bu dosyaya yaz")
+    parser.add_argument('--profile', metavar='PROF', help="cProfile istatistiklerini bu dosyaya yaz")
+    parser.add_argument('--store', metavar='DIR', help="Sonuçları bu filo deposuna da ekle")
+    parser.add_argument('--quiet', action='store_true', help="İlerleme bilgisini gösterme")
+    args = parser.parse_args(argv)
+    if (args.instrument or args.profile) and (args.workers != 1 or args.lookup):
+        parser.error("--instrument/--profile yalnızca tek işlemli ve tablosuz hesaplamada kullanılabilir")
+
+    defuzzify = 'analytic' if args.analytic else 'sampled'
+    try:
+        system = TireFuzzySystem(defuzzify=defuzzify, definition=args.definition)
+        store = FleetStore(args.store) if args.store else None
+    except (OSError, ValueError) as e:
+        print(f"Hata oluştu: {e}", file=sys.stderr)
+        return 1
+    if args.lookup:
+        system.enable_lookup(progress=None if args.quiet else report_lookup_progress)
+    if args.instrument or args.profile:
+        system.set_instrumentation(True, profile=bool(args.profile))
+    scorer = None
+    if args.workers != 1:
+        workers = args.workers or None
+        scorer = ParallelScorer(workers, chunk_size=max(1, args.chunk_size // (workers or os.cpu_count() or 1)),
+                                use_lookup=args.lookup, defuzzify=defuzzify, definition=args.definition)
+
+    input_file = sys.stdin if args.input == '-' else open(args.input, newline='', encoding='utf-8')
+    output_file = sys.stdout if args.output == '-' else open(args.output, 'w', newline='', encoding='utf-8')
+    try:
+        total, elapsed = score_file(system, input_file, output_file, args.chunk_size,
+                                    progress=None if args.quiet else sys.stderr, scorer=scorer, store=store)
+    except ValueError as e:
+        print(f"Hata oluştu: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if scorer is not None:
+            scorer.close()
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+    if args.instrument:
+        system.instrumentation.save(args.instrument)
+    if args.profile:
+        system.instrumentation.profiler.dump_stats(args.profile)
+    if not args.quiet:
+        print(f"Toplam {total} satır, {elapsed:.1f} sn ({total / max(elapsed, 1e-9):.0f} satır/sn)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
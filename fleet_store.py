@@ -0,0 +1,280 @@
+import heapq
+import json
+import os
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: kilit dosyasının ilk baytı msvcrt ile kilitlenir
+    fcntl = None
+    import msvcrt
+
+import numpy as np
+
+from fuzzy_engine import INPUT_NAMES, OUTPUT_NAMES
+
+STORE_DIR = os.environ.get('TIRE_MAINTENANCE_STORE',
+                           os.path.join(os.path.expanduser('~'), '.local', 'share', 'tire_maintenance', 'fleet'))
+
+# Disk biçimi değiştiğinde artırılır; farklı sürümlü depolar açılmaz
+SCHEMA_VERSION = 1
+TIRE_ID_BYTES = 32
+# Girdi ve çıktı aralıkları küçük olduğundan float32 yeterlidir; zaman damgası float64
+COLUMNS = ([('tire_id', f'S{TIRE_ID_BYTES}'), ('timestamp', '<f8')] +
+           [(name, '<f4') for name in INPUT_NAMES + OUTPUT_NAMES])
+CHANGE_THRESHOLD = 70.0
+
+
+class TireRecord:
+    __slots__ = ('row', 'tire_id', 'timestamp', 'inputs', 'outputs')
+
+    def __init__(self, row, tire_id, timestamp, inputs, outputs):
+        self.row = row
+        self.tire_id = tire_id
+        self.timestamp = timestamp
+        self.inputs = inputs
+        self.outputs = outputs
+
+
+def sort_keys(values, descending):
+    # Hesaplanamayan (NaN) çıktılar her iki sıralamada da ilgisiz uca yerleşir
+    values = np.asarray(values, dtype=np.float64)
+    return np.where(np.isnan(values), np.inf, -values) if descending else np.where(np.isnan(values), -np.inf, values)
+
+
+def first_at_least(run, values, threshold):
+    # Artan sıralı parçada değeri eşiğe eşit veya büyük ilk konum; NaN satırlar başta olduğundan atlanır.
+    # Yalnızca O(log n) satırın değeri okunur
+    low, high = 0, len(run)
+    while low < high:
+        middle = (low + high) // 2
+        value = values[run[middle]]
+        if np.isnan(value) or value < threshold:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+class FleetStore:
+    # Sütun başına bir ham ikili dosya: eklemeler dosya sonuna yazılır, okumalar bellek eşlemelidir.
+    # Aynı lastik yeniden eklendiğinde eski kayıt geçmişte kalır, sorgular yalnızca en güncel kaydı döndürür.
+    # Her dizin, ardışık satır aralıklarını kapsayan sıralı parçalardan oluşur: her ekleme yeni bir parça
+    # yazar, benzer boyuttaki son parçalar birleştirilir (parça sayısı ve satır başına maliyet logaritmik).
+    INDEXES = {'maintenance_priority': True, 'change_probability': False}
+
+    def __init__(self, path=None, readonly=False):
+        self.path = path or STORE_DIR
+        self.readonly = readonly
+        self.meta_path = os.path.join(self.path, 'meta.json')
+        if not os.path.exists(self.meta_path):
+            if readonly:
+                raise FileNotFoundError(self.meta_path)
+            os.makedirs(self.path, exist_ok=True)
+            with self.locked():
+                if not os.path.exists(self.meta_path):
+                    self.write_meta({'count': 0, 'runs': {name: [] for name in self.INDEXES}})
+        self.count = 0
+        self.meta = None
+        self.latest = {}
+        self.current = np.zeros(1024, dtype=bool)
+        self.refresh()
+
+    def column_path(self, name):
+        return os.path.join(self.path, f"{name}.bin")
+
+    def run_path(self, name, start, stop):
+        return os.path.join(self.path, f"index_{name}_{start}_{stop}.bin")
+
+    @contextmanager
+    def locked(self):
+        # Aynı dizine yazan işlemler (arayüz, fleet_cli, telemetry) eklemeleri sırayla yapar
+        with open(os.path.join(self.path, 'lock'), 'a+b') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            else:
+                f.seek(0)
+                while True:
+                    # LK_LOCK yaklaşık 10 sn denedikten sonra OSError yükseltir; kilit alınana kadar beklenir
+                    try:
+                        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        pass
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def read_meta(self):
+        with open(self.meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('schema_version') != SCHEMA_VERSION or meta.get('columns') != dict(COLUMNS):
+            raise ValueError(f"Desteklenmeyen filo deposu biçimi (sürüm {meta.get('schema_version')}): {self.path}")
+        return meta
+
+    def write_meta(self, state):
+        # Kayıt sayısı ve dizin parçaları en son ve atomik olarak yazılır; yarım kalan ekleme yok sayılır
+        meta = {'schema_version': SCHEMA_VERSION, 'count': state['count'], 'columns': dict(COLUMNS),
+                'runs': state['runs']}
+        temp_path = f"{self.meta_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+        os.replace(temp_path, self.meta_path)
+        return meta
+
+    @staticmethod
+    def map(path, dtype, count):
+        if count == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r', shape=(count,))
+
+    def refresh(self):
+        # Diskteki son duruma yetişir; başka işlemlerin eklediği satırlar yalnızca yeni kısımlarıyla işlenir
+        meta = self.read_meta()
+        if meta == self.meta:
+            return
+        count = meta['count']
+        self.columns = {name: self.map(self.column_path(name), dtype, count) for name, dtype in COLUMNS}
+        self.track_latest(self.count, count)
+        self.count = count
+        self.meta = meta
+
+        runs = meta.get('runs') or {}
+        self.runs = {}
+        self.persisted = {}
+        for name in self.INDEXES:
+            try:
+                self.runs[name] = [(start, stop, self.map(self.run_path(name, start, stop), '<i8', stop - start))
+                                   for start, stop in runs.get(name, [])]
+                complete = sum(stop - start for start, stop in runs.get(name, [])) == count
+            except (FileNotFoundError, ValueError):
+                complete = False
+            self.persisted[name] = {(start, stop) for start, stop in runs.get(name, [])} if complete else set()
+            if not complete:
+                # Eski biçimli veya eksik dizin: bellekte tek parça olarak kurulur, ilk eklemede diske yazılır
+                order = np.argsort(sort_keys(self.columns[name], self.INDEXES[name]), kind='stable')
+                self.runs[name] = [(0, count, order)] if count else []
+
+    def track_latest(self, start, stop):
+        # Lastik başına en güncel satır; yalnızca [start, stop) aralığındaki yeni satırlar işlenir
+        if stop > len(self.current):
+            grown = np.zeros(max(stop, 2 * len(self.current)), dtype=bool)
+            grown[:len(self.current)] = self.current
+            self.current = grown
+        # Sözlük, partide aynı lastiğin yalnızca son satırını tutar
+        batch = dict(zip(self.columns['tire_id'][start:stop].tolist(), range(start, stop)))
+        previous = [self.latest[tire_id] for tire_id in batch.keys() & self.latest.keys()]
+        self.current[previous] = False
+        self.current[list(batch.values())] = True
+        self.latest.update(batch)
+
+    def __len__(self):
+        self.refresh()
+        return len(self.latest)
+
+    def append(self, tire_ids, inputs, outputs, timestamp=None):
+        if self.readonly:
+            raise ValueError("Filo deposu salt okunur açıldı.")
+        encoded = [str(tire_id).encode('utf-8') for tire_id in tire_ids]
+        if any(len(tire_id) > TIRE_ID_BYTES for tire_id in encoded):
+            raise ValueError(f"Lastik numaraları en fazla {TIRE_ID_BYTES} bayt olabilir.")
+        size = len(encoded)
+        if size == 0:
+            return
+        batch = {'tire_id': np.array(encoded, dtype=f'S{TIRE_ID_BYTES}'),
+                 'timestamp': np.full(size, time.time() if timestamp is None else timestamp)}
+        for name in INPUT_NAMES:
+            batch[name] = inputs[name]
+        for name in OUTPUT_NAMES:
+            batch[name] = outputs[name]
+
+        with self.locked():
+            # Kilit altında diskteki kayıt sayısı esas alınır; başka bir yazarın eklediği satırlar korunur
+            self.refresh()
+            start = self.count
+            for name, dtype in COLUMNS:
+                values = np.broadcast_to(np.asarray(batch[name], dtype=dtype), (size,))
+                with open(self.column_path(name), 'ab') as f:
+                    # Yarım kalmış bir eklemeden kalan fazla baytlar atılır
+                    f.truncate(start * np.dtype(dtype).itemsize)
+                    values.tofile(f)
+
+            runs = {}
+            obsolete = []
+            for name, descending in self.INDEXES.items():
+                order = np.argsort(sort_keys(batch[name], descending), kind='stable')
+                index = self.runs[name] + [(start, start + size, start + order)]
+                while len(index) > 1 and index[-1][1] - index[-1][0] >= index[-2][1] - index[-2][0]:
+                    (first, _, left), (_, stop, right) = index[-2], index.pop()
+                    index[-1] = (first, stop, self.merge(name, left, right, size, start))
+                for run_start, run_stop, rows in index:
+                    # Yarım kalmış bir eklemeden kalan aynı adlı dosyalar da yeniden yazılır
+                    if (run_start, run_stop) not in self.persisted[name]:
+                        path = self.run_path(name, run_start, run_stop)
+                        temp_path = f"{path}.{os.getpid()}.tmp"
+                        np.asarray(rows, dtype='<i8').tofile(temp_path)
+                        os.replace(temp_path, path)
+                runs[name] = [[run_start, run_stop] for run_start, run_stop, _ in index]
+                obsolete += [self.run_path(name, run_start, run_stop) for run_start, run_stop in
+                             self.persisted[name] if [run_start, run_stop] not in runs[name]]
+
+            self.write_meta({'count': start + size, 'runs': runs})
+            for path in obsolete:
+                try:
+                    os.remove(path)
+                except OSError:
+                    # Windows'ta başka bir işlemin eşlediği dosya silinemez; artık dosya sorgulara katılmaz
+                    pass
+            self.refresh()
+
+    def merge(self, name, left, right, size, start):
+        # İki sıralı parçanın birleşimi; yeni partinin anahtarları sütun dosyasına henüz eşlenmediğinden ayrıca okunur
+        descending = self.INDEXES[name]
+        column = np.memmap(self.column_path(name), dtype='<f4', mode='r', shape=(start + size,))
+        left, right = np.asarray(left), np.asarray(right)
+        left_keys = sort_keys(column[left], descending)
+        right_keys = sort_keys(column[right], descending)
+        positions = np.searchsorted(left_keys, right_keys, side='right')
+        return np.insert(left, positions, right)
+
+    def record(self, row):
+        columns = self.columns
+        return TireRecord(row, columns['tire_id'][row].decode('utf-8'), float(columns['timestamp'][row]),
+                          {name: float(columns[name][row]) for name in INPUT_NAMES},
+                          {name: float(columns[name][row]) for name in OUTPUT_NAMES})
+
+    def records(self, rows):
+        return [self.record(row) for row in rows]
+
+    def top_priority(self, n):
+        # Parçalar sıralı olduğundan baştan birleştirilerek yürünür; yalnızca geçmişte kalmış kayıtlar atlanır
+        self.refresh()
+        rows = []
+        values = self.columns['maintenance_priority']
+        merged = heapq.merge(*[iter(run) for _, _, run in self.runs['maintenance_priority']],
+                             key=lambda row: -values[row] if not np.isnan(values[row]) else np.inf)
+        for row in merged:
+            if len(rows) == n or np.isnan(values[row]):
+                break
+            if self.current[row]:
+                rows.append(int(row))
+        return rows
+
+    def change_at_least(self, threshold=CHANGE_THRESHOLD):
+        # Her artan sıralı parçada eşiğin ilk konumu ikili aramayla bulunur, sonrası doğrudan dilimlenir
+        self.refresh()
+        values = self.columns['change_probability']
+        selected = []
+        for _, _, run in self.runs['change_probability']:
+            rows = np.asarray(run[first_at_least(run, values, threshold):])
+            selected.append(rows[self.current[rows]])
+        rows = np.concatenate(selected) if selected else np.empty(0, dtype=np.int64)
+        order = np.argsort(-values[rows], kind='stable')
+        return [int(row) for row in rows[order]]
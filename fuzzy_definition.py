@@ -0,0 +1,289 @@
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+
+import fuzzy_engine
+import fuzzy_model
+from fuzzy_engine import INPUT_NAMES, OUTPUT_NAMES, VectorizedEngine
+from fuzzy_model import Antecedent, Consequent, ControlSystem, Rule, Term
+from lookup_table import CACHE_DIR
+
+DEFAULT_DEFINITION = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tire_system.json')
+
+# Kural ifadesi belirteçleri: değişken[terim], &, |, ~ ve parantezler
+TOKEN_PATTERN = re.compile(r"\s*(?:(\w+)\[(\w+)\]|([&|~()]))")
+
+
+def definition_stamp(path):
+    # Dosya değişimini okumadan anlamak için (değişiklik zamanı, boyut)
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_definition(path):
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    if path.lower().endswith(('.yaml', '.yml')):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("YAML tanımları için PyYAML gereklidir: pip install pyyaml")
+        definition = yaml.safe_load(text)
+    else:
+        definition = json.loads(text)
+    validate_definition(definition)
+    return definition
+
+
+def definition_hash(definition):
+    # Biçimlendirmeden bağımsız içerik özeti (anahtar sırası ve boşluklar önemsiz)
+    return hashlib.sha256(json.dumps(definition, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def compiler_hash():
+    # Derleyici veya motor kodu değişince diskteki derlenmiş sistemler geçersiz olur
+    digest = hashlib.sha256()
+    for module in (fuzzy_model, fuzzy_engine):
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    with open(__file__, 'rb') as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and np.isfinite(value)
+
+
+def validate_variables(section, names, definition):
+    variables = definition.get(section)
+    if not isinstance(variables, dict) or set(variables) != set(names):
+        raise ValueError(f"'{section}' tam olarak şu değişkenleri tanımlamalıdır: {', '.join(names)}")
+    for name, spec in variables.items():
+        universe = spec.get('universe') if isinstance(spec, dict) else None
+        if not isinstance(universe, list) or len(universe) != 3 or not all(map(is_number, universe)):
+            raise ValueError(f"'{name}' için evren [başlangıç, bitiş, adım] biçiminde üç sayı olmalıdır.")
+        start, stop, step = universe
+        # Adım aralıktan büyükse evren tek noktaya iner
+        if step <= 0 or stop <= start or step > stop - start:
+            raise ValueError(f"'{name}' evreni geçersiz: {universe}")
+        terms = spec.get('terms')
+        if not isinstance(terms, dict) or not terms:
+            raise ValueError(f"'{name}' için en az bir terim tanımlanmalıdır.")
+        for term, abc in terms.items():
+            if not isinstance(term, str) or not re.fullmatch(r"\w+", term):
+                raise ValueError(f"'{name}' için geçersiz terim adı: {term!r}")
+            if (not isinstance(abc, list) or len(abc) != 3 or not all(map(is_number, abc))
+                    or not abc[0] <= abc[1] <= abc[2]):
+                raise ValueError(f"'{name}[{term}]' trimf parametreleri a <= b <= c olan üç sayı olmalıdır.")
+            # Girdi terimlerinin omuzları evren dışına taşabilir; çıktı kümeleri centroid için evren içinde olmalıdır
+            if section == 'outputs' and (abc[0] < start or abc[2] > stop):
+                raise ValueError(f"'{name}[{term}]' evrenin dışına taşıyor: {abc} ({start} - {stop})")
+
+
+def validate_definition(definition):
+    if not isinstance(definition, dict):
+        raise ValueError("Tanım bir nesne olmalıdır.")
+    # Arayüz, CLI ve sunucu bu girdi ve çıktıları kullanır; yalnızca evrenler, terimler ve kurallar değişebilir
+    validate_variables('inputs', INPUT_NAMES, definition)
+    validate_variables('outputs', OUTPUT_NAMES, definition)
+
+    rules = definition.get('rules')
+    if not isinstance(rules, list) or not rules:
+        raise ValueError("En az bir kural tanımlanmalıdır.")
+    for i, rule in enumerate(rules, 1):
+        if not isinstance(rule, dict) or 'if' not in rule or 'then' not in rule:
+            raise ValueError(f"Kural {i}: 'if' ve 'then' alanları gereklidir.")
+        if not isinstance(rule['if'], str) or not rule['if'].strip():
+            raise ValueError(f"Kural {i}: 'if' bir ifade metni olmalıdır.")
+        then = rule['then']
+        if not (isinstance(then, str) or isinstance(then, list) and then and all(isinstance(e, str) for e in then)):
+            raise ValueError(f"Kural {i}: 'then' bir sonuç veya sonuç listesi olmalıdır.")
+        if not isinstance(rule.get('desc', ''), str):
+            raise ValueError(f"Kural {i}: 'desc' metin olmalıdır.")
+        weight = rule.get('weight', 1.0)
+        if not is_number(weight) or weight < 0:
+            raise ValueError(f"Kural {i}: ağırlık negatif olmayan bir sayı olmalıdır.")
+
+    defaults = definition.get('defaults', {})
+    if not isinstance(defaults, dict) or not set(defaults) <= set(INPUT_NAMES):
+        raise ValueError(f"'defaults' yalnızca şu girdileri içerebilir: {', '.join(INPUT_NAMES)}")
+    for name, value in defaults.items():
+        start, stop, _ = definition['inputs'][name]['universe']
+        if not is_number(value) or not start <= value <= stop:
+            raise ValueError(f"'defaults' içinde '{name}' {start} - {stop} aralığında bir sayı olmalıdır.")
+
+
+def make_universe(spec):
+    # [başlangıç, bitiş, adım]; bitiş dahil
+    start, stop, step = spec
+    return np.arange(start, stop + step / 2, step)
+
+
+def lookup_term(variables, name, term, expression):
+    if name not in variables or term not in variables[name].terms:
+        raise ValueError(f"'{expression}' kuralında bilinmeyen terim: {name}[{term}]")
+    return variables[name][term]
+
+
+def parse_antecedent(expression, variables):
+    # Python ile aynı öncelik ve birleşme: ~ > & > |, soldan birleşmeli
+    tokens = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = TOKEN_PATTERN.match(expression, position)
+        if match is None:
+            raise ValueError(f"'{expression}' kuralı çözümlenemedi (konum {position}).")
+        name, term, operator = match.groups()
+        if operator is None and name not in INPUT_NAMES:
+            raise ValueError(f"'{expression}' kuralının öncülü yalnızca girdileri kullanabilir: {name}")
+        tokens.append(operator or lookup_term(variables, name, term, expression))
+        position = match.end()
+    tokens.append(None)
+    index = 0
+
+    def peek():
+        return tokens[index]
+
+    def advance():
+        nonlocal index
+        index += 1
+        return tokens[index - 1]
+
+    def parse_or():
+        node = parse_and()
+        while peek() == '|':
+            advance()
+            node = node | parse_and()
+        return node
+
+    def parse_and():
+        node = parse_not()
+        while peek() == '&':
+            advance()
+            node = node & parse_not()
+        return node
+
+    def parse_not():
+        token = advance()
+        if token == '~':
+            return ~parse_not()
+        if token == '(':
+            node = parse_or()
+            if advance() != ')':
+                raise ValueError(f"'{expression}' kuralında kapanmamış parantez.")
+            return node
+        if token is None:
+            raise ValueError(f"'{expression}' kuralı eksik bitiyor.")
+        if isinstance(token, str):
+            raise ValueError(f"'{expression}' kuralında beklenmeyen belirteç: {token!r}")
+        return token
+
+    node = parse_or()
+    if peek() is not None:
+        raise ValueError(f"'{expression}' kuralında fazla belirteç: {peek()!r}")
+    return node
+
+
+def parse_consequents(then, variables):
+    consequents = []
+    for expression in then if isinstance(then, list) else [then]:
+        match = re.fullmatch(r"\s*(\w+)\[(\w+)\]\s*", expression)
+        if match is None or match.group(1) not in OUTPUT_NAMES:
+            raise ValueError(f"Geçersiz sonuç: '{expression}' (çıktı[terim] biçiminde olmalıdır)")
+        consequents.append(lookup_term(variables, match.group(1), match.group(2), expression))
+    return consequents
+
+
+def membership_layout(definition):
+    # Önbellek dizisindeki sıra: girdiler, çıktılar, terimler tanımdaki sırayla; her terim evren uzunluğunda
+    return [(name, term, len(make_universe(spec['universe'])))
+            for section in ('inputs', 'outputs') for name, spec in definition[section].items()
+            for term in spec['terms']]
+
+
+def build_definition(definition, defuzzify='sampled', memberships=None):
+    # memberships: önbellekten okunmuş, membership_layout sırasıyla art arda eklenmiş üyelik dizileri;
+    # yoksa trimf ile hesaplanır
+    offsets = {}
+    if memberships is not None:
+        position = 0
+        for name, term, size in membership_layout(definition):
+            offsets[(name, term)] = (position, position + size)
+            position += size
+    variables = {}
+    for section, kind in (('inputs', Antecedent), ('outputs', Consequent)):
+        for name, spec in definition[section].items():
+            variables[name] = kind(make_universe(spec['universe']), name)
+            for term, abc in spec['terms'].items():
+                if memberships is None:
+                    variables[name].set_trimf(term, abc)
+                else:
+                    start, stop = offsets[(name, term)]
+                    variables[name].terms[term] = Term(term, memberships[start:stop], variables[name],
+                                                       abc=tuple(float(v) for v in abc))
+
+    rules = []
+    for rule in definition['rules']:
+        rules.append({
+            'rule': Rule(parse_antecedent(rule['if'], variables), parse_consequents(rule['then'], variables)),
+            'desc': rule.get('desc', ''),
+            'weight': float(rule.get('weight', 1.0))
+        })
+
+    control_system = ControlSystem([rule['rule'] for rule in rules])
+    rule_weights = [rule['weight'] for rule in rules]
+    defaults = definition.get('defaults', {})
+    return {
+        'variables': variables,
+        'rules': rules,
+        'control_system': control_system,
+        'rule_weights': rule_weights,
+        # Derlenmiş kural tabloları ve üyelik dizileri motorla birlikte saklanır
+        'engine': VectorizedEngine(control_system, rule_weights=rule_weights, defuzzify=defuzzify),
+        'default_values': {name: defaults.get(name, float(variables[name].universe[0])) for name in INPUT_NAMES}
+    }
+
+
+def load_compiled(path=None, defuzzify='sampled', cache_dir=None):
+    # Üyelik dizileri diskte tanımın içerik özetiyle saklanır; tanım değişmediyse yeniden hesaplanmaz.
+    # Önbellek tek bir sayısal dizidir (allow_pickle=False): dizine yazabilen biri kod çalıştıramaz.
+    # Model nesneleri ve motor tabloları bu dizilerden birkaç milisaniyede kurulur.
+    path = path or DEFAULT_DEFINITION
+    definition = read_definition(path)
+    key = hashlib.sha256(f"{definition_hash(definition)}:{compiler_hash()}".encode()).hexdigest()
+    cache_path = os.path.join(cache_dir or CACHE_DIR, f"system_{key[:16]}.npy")
+
+    memberships = None
+    try:
+        memberships = np.load(cache_path, allow_pickle=False)
+        expected = sum(size for *_, size in membership_layout(definition))
+        if memberships.dtype != np.float64 or memberships.shape != (expected,):
+            memberships = None
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError):
+        # Bozuk veya eski biçimli önbellek dosyası: yeniden hesaplanır
+        pass
+
+    compiled = build_definition(definition, defuzzify, memberships)
+    compiled['key'] = key
+    compiled['hash'] = definition_hash(definition)
+    if memberships is None:
+        tables = np.concatenate([compiled['variables'][name].terms[term].mf
+                                 for name, term, _ in membership_layout(definition)])
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            # Yalnızca sahibi okuyup yazabilir
+            with os.fdopen(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+                np.save(f, tables)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            # Önbellek yazılamıyorsa (salt okunur dizin vb.) derlenmiş sistem yine de kullanılır
+            pass
+    return compiled
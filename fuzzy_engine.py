@@ -0,0 +1,355 @@
+import hashlib
+import time
+
+import numpy as np
+
+INPUT_NAMES = ('usage_time', 'road_type', 'temperature', 'average_speed', 'tire_pressure')
+OUTPUT_NAMES = ('maintenance_priority', 'change_probability')
+
+# skfuzzy'nin skaler ControlSystemSimulation sonucuna göre izin verilen en büyük mutlak fark
+TOLERANCE = 1e-9
+
+# 'sampled': skfuzzy gibi evren örnekleri üzerinden; 'analytic': üçgen çıktı kümeleri için kapalı biçim
+DEFUZZIFY_MODES = ('sampled', 'analytic')
+
+
+def interp_rows(x, xmf, points):
+    # np.interp ile aynı doğrusal interpolasyon; sabit evren üzerinde çok boyutlu sorgu noktaları için
+    idx = np.clip(np.searchsorted(x, points, side='right') - 1, 0, len(x) - 2)
+    x0 = x[idx]
+    frac = (points - x0) / (x[idx + 1] - x0)
+    return xmf[idx] + frac * (xmf[idx + 1] - xmf[idx])
+
+
+def aggregate_rows(universe, mfs, cuts):
+    # skfuzzy'nin CrispValueCalculator.find_memberships adımının satır bazlı karşılığı.
+    # universe: (U,), mfs: (T, U), cuts: (n, T)
+    n = cuts.shape[0]
+    seg_x = universe[:-1]
+    dx = np.diff(universe)
+
+    # Evreni, her terimin kesim seviyesini kestiği noktalarla genişlet
+    points = [np.broadcast_to(universe, (n, len(universe)))]
+    for t, mf in enumerate(mfs):
+        cut = cuts[:, t:t + 1]
+        above = np.where(cut == 0, mf > cut, mf >= cut)
+        crossing = above[:, 1:] != above[:, :-1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            xs = seg_x + (cut - mf[:-1]) * dx / np.diff(mf)
+        # Kesişme olmayan segmentlerde mevcut noktayı tekrarla (sıfır genişlikli segment)
+        points.append(np.where(crossing, xs, seg_x))
+    points = np.sort(np.concatenate(points, axis=1), axis=1)
+
+    # Kırpılmış üyelik fonksiyonlarının maksimumu
+    aggregated = np.zeros_like(points)
+    for t, mf in enumerate(mfs):
+        np.maximum(aggregated, np.minimum(cuts[:, t:t + 1], interp_rows(universe, mf, points)), out=aggregated)
+    return points, aggregated
+
+
+def centroid_rows(points, aggregated):
+    # skfuzzy centroid: parçalı doğrusal fonksiyonun kesin alan ve momenti
+    x1, x2 = points[:, :-1], points[:, 1:]
+    y1, y2 = aggregated[:, :-1], aggregated[:, 1:]
+    width = x2 - x1
+    area = (0.5 * width * (y1 + y2)).sum(axis=1)
+    moment = (width * (y1 * (2 * x1 + x2) + y2 * (x1 + 2 * x2)) / 6.0).sum(axis=1)
+
+    result = np.full(len(points), np.nan)
+    valid = area > 0
+    result[valid] = moment[valid] / area[valid]
+    return result
+
+
+# Gauss-Legendre iki nokta düğümleri (segment orta noktasına göre, yarım genişlik biriminde);
+# doğrusal üyelik x doğrusal x çarpımını tam integre eder
+GAUSS_NODES = np.array([-1.0, 1.0]) / np.sqrt(3.0)
+
+
+def triangle_rows(x, a, b, c):
+    # trimf'in sürekli karşılığı; x herhangi bir şekilde olabilir
+    y = np.zeros_like(x)
+    if a != b:
+        y = np.where((a < x) & (x < b), (x - a) / (b - a), y)
+    if b != c:
+        y = np.where((b < x) & (x < c), (c - x) / (c - b), y)
+    return np.where(x == b, 1.0, y)
+
+
+def triangle_edges(abcs):
+    # Üçgen kenarlarının doğruları: [(eğim, kesişim)]; dikey kenarlar (a == b veya b == c) atlanır
+    edges = []
+    for a, b, c in abcs:
+        if a != b:
+            edges.append((1.0 / (b - a), -a / (b - a)))
+        if b != c:
+            edges.append((-1.0 / (c - b), c / (c - b)))
+    return edges
+
+
+def analytic_centroid_rows(universe, abcs, cuts):
+    # Kırpılmış üçgenlerin maksimumu parçalı doğrusaldır. Kırılma noktaları: köşeler, kenarların kesim
+    # seviyeleriyle ve birbirleriyle kesişimleri. Aralarında fonksiyon doğrusal olduğundan alan ve moment
+    # her segmentte iki noktalı Gauss kuralıyla tamdır; maliyet evren çözünürlüğünden bağımsızdır.
+    # universe: (U,), abcs: [(a, b, c)] * T, cuts: (n, T)
+    n = cuts.shape[0]
+    lo, hi = float(universe[0]), float(universe[-1])
+    edges = triangle_edges(abcs)
+
+    static = [lo, hi] + [v for abc in abcs for v in abc]
+    for i, (s1, i1) in enumerate(edges):
+        for s2, i2 in edges[i + 1:]:
+            if s1 != s2:
+                static.append((i2 - i1) / (s1 - s2))
+    points = [np.broadcast_to(np.array(static), (n, len(static)))]
+    for slope, intercept in edges:
+        points.append((cuts - intercept) / slope)
+    points = np.sort(np.clip(np.concatenate(points, axis=1), lo, hi), axis=1)
+
+    x1, x2 = points[:, :-1], points[:, 1:]
+    half = 0.5 * (x2 - x1)
+    nodes = (0.5 * (x1 + x2))[:, :, None] + half[:, :, None] * GAUSS_NODES
+    aggregated = np.zeros_like(nodes)
+    for t, (a, b, c) in enumerate(abcs):
+        np.maximum(aggregated, np.minimum(cuts[:, t, None, None], triangle_rows(nodes, a, b, c)), out=aggregated)
+
+    area = (half * aggregated.sum(axis=2)).sum(axis=1)
+    moment = (half * (nodes * aggregated).sum(axis=2)).sum(axis=1)
+    result = np.full(n, np.nan)
+    valid = area > 0
+    result[valid] = moment[valid] / area[valid]
+    return result
+
+
+class VectorizedEngine:
+    def __init__(self, control_system, rule_weights=None, chunk_size=4096, defuzzify='sampled'):
+        if defuzzify not in DEFUZZIFY_MODES:
+            raise ValueError(f"Bilinmeyen durulaştırma yöntemi: {defuzzify}")
+        self.chunk_size = chunk_size
+        self.defuzzify = defuzzify
+        self.instrumentation = None
+
+        # Girdiler: evren ve terim üyelik fonksiyonları
+        self.antecedents = {}
+        for var in control_system.antecedents:
+            self.antecedents[var.label] = (
+                np.asarray(var.universe, dtype=np.float64),
+                {label: np.asarray(term.mf, dtype=np.float64) for label, term in var.terms.items()}
+            )
+
+        # Kural ağırlıkları control_system.rules sırasıyla verilir ve ateşleme derecesiyle çarpılır
+        rules = list(control_system.rules)
+        if rule_weights is None:
+            rule_weights = [1.0] * len(rules)
+        if len(rule_weights) != len(rules):
+            raise ValueError(f"{len(rules)} kural için {len(rule_weights)} ağırlık verildi.")
+
+        # Kurallar: (öncül ağacı, and/or fonksiyonları, [(çıktı, terim, ağırlık)], kural ağırlığı)
+        self.rules = []
+        used_terms = {}
+        for rule, rule_weight in zip(rules, rule_weights):
+            consequents = [(c.term.parent.label, c.term.label, c.weight) for c in rule.consequent]
+            self.rules.append((self.compile_antecedent(rule.antecedent), rule.and_func, rule.or_func,
+                               consequents, float(rule_weight)))
+            for output, term, _ in consequents:
+                used_terms.setdefault(output, [])
+                if term not in used_terms[output]:
+                    used_terms[output].append(term)
+
+        # Çıktılar: yalnızca kurallarda kullanılan terimler durulaştırmaya katılır (skfuzzy ile aynı)
+        self.consequents = {}
+        self.consequent_triangles = {}
+        for var in control_system.consequents:
+            terms = used_terms.get(var.label, [])
+            self.consequents[var.label] = (
+                np.asarray(var.universe, dtype=np.float64),
+                terms,
+                np.array([var.terms[term].mf for term in terms], dtype=np.float64)
+            )
+            if defuzzify == 'analytic':
+                abcs = [getattr(var.terms[term], 'abc', None) for term in terms]
+                if None in abcs:
+                    raise ValueError(f"Analitik centroid için '{var.label}' terimleri trimf parametreleriyle tanımlanmalıdır.")
+                self.consequent_triangles[var.label] = abcs
+
+        self.compile_rules()
+
+    def fingerprint(self, extra=()):
+        # Kural tabanı ve üyelik fonksiyonlarının içerik özeti; önbellek anahtarı olarak kullanılır
+        digest = hashlib.sha256()
+        for label, (universe, terms) in sorted(self.antecedents.items()):
+            digest.update(label.encode())
+            digest.update(universe.tobytes())
+            for term, mf in sorted(terms.items()):
+                digest.update(term.encode())
+                digest.update(mf.tobytes())
+        for rule in sorted(repr((node, and_func.__name__, or_func.__name__, consequents, weight))
+                           for node, and_func, or_func, consequents, weight in self.rules):
+            digest.update(rule.encode())
+        for label, (universe, terms, mfs) in sorted(self.consequents.items()):
+            digest.update(label.encode())
+            digest.update(universe.tobytes())
+            digest.update(repr(terms).encode())
+            digest.update(mfs.tobytes())
+        digest.update(repr(self.consequent_triangles).encode())
+        for item in extra:
+            digest.update(repr(item).encode())
+        return digest.hexdigest()
+
+    def compile_antecedent(self, antecedent):
+        # fuzzy_model ve skfuzzy.control nesneleri aynı arayüzü paylaşır
+        kind = getattr(antecedent, 'kind', None)
+        if kind is None:
+            return ('term', antecedent.parent.label, antecedent.label)
+        if kind == 'not':
+            return ('not', self.compile_antecedent(antecedent.term1))
+        if kind in ('and', 'or'):
+            return (kind, self.compile_antecedent(antecedent.term1),
+                    self.compile_antecedent(antecedent.term2))
+        raise ValueError(f"Desteklenmeyen öncül: {antecedent!r}")
+
+    def to_clauses(self, node, negate=False):
+        # Öncülü VEYA'ların VE'si biçimine (DNF) açar; min/max dağılma ve De Morgan kuralları tam geçerlidir.
+        # Her değişmez (değilleme, değişken, terim) üçlüsüdür.
+        kind = node[0]
+        if kind == 'term':
+            return [[(negate, node[1], node[2])]]
+        if kind == 'not':
+            return self.to_clauses(node[1], not negate)
+        left = self.to_clauses(node[1], negate)
+        right = self.to_clauses(node[2], negate)
+        if (kind == 'and') != negate:
+            return [a + b for a in left for b in right]
+        return left + right
+
+    def compile_rules(self):
+        # Üyelik matrisi sütunları: [terimler, 1 - terimler, bir, sıfır]
+        self.term_columns = {}
+        for label, (_, terms) in self.antecedents.items():
+            for term in terms:
+                self.term_columns[(label, term)] = len(self.term_columns)
+        term_count = len(self.term_columns)
+        self.membership_columns = 2 * term_count + 2
+        one, zero = 2 * term_count, 2 * term_count + 1
+
+        # min/max dışındaki and/or fonksiyonları kullanan kurallar öncül ağacı üzerinden değerlendirilir
+        clauses = []
+        self.tree_rules = []
+        for r, (node, and_func, or_func, _, _) in enumerate(self.rules):
+            if and_func is np.fmin and or_func is np.fmax:
+                clauses.append(self.to_clauses(node))
+            else:
+                clauses.append([])
+                self.tree_rules.append(r)
+
+        # Değişmez indeks tablosu (kural, yan tümce, değişmez): boş değişmezler bir (min için etkisiz),
+        # boş yan tümceler sıfır (max için etkisiz) sütununa işaret eder
+        clause_count = max([len(c) for c in clauses] + [1])
+        literal_count = max([len(clause) for c in clauses for clause in c] + [1])
+        self.literal_index = np.full((len(self.rules), clause_count, literal_count), one, dtype=np.intp)
+        for r, rule_clauses in enumerate(clauses):
+            self.literal_index[r, len(rule_clauses):, :] = zero
+            for c, clause in enumerate(rule_clauses):
+                for i, (negated, label, term) in enumerate(clause):
+                    self.literal_index[r, c, i] = self.term_columns[(label, term)] + (term_count if negated else 0)
+
+        # Sonuç tabloları (kural, terim): kural ağırlığı x sonuç ağırlığı; kuralın hedeflemediği terimler 0
+        self.consequent_weights = {}
+        for label, (_, terms, _) in self.consequents.items():
+            self.consequent_weights[label] = np.zeros((len(self.rules), len(terms)))
+        for r, (_, _, _, consequents, rule_weight) in enumerate(self.rules):
+            for output, term, weight in consequents:
+                column = self.consequents[output][1].index(term)
+                table = self.consequent_weights[output]
+                table[r, column] = max(table[r, column], rule_weight * weight)
+
+    def evaluate_antecedent(self, node, memberships, and_func, or_func):
+        kind = node[0]
+        if kind == 'term':
+            return memberships[:, self.term_columns[(node[1], node[2])]]
+        if kind == 'not':
+            return 1.0 - self.evaluate_antecedent(node[1], memberships, and_func, or_func)
+        left = self.evaluate_antecedent(node[1], memberships, and_func, or_func)
+        right = self.evaluate_antecedent(node[2], memberships, and_func, or_func)
+        return and_func(left, right) if kind == 'and' else or_func(left, right)
+
+    def fuzzify(self, inputs):
+        n = len(next(iter(inputs.values())))
+        term_count = len(self.term_columns)
+        memberships = np.empty((n, self.membership_columns))
+        for label, (universe, terms) in self.antecedents.items():
+            value = np.clip(inputs[label], universe[0], universe[-1])
+            for term, mf in terms.items():
+                memberships[:, self.term_columns[(label, term)]] = np.interp(value, universe, mf)
+        np.subtract(1.0, memberships[:, :term_count], out=memberships[:, term_count:2 * term_count])
+        memberships[:, -2] = 1.0
+        memberships[:, -1] = 0.0
+        return memberships
+
+    def evaluate_rules(self, memberships):
+        # (n, kural, yan tümce, değişmez) -> yan tümce içinde min, yan tümceler arasında max
+        firings = memberships[:, self.literal_index].min(axis=3).max(axis=2)
+        for r in self.tree_rules:
+            node, and_func, or_func, _, _ = self.rules[r]
+            firings[:, r] = self.evaluate_antecedent(node, memberships, and_func, or_func)
+        return firings
+
+    def compute_chunk(self, inputs):
+        n = len(next(iter(inputs.values())))
+        start = time.perf_counter()
+        memberships = self.fuzzify(inputs)
+        fuzzified = time.perf_counter()
+
+        firings = self.evaluate_rules(memberships)
+        evaluated = time.perf_counter()
+
+        # Kural aktivasyonları (ateşleme x ağırlık), terim bazında max ile biriktirilir
+        cuts = {label: (firings[:, :, None] * weights).max(axis=1, initial=0.0)
+                for label, weights in self.consequent_weights.items()}
+        if self.defuzzify == 'analytic':
+            # Örnekleme yok: birleştirme ve centroid tek adımda, kırılma noktaları üzerinden
+            accumulated = time.perf_counter()
+            outputs = {label: analytic_centroid_rows(self.consequents[label][0], abcs, cuts[label])
+                       for label, abcs in self.consequent_triangles.items()}
+        else:
+            aggregated = {label: aggregate_rows(universe, mfs, cuts[label])
+                          for label, (universe, _, mfs) in self.consequents.items()}
+            accumulated = time.perf_counter()
+            outputs = {label: centroid_rows(*aggregated[label]) for label in self.consequents}
+        done = time.perf_counter()
+
+        instrumentation = self.instrumentation
+        if instrumentation is not None and instrumentation.enabled:
+            instrumentation.record(n, {
+                'fuzzification': fuzzified - start,
+                'rule_evaluation': evaluated - fuzzified,
+                'aggregation': accumulated - evaluated,
+                'defuzzification': done - accumulated
+            }, firings.T)
+        return outputs
+
+    def compute(self, inputs):
+        missing = [name for name in self.antecedents if name not in inputs]
+        if missing:
+            raise ValueError(f"Eksik girdiler: {', '.join(missing)}")
+
+        arrays = np.broadcast_arrays(*[np.asarray(inputs[name], dtype=np.float64) for name in self.antecedents])
+        shape = arrays[0].shape
+        flat = {name: array.ravel() for name, array in zip(self.antecedents, arrays)}
+        total = arrays[0].size
+
+        profiler = self.instrumentation.profiler if self.instrumentation is not None else None
+        if profiler is not None:
+            profiler.enable()
+        try:
+            outputs = {label: np.empty(total) for label in self.consequents}
+            for start in range(0, total, self.chunk_size):
+                stop = min(start + self.chunk_size, total)
+                chunk = self.compute_chunk({name: values[start:stop] for name, values in flat.items()})
+                for label, values in chunk.items():
+                    outputs[label][start:stop] = values
+        finally:
+            if profiler is not None:
+                profiler.disable()
+
+        return {label: values.reshape(shape) for label, values in outputs.items()}
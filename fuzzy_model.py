@@ -0,0 +1,200 @@
+import numpy as np
+
+
+def trimf(x, abc):
+    # skfuzzy.membership.trimf ile aynı üçgen üyelik fonksiyonu (skfuzzy/scipy yüklenmeden)
+    a, b, c = np.r_[abc]
+    if not a <= b <= c:
+        raise ValueError("trimf parametreleri a <= b <= c olmalıdır.")
+    x = np.asarray(x)
+    y = np.zeros(len(x))
+
+    # Sol kenar
+    if a != b:
+        idx = np.nonzero(np.logical_and(a < x, x < b))[0]
+        y[idx] = (x[idx] - a) / float(b - a)
+
+    # Sağ kenar
+    if b != c:
+        idx = np.nonzero(np.logical_and(b < x, x < c))[0]
+        y[idx] = (c - x[idx]) / float(c - b)
+
+    y[np.nonzero(x == b)] = 1
+    return y
+
+
+class TermPrimitive:
+    def __and__(self, other):
+        return TermAggregate(self, other, 'and')
+
+    def __or__(self, other):
+        return TermAggregate(self, other, 'or')
+
+    def __invert__(self):
+        return TermAggregate(self, None, 'not')
+
+
+class Term(TermPrimitive):
+    def __init__(self, label, mf, parent, abc=None):
+        self.label = label
+        self.mf = mf
+        self.parent = parent
+        # trimf parametreleri; analitik centroid yalnızca bunlar biliniyorsa kullanılabilir
+        self.abc = abc
+
+    @property
+    def full_label(self):
+        return f"{self.parent.label}[{self.label}]"
+
+    def __repr__(self):
+        return self.full_label
+
+    def __mod__(self, weight):
+        return WeightedTerm(self, float(weight))
+
+
+class TermAggregate(TermPrimitive):
+    def __init__(self, term1, term2, kind):
+        self.term1 = term1
+        self.term2 = term2
+        self.kind = kind
+
+    def __repr__(self):
+        def term_to_str(term):
+            return term.full_label if isinstance(term, Term) else f"({term!s})"
+
+        if self.kind == 'not':
+            return f"NOT-{term_to_str(self.term1)}"
+        return f"{term_to_str(self.term1)} {self.kind.upper()} {term_to_str(self.term2)}"
+
+
+class WeightedTerm:
+    def __init__(self, term, weight=1.0):
+        self.term = term
+        self.weight = weight
+
+    def __repr__(self):
+        if self.weight == 1.0:
+            return self.term.full_label
+        return f"{self.term.full_label}@{self.weight:0.2f}%"
+
+
+class FuzzyVariable:
+    def __init__(self, universe, label):
+        self.universe = np.asarray(universe)
+        self.label = label
+        self.terms = {}
+
+    def __getitem__(self, key):
+        return self.terms[key]
+
+    def __setitem__(self, key, mf):
+        self.terms[key] = Term(key, np.asarray(mf, dtype=np.float64), self)
+
+    def set_trimf(self, key, abc):
+        # var[key] = trimf(var.universe, abc) ile aynı, üçgen parametreleri de saklanır
+        self.terms[key] = Term(key, trimf(self.universe, abc).astype(np.float64), self,
+                               abc=tuple(float(v) for v in abc))
+
+    def __repr__(self):
+        return f"{type(self).__name__}: {self.label}"
+
+
+class Antecedent(FuzzyVariable):
+    pass
+
+
+class Consequent(FuzzyVariable):
+    pass
+
+
+class Rule:
+    def __init__(self, antecedent, consequent, and_func=np.fmin, or_func=np.fmax):
+        self.antecedent = antecedent
+        consequents = consequent if isinstance(consequent, (list, tuple)) else [consequent]
+        self.consequent = [c if isinstance(c, WeightedTerm) else WeightedTerm(c) for c in consequents]
+        self.and_func = and_func
+        self.or_func = or_func
+
+    def antecedent_terms(self):
+        def find_terms(node):
+            if isinstance(node, Term):
+                return [node]
+            terms = find_terms(node.term1)
+            if node.term2 is not None:
+                terms += find_terms(node.term2)
+            return terms
+
+        return find_terms(self.antecedent)
+
+    def __repr__(self):
+        # skfuzzy.control.Rule ile aynı biçim
+        cons = self.consequent[0] if len(self.consequent) == 1 else self.consequent
+        return ("IF {0} THEN {1}"
+                "\n\tAND aggregation function : {2}"
+                "\n\tOR aggregation function  : {3}").format(
+                    self.antecedent, cons, self.and_func.__name__, self.or_func.__name__)
+
+
+class ControlSystem:
+    def __init__(self, rules):
+        self.rules = list(rules)
+
+        # Değişkenler kurallarda ilk göründükleri sırayla
+        antecedents, consequents = {}, {}
+        for rule in self.rules:
+            for term in rule.antecedent_terms():
+                antecedents.setdefault(term.parent.label, term.parent)
+            for c in rule.consequent:
+                consequents.setdefault(c.term.parent.label, c.term.parent)
+        self.antecedents = list(antecedents.values())
+        self.consequents = list(consequents.values())
+
+
+def resample_outputs(control_system, step):
+    # Çıktı evrenlerini verilen adımla yeniden örnekler; terimler trimf parametrelerinden yeniden üretilir
+    consequents = {}
+    for var in control_system.consequents:
+        universe = np.arange(var.universe[0], var.universe[-1] + step / 2, step)
+        consequents[var.label] = Consequent(universe, var.label)
+        for label, term in var.terms.items():
+            if term.abc is None:
+                raise ValueError(f"'{term.full_label}' trimf parametreleri olmadan yeniden örneklenemez.")
+            consequents[var.label].set_trimf(label, term.abc)
+
+    rules = []
+    for rule in control_system.rules:
+        weighted = [consequents[c.term.parent.label][c.term.label] % c.weight for c in rule.consequent]
+        rules.append(Rule(rule.antecedent, weighted, and_func=rule.and_func, or_func=rule.or_func))
+    return ControlSystem(rules)
+
+
+def to_skfuzzy(control_system, rule_weights=None):
+    # Aynı tanımdan skfuzzy nesneleri; skfuzzy.control matplotlib'i de yüklediği için yalnızca istendiğinde.
+    # Kural ağırlıkları skfuzzy'de sonuç terimlerinin ağırlığına katlanır (aktivasyon = ateşleme x ağırlık).
+    from skfuzzy import control as ctrl
+
+    variables = {}
+    for var in control_system.antecedents + control_system.consequents:
+        kind = ctrl.Antecedent if isinstance(var, Antecedent) else ctrl.Consequent
+        variables[var.label] = kind(var.universe, var.label)
+        for label, term in var.terms.items():
+            variables[var.label][label] = term.mf
+
+    def convert(node):
+        if isinstance(node, Term):
+            return variables[node.parent.label][node.label]
+        if node.kind == 'not':
+            return ~convert(node.term1)
+        if node.kind == 'and':
+            return convert(node.term1) & convert(node.term2)
+        return convert(node.term1) | convert(node.term2)
+
+    if rule_weights is None:
+        rule_weights = [1.0] * len(control_system.rules)
+    rules = []
+    for rule, rule_weight in zip(control_system.rules, rule_weights):
+        consequents = [variables[c.term.parent.label][c.term.label] % (c.weight * rule_weight)
+                       for c in rule.consequent]
+        rules.append(ctrl.Rule(convert(rule.antecedent), consequents, and_func=rule.and_func, or_func=rule.or_func))
+    return ctrl.ControlSystem(rules)
@@ -0,0 +1,161 @@
+import threading
+
+import numpy as np
+
+from fuzzy_definition import DEFAULT_DEFINITION, definition_hash, definition_stamp, load_compiled, read_definition
+from fuzzy_model import to_skfuzzy
+from instrumentation import Instrumentation
+from lookup_table import LookupTable
+from result_cache import ResultCache
+
+# (üst sınır dahil, anahtar, seviye); son seviye sınırın üstündeki tüm değerler
+PRIORITY_LEVELS = ((3, 'low', "Düşük Öncelik"), (7, 'medium', "Orta Öncelik"), (None, 'high', "Yüksek Öncelik"))
+PROBABILITY_LEVELS = ((30, 'low', "Düşük İhtimal"), (70, 'medium', "Orta İhtimal"), (None, 'high', "Yüksek İhtimal"))
+
+
+def get_level(levels, value):
+    for limit, _, label in levels[:-1]:
+        if value <= limit:
+            return label
+    return levels[-1][2]
+
+
+class TireFuzzySystem:
+    def __init__(self, cache_size=4096, defuzzify='sampled', definition=None):
+        # JSON/YAML sistem tanımı; verilmezse tire_system.json
+        self.definition_path = definition or DEFAULT_DEFINITION
+        # 'sampled': skfuzzy ile aynı örneklenmiş centroid; 'analytic': üçgen çıktı kümeleri için kapalı biçim
+        self.defuzzify = defuzzify
+        # Tekrarlanan girdiler için sonuç önbelleği; sistem yeniden kurulduğunda korunur
+        self.result_cache = ResultCache(cache_size)
+        # Aşama süreleri ve kural ateşlemeleri; kapalıyken maliyeti yok denecek kadar azdır
+        self.instrumentation = Instrumentation()
+        # enable_lookup ayarları; tanım yeniden yüklendiğinde tablo bu ayarlarla yeniden hazırlanır
+        self.lookup_settings = None
+        self.lookup_thread = None
+        self.create_fuzzy_system()
+
+    def create_fuzzy_system(self):
+        # Değişkenler, terimler ve kurallar tanım dosyasından; derlenmiş sistem diskte içerik özetiyle saklanır
+        self.definition_stamp = definition_stamp(self.definition_path)
+        compiled = load_compiled(self.definition_path, self.defuzzify)
+        self.definition_hash = compiled['hash']
+        for name, var in compiled['variables'].items():
+            setattr(self, name, var)
+        self.rules = compiled['rules']
+
+        # Kontrol sistemi
+        self.control_system = compiled['control_system']
+        self.rule_weights = compiled['rule_weights']
+        self._simulation = None
+
+        # Toplu (vektörel) hesaplama motoru; kural ağırlıkları ateşleme derecelerine uygulanır
+        self.engine = compiled['engine']
+        self.engine.instrumentation = self.instrumentation
+        self.instrumentation.set_rules([(str(rule['rule']), rule['desc']) for rule in self.rules])
+        self.lookup = None
+        self.outputs = {}
+        # Kural açıklamaları ve ağırlıkları dahil tanımın özeti; önbellekler bununla geçersiz kılınır
+        self.definition_fingerprint = self.engine.fingerprint(extra=[(rule['desc'], rule['weight']) for rule in self.rules])
+        self.result_cache.bind(self.definition_fingerprint)
+
+        # Varsayılan değerler
+        self.default_values = compiled['default_values']
+
+        if self.lookup_settings is not None:
+            # Eski tablo yeni tanıma uymaz; yenisi arka planda hazırlanır, hazır olana kadar motor kullanılır
+            self.enable_lookup(background=True, **self.lookup_settings)
+
+    @property
+    def simulation(self):
+        # skfuzzy referans simülasyonu; skfuzzy.control matplotlib'i de yüklediği için ilk kullanımda kurulur
+        if self._simulation is None:
+            from skfuzzy import control as ctrl
+            self._simulation = ctrl.ControlSystemSimulation(to_skfuzzy(self.control_system, self.rule_weights))
+        return self._simulation
+
+    def reload_definition(self):
+        # Tanım dosyası değiştiyse sistemi yeniden kurar; içerik aynıysa hiçbir şey yeniden kurulmaz.
+        # Geçersiz tanımda hata yükseltilir ve mevcut sistem kullanılmaya devam eder.
+        stamp = definition_stamp(self.definition_path)
+        if stamp == self.definition_stamp:
+            return False
+        self.definition_stamp = stamp
+        if definition_hash(read_definition(self.definition_path)) == self.definition_hash:
+            return False
+        self.create_fuzzy_system()
+        return True
+
+    def enable_lookup(self, steps=None, cache_dir=None, background=False, progress=None):
+        # Önceden hesaplanmış tablo: ilk çalıştırmada oluşturulur, sonrasında diskten eşlenir.
+        # background=True ise tablo ayrı bir iş parçacığında hazırlanır, hazır olana kadar motor kullanılır;
+        # progress(tamamlanan, toplam) oluşturma sırasında çağrılır
+        self.lookup_settings = {'steps': steps, 'cache_dir': cache_dir, 'progress': progress}
+        table = LookupTable(self.engine, steps=steps, cache_dir=cache_dir)
+        self.lookup_error = None
+        if not background:
+            self.lookup_thread = None
+            self.attach_lookup(table.load(progress=progress))
+            return None
+        self.lookup_thread = threading.Thread(target=self.build_lookup, args=(table, progress), daemon=True)
+        self.lookup_thread.start()
+        return self.lookup_thread
+
+    def build_lookup(self, table, progress):
+        def report(done, total):
+            # Tanım bu arada yeniden yüklendiyse eski tablonun oluşturulması durdurulur
+            if table.engine is not self.engine:
+                raise RuntimeError("Sistem tanımı değişti, tablo oluşturma durduruldu.")
+            if progress is not None:
+                progress(done, total)
+
+        try:
+            self.attach_lookup(table.load(progress=report))
+        except Exception as e:
+            # Arka planda oluşturulamayan tabloda motor kullanılmaya devam eder
+            if table.engine is self.engine:
+                self.lookup_error = e
+
+    def attach_lookup(self, table):
+        # Tablo oluşturulurken sistem yeniden kurulduysa eski motorun tablosu kullanılmaz
+        if table.engine is not self.engine:
+            return
+        self.lookup = table
+        self.result_cache.clear()
+
+    def compute(self, inputs):
+        key = self.result_cache.make_key(inputs)
+        outputs = self.result_cache.get(key)
+        if outputs is not None:
+            return outputs
+
+        # Hesaplama sırasında tanım yeniden yüklenirse sonuç yeni tanımın önbelleğine yazılmaz
+        fingerprint = self.definition_fingerprint
+        values = self.compute_batch(inputs)
+        # Hesaplanamayan çıktılar skfuzzy'de olduğu gibi sonuçtan çıkarılır
+        outputs = {label: float(value) for label, value in values.items() if not np.isnan(value)}
+
+        self.result_cache.put(key, outputs, fingerprint)
+        return outputs
+
+    def set_instrumentation(self, enabled, profile=False):
+        self.instrumentation.enabled = enabled
+        if profile:
+            self.instrumentation.start_profiling()
+        else:
+            self.instrumentation.stop_profiling()
+
+    def cache_stats(self):
+        return self.result_cache.stats()
+
+    def compute_batch(self, inputs):
+        lookup = self.lookup
+        if lookup is not None:
+            return lookup.lookup(inputs)
+        return self.engine.compute(inputs)
+
+    def get_priority_level(self, value):
+        return get_level(PRIORITY_LEVELS, value)
+
+    def get_probability_level(self, value):
+        return get_level(PROBABILITY_LEVELS, value)
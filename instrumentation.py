@@ -0,0 +1,96 @@
+import cProfile
+import io
+import json
+import pstats
+import threading
+
+import numpy as np
+
+STAGES = ('fuzzification', 'rule_evaluation', 'aggregation', 'defuzzification')
+
+
+class Instrumentation:
+    def __init__(self):
+        self.enabled = False
+        self.profiler = None
+        self.lock = threading.Lock()
+        self.rules = []
+        self.reset()
+
+    def set_rules(self, rules):
+        # rules: [(kural ifadesi, açıklama)], motorun kural sırasıyla aynı
+        if rules != self.rules:
+            self.rules = list(rules)
+            self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.rows = 0
+            self.chunks = 0
+            self.stage_seconds = dict.fromkeys(STAGES, 0.0)
+            self.rule_activations = np.zeros(len(self.rules), dtype=np.int64)
+            self.rule_strength_sum = np.zeros(len(self.rules))
+            self.rule_strength_max = np.zeros(len(self.rules))
+            self.rule_strength_last = np.zeros(len(self.rules))
+
+    def record(self, rows, stage_seconds, firings):
+        with self.lock:
+            self.rows += rows
+            self.chunks += 1
+            for stage, seconds in stage_seconds.items():
+                self.stage_seconds[stage] += seconds
+            for i, firing in enumerate(firings):
+                firing = np.asarray(firing)
+                self.rule_activations[i] += np.count_nonzero(firing > 0)
+                self.rule_strength_sum[i] += firing.sum()
+                self.rule_strength_max[i] = max(self.rule_strength_max[i], firing.max(initial=0.0))
+                self.rule_strength_last[i] = firing[-1] if firing.size else 0.0
+
+    def start_profiling(self):
+        if self.profiler is None:
+            self.profiler = cProfile.Profile()
+
+    def stop_profiling(self):
+        profiler, self.profiler = self.profiler, None
+        return profiler
+
+    def profile_text(self, limit=30):
+        if self.profiler is None:
+            return ""
+        stream = io.StringIO()
+        pstats.Stats(self.profiler, stream=stream).sort_stats('cumulative').print_stats(limit)
+        return stream.getvalue()
+
+    def export(self):
+        with self.lock:
+            total = sum(self.stage_seconds.values())
+            return {
+                'rows': self.rows,
+                'chunks': self.chunks,
+                'stages': {
+                    stage: {
+                        'seconds': seconds,
+                        'share': seconds / total if total else 0.0,
+                        'per_row_us': seconds / self.rows * 1e6 if self.rows else 0.0
+                    }
+                    for stage, seconds in self.stage_seconds.items()
+                },
+                'rules': [
+                    {
+                        'index': i + 1,
+                        'rule': rule,
+                        'desc': desc,
+                        'activations': int(self.rule_activations[i]),
+                        'mean_strength': float(self.rule_strength_sum[i] / self.rows) if self.rows else 0.0,
+                        'max_strength': float(self.rule_strength_max[i]),
+                        'last_strength': float(self.rule_strength_last[i])
+                    }
+                    for i, (rule, desc) in enumerate(self.rules)
+                ]
+            }
+
+    def save(self, path, profile_path=None):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.export(), f, ensure_ascii=False, indent=2)
+        if profile_path and self.profiler is not None:
+            self.profiler.dump_stats(profile_path)
@@ -0,0 +1,120 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+from fuzzy_engine import INPUT_NAMES
+from fuzzy_system import TireFuzzySystem
+from scoring_server import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_PENDING, DEFAULT_MAX_WAIT_MS, ScoringServer, summarize_latencies
+
+
+def make_requests(system, count, seed=0):
+    rng = np.random.default_rng(seed)
+    columns = {name: rng.uniform(system.engine.antecedents[name][0][0], system.engine.antecedents[name][0][-1], count)
+               for name in INPUT_NAMES}
+    return [json.dumps({name: round(float(columns[name][i]), 2) for name in INPUT_NAMES}).encode()
+            for i in range(count)]
+
+
+async def request(reader, writer, host, method, path, body=b''):
+    writer.write((f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+                  f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n").encode('latin-1') + body)
+    await writer.drain()
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split(' ', 2)[1])
+    length = 0
+    for line in lines[1:]:
+        if line.lower().startswith('content-length:'):
+            length = int(line.split(':', 1)[1])
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def client(host, port, bodies, latencies, statuses):
+    # Her istemci tek bir kalıcı bağlantı üzerinden sırayla istek gönderir
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while bodies:
+            body = bodies.pop()
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, host, 'POST', '/score', body)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+    finally:
+        writer.close()
+
+
+async def fetch_stats(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        return (await request(reader, writer, host, 'GET', '/stats'))[1]
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, concurrency, bodies):
+    bodies = list(bodies)
+    total = len(bodies)
+    latencies, statuses = [], Counter()
+    start = time.perf_counter()
+    await asyncio.gather(*[client(host, port, bodies, latencies, statuses) for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+    return {
+        'requests': total,
+        'concurrency': concurrency,
+        'elapsed_s': elapsed,
+        'throughput_rps': total / elapsed,
+        'statuses': dict(statuses),
+        **summarize_latencies(latencies),
+        'server': await fetch_stats(host, port)
+    }
+
+
+async def run(args):
+    server = None
+    host, port = args.host, args.port
+    if args.spawn:
+        # Aynı işlemde yerel bir sunucu başlatılır; dış süreç gerektirmeden uçtan uca ölçüm
+        server = await ScoringServer(TireFuzzySystem(), '127.0.0.1', 0, args.max_batch_size,
+                                     args.max_wait_ms, args.max_pending).start()
+        host, port = server.host, server.port
+    try:
+        return await run_load(host, port, args.concurrency, make_requests(TireFuzzySystem(), args.requests, args.seed))
+    finally:
+        if server is not None:
+            await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Puanlama sunucusuna eşzamanlı istek gönderip gecikme ve hızı ölçer.")
+    parser.add_argument('--host', default='127.0.0.1', help="Sunucu adresi")
+    parser.add_argument('--port', type=int, default=8080, help="Sunucu portu")
+    parser.add_argument('--requests', type=int, default=5000, help="Toplam istek sayısı")
+    parser.add_argument('--concurrency', type=int, default=32, help="Eşzamanlı bağlantı sayısı")
+    parser.add_argument('--seed', type=int, default=0, help="Rastgele girdi tohumu")
+    parser.add_argument('--spawn', action='store_true', help="Sunucuyu bu işlemde yerel olarak başlat")
+    parser.add_argument('--max-batch-size', type=int, default=DEFAULT_MAX_BATCH_SIZE, help="--spawn için yığın boyutu")
+    parser.add_argument('--max-wait-ms', type=float, default=DEFAULT_MAX_WAIT_MS, help="--spawn için yığın bekleme süresi")
+    parser.add_argument('--max-pending', type=int, default=DEFAULT_MAX_PENDING, help="--spawn için bekleyen istek sınırı")
+    parser.add_argument('--output', help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args(argv)
+
+    summary = asyncio.run(run(args))
+    server = summary['server']
+    print(f"{summary['requests']} istek, {summary['concurrency']} bağlantı, {summary['elapsed_s']:.2f} sn")
+    print(f"İstemci: {summary['throughput_rps']:.0f} istek/sn, p50 {summary['p50_ms']:.2f} ms, p99 {summary['p99_ms']:.2f} ms")
+    print(f"Sunucu: p50 {server['p50_ms']:.2f} ms, p99 {server['p99_ms']:.2f} ms, "
+          f"ort. yığın {server['mean_batch_size']:.1f}, reddedilen {server['rejected']}")
+    print(f"Durum kodları: {summary['statuses']}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+    return 0 if set(summary['statuses']) <= {200} else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
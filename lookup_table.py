@@ -0,0 +1,160 @@
+import copy
+import os
+import itertools
+import multiprocessing
+import sys
+
+import numpy as np
+
+CACHE_DIR = os.environ.get('TIRE_MAINTENANCE_CACHE',
+                           os.path.join(os.path.expanduser('~'), '.cache', 'tire_maintenance'))
+
+# Arayüzdeki kaydırıcıların adımları (create_slider_input ile aynı)
+SLIDER_STEPS = {
+    'usage_time': 1,
+    'road_type': 1,
+    'temperature': 1,
+    'average_speed': 5,
+    'tire_pressure': 1
+}
+
+
+def make_grid(universe, step):
+    # Evren sınırlarını her zaman içeren eşit aralıklı ızgara
+    low, high = float(universe[0]), float(universe[-1])
+    grid = np.arange(low, high, step, dtype=np.float64)
+    return np.append(grid, high)
+
+
+def report_lookup_progress(done, total):
+    # Komut satırı araçları için ilerleme göstergesi (standart hata)
+    print(f"\rÖnceden hesaplanmış tablo oluşturuluyor: {done}/{total}", end='\n' if done == total else '',
+          file=sys.stderr, flush=True)
+
+
+# Paralel oluşturmada her işçi işlemde bir kez hazırlanır: (tablo, yazılan dosya, son üç eksenin ızgarası)
+_builder = None
+
+
+def _init_build_worker(table, temp_path):
+    global _builder
+    _builder = (table, np.load(temp_path, mmap_mode='r+'), np.meshgrid(*table.grids[2:], indexing='ij'))
+
+
+def _build_slice(index):
+    table, output, rest = _builder
+    table.fill_slice(output, rest, *index)
+    return index
+
+
+class LookupTable:
+    def __init__(self, engine, steps=None, cache_dir=None):
+        self.engine = engine
+        self.steps = dict(SLIDER_STEPS if steps is None else steps)
+        self.cache_dir = cache_dir or CACHE_DIR
+
+        self.input_names = list(engine.antecedents)
+        self.output_names = list(engine.consequents)
+        self.grids = [make_grid(engine.antecedents[name][0], self.steps.get(name, 1))
+                      for name in self.input_names]
+        self.shape = tuple(len(grid) for grid in self.grids)
+
+        self.key = engine.fingerprint(extra=[(name, grid.tobytes()) for name, grid in zip(self.input_names, self.grids)])
+        self.path = os.path.join(self.cache_dir, f"lookup_{self.key[:16]}.npy")
+        self.table = None
+
+    def load(self, build=True, progress=None, workers=None):
+        if not os.path.exists(self.path):
+            if not build:
+                raise FileNotFoundError(self.path)
+            self.build(progress, workers)
+        # Salt okunur bellek eşlemesi: aynı dosyayı kullanan işlemler sayfaları paylaşır
+        self.table = np.load(self.path, mmap_mode='r')
+        return self
+
+    def build(self, progress=None, workers=None):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        table = np.lib.format.open_memmap(temp_path, mode='w+', dtype=np.float32,
+                                          shape=self.shape + (len(self.output_names),))
+
+        # İlk iki eksen boyunca dilim dilim hesapla; bellek kullanımı işçi başına tek dilimle sınırlı kalır.
+        # Dilimler işçi işlemlere dağıtılır (workers=None: tüm çekirdekler), her işçi dosyadaki kendi dilimine yazar.
+        # progress(tamamlanan, toplam) her dilimden sonra çağrılır; hata yükseltirse oluşturma durdurulur
+        slices = list(itertools.product(range(self.shape[0]), range(self.shape[1])))
+        workers = min(workers or os.cpu_count() or 1, len(slices))
+        try:
+            if workers == 1:
+                rest = np.meshgrid(*self.grids[2:], indexing='ij')
+                for done, (i, k) in enumerate(slices, 1):
+                    self.fill_slice(table, rest, i, k)
+                    if progress is not None:
+                        progress(done, len(slices))
+            else:
+                table.flush()
+                # Motorun ölçüm nesnesi (kilit içerir) işçilere gönderilmez
+                worker_table = copy.copy(self)
+                worker_table.engine = copy.copy(self.engine)
+                worker_table.engine.instrumentation = None
+                # spawn: arayüzün iş parçacıklı işleminden de güvenle başlatılır; çıkışta havuz sonlandırılır
+                with multiprocessing.get_context('spawn').Pool(workers, initializer=_init_build_worker,
+                                                               initargs=(worker_table, temp_path)) as pool:
+                    for done, _ in enumerate(pool.imap_unordered(_build_slice, slices), 1):
+                        if progress is not None:
+                            progress(done, len(slices))
+            table.flush()
+        except BaseException:
+            del table
+            os.remove(temp_path)
+            raise
+        del table
+        # Başka bir işlem aynı anda oluşturuyorsa bile dosya atomik olarak yerine konur
+        os.replace(temp_path, self.path)
+
+    def fill_slice(self, table, rest, i, k):
+        inputs = {self.input_names[0]: np.full(rest[0].shape, self.grids[0][i]),
+                  self.input_names[1]: np.full(rest[0].shape, self.grids[1][k])}
+        inputs.update({name: mesh for name, mesh in zip(self.input_names[2:], rest)})
+        outputs = self.engine.compute(inputs)
+        for j, name in enumerate(self.output_names):
+            table[i, k, ..., j] = outputs[name]
+
+    def lookup(self, inputs):
+        if self.table is None:
+            self.load()
+
+        arrays = np.broadcast_arrays(*[np.asarray(inputs[name], dtype=np.float64) for name in self.input_names])
+        shape = arrays[0].shape
+
+        # Her eksende alt komşu indeksi ve kesirli konum
+        lower, fractions = [], []
+        for grid, values in zip(self.grids, arrays):
+            values = np.clip(values.ravel(), grid[0], grid[-1])
+            idx = np.clip(np.searchsorted(grid, values, side='right') - 1, 0, len(grid) - 2)
+            lower.append(idx)
+            fractions.append((values - grid[idx]) / (grid[idx + 1] - grid[idx]))
+
+        # Çok doğrusal interpolasyon: 2^d köşenin ağırlıklı toplamı
+        result = np.zeros((arrays[0].size, len(self.output_names)))
+        invalid = np.zeros(arrays[0].size, dtype=bool)
+        for corner in itertools.product((0, 1), repeat=len(self.grids)):
+            weight = np.ones(arrays[0].size)
+            index = []
+            for offset, idx, frac in zip(corner, lower, fractions):
+                weight *= frac if offset else 1.0 - frac
+                index.append(idx + offset)
+            used = weight > 0
+            if not used.any():
+                continue
+            values = self.table[tuple(i[used] for i in index)]
+            result[used] += weight[used, None] * values
+            invalid[used] |= np.isnan(values).any(axis=1)
+
+        # Hiçbir kuralın ateşlenmediği (NaN) bir köşeye dayanan satırlar interpolasyonla hesaplanamaz;
+        # bunlar motorla doğrudan hesaplanır
+        if invalid.any():
+            exact = self.engine.compute({name: array.ravel()[invalid] for name, array in zip(self.input_names, arrays)})
+            for j, name in enumerate(self.output_names):
+                result[invalid, j] = exact[name]
+
+        return {name: result[:, j].reshape(shape) for j, name in enumerate(self.output_names)}
@@ -0,0 +1,91 @@
+import os
+import multiprocessing
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from fuzzy_engine import INPUT_NAMES, OUTPUT_NAMES
+from fuzzy_system import TireFuzzySystem
+
+# Her işçi işlemde başlangıçta bir kez oluşturulur
+_system = None
+
+
+def _init_worker(use_lookup, defuzzify='sampled', definition=None):
+    global _system
+    _system = TireFuzzySystem(defuzzify=defuzzify, definition=definition)
+    if use_lookup:
+        _system.enable_lookup()
+
+
+def _score_slice(task):
+    input_name, output_name, total, start, stop = task
+    input_shm = shared_memory.SharedMemory(name=input_name)
+    output_shm = shared_memory.SharedMemory(name=output_name)
+    try:
+        inputs = np.ndarray((len(INPUT_NAMES), total), dtype=np.float64, buffer=input_shm.buf)
+        outputs = np.ndarray((len(OUTPUT_NAMES), total), dtype=np.float64, buffer=output_shm.buf)
+
+        result = _system.compute_batch({name: inputs[i, start:stop] for i, name in enumerate(INPUT_NAMES)})
+        for i, name in enumerate(OUTPUT_NAMES):
+            outputs[i, start:stop] = result[name]
+        del inputs, outputs
+    finally:
+        input_shm.close()
+        output_shm.close()
+    return start, stop
+
+
+class ParallelScorer:
+    def __init__(self, workers=None, chunk_size=20000, use_lookup=False, defuzzify='sampled', definition=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        if use_lookup:
+            # Tablo işçilerden önce oluşturulur; işçiler yalnızca dosyayı eşler
+            TireFuzzySystem(defuzzify=defuzzify, definition=definition).enable_lookup()
+        # İşçiler ana işlemin kaynak izleyicisini paylaşmalı; aksi halde her işçi kendi izleyicisini
+        # başlatır ve çıkışta ana işleme ait paylaşılan bellek bloklarını silmeye çalışır
+        resource_tracker.ensure_running()
+        self.pool = multiprocessing.Pool(self.workers, initializer=_init_worker, initargs=(use_lookup, defuzzify, definition))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def compute_batch(self, inputs):
+        arrays = np.broadcast_arrays(*[np.asarray(inputs[name], dtype=np.float64) for name in INPUT_NAMES])
+        shape = arrays[0].shape
+        total = arrays[0].size
+        if total == 0:
+            return {name: np.empty(shape) for name in OUTPUT_NAMES}
+
+        input_shm = shared_memory.SharedMemory(create=True, size=len(INPUT_NAMES) * total * 8)
+        output_shm = shared_memory.SharedMemory(create=True, size=len(OUTPUT_NAMES) * total * 8)
+        try:
+            shared_inputs = np.ndarray((len(INPUT_NAMES), total), dtype=np.float64, buffer=input_shm.buf)
+            for i, array in enumerate(arrays):
+                shared_inputs[i] = array.ravel()
+
+            # Her görev yalnızca kendi aralığına yazar; sonuç sırası girdi sırasıyla aynıdır
+            tasks = [(input_shm.name, output_shm.name, total, start, min(start + self.chunk_size, total))
+                     for start in range(0, total, self.chunk_size)]
+            for _ in self.pool.imap_unordered(_score_slice, tasks):
+                pass
+
+            shared_outputs = np.ndarray((len(OUTPUT_NAMES), total), dtype=np.float64, buffer=output_shm.buf)
+            result = {name: shared_outputs[i].reshape(shape).copy() for i, name in enumerate(OUTPUT_NAMES)}
+            del shared_inputs, shared_outputs
+        finally:
+            input_shm.close()
+            input_shm.unlink()
+            output_shm.close()
+            output_shm.unlink()
+        return result
@@ -0,0 +1,85 @@
+import threading
+from collections import OrderedDict
+
+from lookup_table import SLIDER_STEPS
+
+# Kaydırıcı adımına bu oranda yakın değerler adım değerine eşlenir (kayan nokta gürültüsü)
+STEP_TOLERANCE = 1e-9
+
+
+def quantize(name, value):
+    # Kaydırıcı ızgarasındaki değerler tam adım değerine eşlenir; ızgara dışı değerler olduğu gibi
+    # anahtarlanır, böylece farklı girdiler hiçbir zaman aynı sonucu paylaşmaz
+    value = float(value)
+    step = SLIDER_STEPS.get(name)
+    if step is not None:
+        snapped = round(value / step) * step
+        if abs(value - snapped) <= STEP_TOLERANCE * step:
+            return float(snapped)
+    return value
+
+
+class ResultCache:
+    # Tekil (arayüz) hesaplamaları için; toplu hesaplamalar satır başına anahtar oluşturmadan doğrudan yapılır
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.fingerprint = None
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(inputs):
+        return tuple((name, quantize(name, value)) for name, value in sorted(inputs.items()))
+
+    def bind(self, fingerprint):
+        # Kural tabanı veya üyelik fonksiyonları değiştiyse eski sonuçlar geçersizdir
+        with self.lock:
+            if fingerprint != self.fingerprint:
+                self.entries.clear()
+                self.fingerprint = fingerprint
+
+    def get(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return dict(self.entries[key])
+            self.misses += 1
+            return None
+
+    def contains(self, key):
+        # İsabet/ıska sayaçlarını etkilemeden varlık denetimi
+        with self.lock:
+            return key in self.entries
+
+    def put(self, key, value, fingerprint=None):
+        # fingerprint: sonucun hesaplandığı tanım; bu arada bind() çağrıldıysa eski sonuç saklanmaz
+        if self.maxsize <= 0:
+            return
+        with self.lock:
+            if fingerprint is not None and fingerprint != self.fingerprint:
+                return
+            self.entries[key] = dict(value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
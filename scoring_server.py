@@ -0,0 +1,350 @@
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from fuzzy_engine import INPUT_NAMES
+from fuzzy_system import TireFuzzySystem
+from lookup_table import report_lookup_progress
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT_MS = 2.0
+# Kuyrukta bekleyen ve hesaplanan isteklerin üst sınırı; aşılırsa 503 döner
+DEFAULT_MAX_PENDING = 1024
+LATENCY_WINDOW = 10000
+MAX_BODY_SIZE = 64 * 1024
+
+STATUS_TEXT = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error',
+    503: 'Service Unavailable'
+}
+
+
+class Overloaded(Exception):
+    pass
+
+
+def summarize_latencies(latencies):
+    if not len(latencies):
+        return {'p50_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0}
+    p50, p99 = np.percentile(np.asarray(latencies), [50, 99]) * 1e3
+    return {'p50_ms': float(p50), 'p99_ms': float(p99), 'max_ms': float(max(latencies) * 1e3)}
+
+
+def format_result(system, priority, probability):
+    # calculate() ile aynı çıktılar; hesaplanamayan değerler null
+    result = {'maintenance_priority': None, 'change_probability': None, 'priority_level': None, 'probability_level': None}
+    if not math.isnan(priority):
+        result['maintenance_priority'] = priority
+        result['priority_level'] = system.get_priority_level(priority)
+    if not math.isnan(probability):
+        result['change_probability'] = probability
+        result['probability_level'] = system.get_probability_level(probability)
+    return result
+
+
+def parse_inputs(body):
+    try:
+        data = json.loads(body)
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Geçersiz JSON: {e}")
+    if not isinstance(data, dict):
+        raise ValueError("İstek gövdesi bir JSON nesnesi olmalıdır.")
+    missing = [name for name in INPUT_NAMES if name not in data]
+    if missing:
+        raise ValueError(f"Eksik girdiler: {', '.join(missing)}")
+    inputs = {}
+    for name in INPUT_NAMES:
+        value = data[name]
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            raise ValueError(f"'{name}' değeri geçersiz: {value!r}")
+        inputs[name] = float(value)
+    return inputs
+
+
+class ServerStats:
+    def __init__(self, window=LATENCY_WINDOW):
+        self.latencies = deque(maxlen=window)
+        self.started = time.perf_counter()
+        self.completed = 0
+        self.rejected = 0
+        self.batches = 0
+        self.batched_requests = 0
+
+    def record_batch(self, size):
+        self.batches += 1
+        self.batched_requests += size
+
+    def record(self, latency):
+        self.completed += 1
+        self.latencies.append(latency)
+
+    def snapshot(self, pending=0):
+        elapsed = time.perf_counter() - self.started
+        return {
+            'completed': self.completed,
+            'rejected': self.rejected,
+            'pending': pending,
+            'uptime_s': elapsed,
+            'throughput_rps': self.completed / elapsed if elapsed > 0 else 0.0,
+            'batches': self.batches,
+            'mean_batch_size': self.batched_requests / self.batches if self.batches else 0.0,
+            **summarize_latencies(self.latencies)
+        }
+
+
+class MicroBatcher:
+    def __init__(self, system, stats, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_wait_ms=DEFAULT_MAX_WAIT_MS,
+                 max_pending=DEFAULT_MAX_PENDING):
+        self.system = system
+        self.stats = stats
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_pending = max_pending
+        self.pending = 0
+        self.queue = asyncio.Queue()
+        # Çıkarım tek iş parçacığında çalışır; o sürede gelen istekler bir sonraki yığında birleşir
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='scoring')
+
+    async def submit(self, inputs):
+        if self.pending >= self.max_pending:
+            self.stats.rejected += 1
+            raise Overloaded()
+        self.pending += 1
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((inputs, future))
+        try:
+            return await future
+        finally:
+            self.pending -= 1
+
+    async def collect(self):
+        loop = asyncio.get_running_loop()
+        batch = [await self.queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self.collect()
+            # İstemcisi bağlantıyı kapatmış istekler hesaplanmaz
+            batch = [(inputs, future) for inputs, future in batch if not future.done()]
+            if not batch:
+                continue
+            arrays = {name: np.array([inputs[name] for inputs, _ in batch]) for name in INPUT_NAMES}
+            try:
+                outputs = await loop.run_in_executor(self.executor, self.system.compute_batch, arrays)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            self.stats.record_batch(len(batch))
+            priorities = outputs['maintenance_priority'].tolist()
+            probabilities = outputs['change_probability'].tolist()
+            for (_, future), priority, probability in zip(batch, priorities, probabilities):
+                if not future.done():
+                    future.set_result(format_result(self.system, priority, probability))
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+
+
+class ScoringServer:
+    def __init__(self, system=None, host='127.0.0.1', port=8080, max_batch_size=DEFAULT_MAX_BATCH_SIZE,
+                 max_wait_ms=DEFAULT_MAX_WAIT_MS, max_pending=DEFAULT_MAX_PENDING):
+        self.system = system or TireFuzzySystem()
+        self.host = host
+        self.port = port
+        self.stats = ServerStats()
+        self.batcher_options = (max_batch_size, max_wait_ms, max_pending)
+        self.server = None
+        self.tasks = []
+
+    async def start(self):
+        self.batcher = MicroBatcher(self.system, self.stats, *self.batcher_options)
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        # port=0 verildiyse işletim sisteminin seçtiği port
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.tasks.append(asyncio.create_task(self.batcher.run()))
+        return self
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        self.batcher.close()
+
+    async def report(self, interval, stream=sys.stderr):
+        while True:
+            await asyncio.sleep(interval)
+            s = self.stats.snapshot(self.batcher.pending)
+            print(f"{s['completed']} istek, {s['throughput_rps']:.0f} istek/sn, p50 {s['p50_ms']:.2f} ms, "
+                  f"p99 {s['p99_ms']:.2f} ms, ort. yığın {s['mean_batch_size']:.1f}, reddedilen {s['rejected']}",
+                  file=stream, flush=True)
+
+    async def watch_definition(self, interval, stream=sys.stderr):
+        loop = asyncio.get_running_loop()
+        last_error = None
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                # Çıkarımla aynı iş parçacığında: yeniden kurulum bir yığının ortasına denk gelmez
+                if await loop.run_in_executor(self.batcher.executor, self.system.reload_definition):
+                    print("Sistem tanımı yeniden yüklendi", file=stream, flush=True)
+                last_error = None
+            except Exception as e:
+                # Eksik dosya gibi kalıcı hatalar her yoklamada değil, bir kez yazılır
+                message = f"Sistem tanımı yüklenemedi, önceki tanım kullanılıyor: {e}"
+                if message != last_error:
+                    print(message, file=stream, flush=True)
+                last_error = message
+
+    async def dispatch(self, method, path, body):
+        if path == '/score':
+            if method != 'POST':
+                return 405, {'error': "Yalnızca POST desteklenir."}
+            start = time.perf_counter()
+            try:
+                inputs = parse_inputs(body)
+            except ValueError as e:
+                return 400, {'error': str(e)}
+            try:
+                result = await self.batcher.submit(inputs)
+            except Overloaded:
+                return 503, {'error': "Sunucu dolu, daha sonra tekrar deneyin."}
+            except Exception as e:
+                # Yığın hesaplanamadı; bağlantı açık kalır, istemci hatayı JSON olarak alır
+                return 500, {'error': f"Hesaplama hatası: {e}"}
+            self.stats.record(time.perf_counter() - start)
+            return 200, result
+        if path == '/stats' and method == 'GET':
+            return 200, self.stats.snapshot(self.batcher.pending)
+        if path == '/health' and method == 'GET':
+            return 200, {'status': 'ok'}
+        return 404, {'error': "Bulunamadı."}
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self.respond(writer, 413, {'error': "Başlık çok büyük."}, keep_alive=False)
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, path, version = lines[0].split(' ', 2)
+                    headers = {}
+                    for line in lines[1:]:
+                        if line:
+                            key, value = line.split(':', 1)
+                            headers[key.strip().lower()] = value.strip()
+                    # Yalnızca rakamlardan oluşan uzunluk kabul edilir ('-5', '+5', '1_0' geçersizdir)
+                    length = headers.get('content-length', '0')
+                    if not length.isdigit():
+                        raise ValueError(length)
+                    length = int(length)
+                except ValueError:
+                    await self.respond(writer, 400, {'error': "Geçersiz HTTP isteği."}, keep_alive=False)
+                    break
+                if length > MAX_BODY_SIZE:
+                    await self.respond(writer, 413, {'error': "İstek gövdesi çok büyük."}, keep_alive=False)
+                    break
+
+                body = await reader.readexactly(length) if length else b''
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                status, payload = await self.dispatch(method, path.split('?', 1)[0], body)
+                await self.respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, payload, keep_alive=True):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n")
+        if status == 503:
+            head += "Retry-After: 1\r\n"
+        writer.write(head.encode('latin-1') + b'\r\n' + body)
+        await writer.drain()
+
+
+async def serve(server, report_interval=0, reload_interval=0):
+    await server.start()
+    print(f"Sunucu http://{server.host}:{server.port} adresinde çalışıyor", file=sys.stderr, flush=True)
+    if report_interval > 0:
+        server.tasks.append(asyncio.create_task(server.report(report_interval)))
+    if reload_interval > 0:
+        server.tasks.append(asyncio.create_task(server.watch_definition(reload_interval)))
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lastik bakım modelini HTTP üzerinden sunar (POST /score, GET /stats).")
+    parser.add_argument('--host', default='127.0.0.1', help="Dinlenecek adres")
+    parser.add_argument('--port', type=int, default=8080, help="Dinlenecek port")
+    parser.add_argument('--max-batch-size', type=int, default=DEFAULT_MAX_BATCH_SIZE, help="Bir yığındaki en fazla istek")
+    parser.add_argument('--max-wait-ms', type=float, default=DEFAULT_MAX_WAIT_MS,
+                        help="Yığın dolmadan önce ilk isteğin en fazla bekleme süresi (ms)")
+    parser.add_argument('--max-pending', type=int, default=DEFAULT_MAX_PENDING,
+                        help="Aynı anda işlenen en fazla istek; aşılırsa 503 döner")
+    parser.add_argument('--report-interval', type=float, default=10.0, help="İstatistik yazdırma aralığı (sn, 0: kapalı)")
+    parser.add_argument('--definition', help="JSON/YAML sistem tanımı (varsayılan: tire_system.json)")
+    parser.add_argument('--reload-interval', type=float, default=1.0,
+                        help="Tanım dosyası değişikliklerini denetleme aralığı (sn, 0: kapalı)")
+    parser.add_argument('--lookup', action='store_true', help="Önceden hesaplanmış tabloyu kullan")
+    parser.add_argument('--analytic', action='store_true', help="Üçgen çıktı kümeleri için kapalı biçim centroid kullan")
+    args = parser.parse_args(argv)
+
+    system = TireFuzzySystem(defuzzify='analytic' if args.analytic else 'sampled', definition=args.definition)
+    if args.lookup:
+        system.enable_lookup(progress=report_lookup_progress)
+    server = ScoringServer(system, args.host, args.port, args.max_batch_size, args.max_wait_ms, args.max_pending)
+    try:
+        asyncio.run(serve(server, args.report_interval, args.reload_interval))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+import json
+import os
+import subprocess
+import sys
+
+# Soğuk başlangıç bütçeleri (saniye); ölçümler her seferinde yeni bir Python işleminde yapılır
+STARTUP_BUDGETS = {
+    'import_fuzzy_system': 0.5,
+    'cold_start': 0.75,
+    'import_final': 0.75
+}
+
+# Arayüzsüz çıkarım yolunda yüklenmemesi gereken modüller
+HEADLESS_FORBIDDEN = ('tkinter', 'matplotlib', 'skfuzzy', 'scipy')
+# Arayüz modülü içe aktarılırken henüz yüklenmemesi gereken modüller
+GUI_DEFERRED = ('matplotlib', 'skfuzzy', 'scipy', 'fleet_cli', 'parallel_scoring')
+
+MEASURE_HEADLESS = """
+import json, sys, time
+start = time.perf_counter()
+import fuzzy_system
+imported = time.perf_counter()
+system = fuzzy_system.TireFuzzySystem()
+system.compute(system.default_values)
+ready = time.perf_counter()
+print(json.dumps({
+    'import_fuzzy_system': imported - start,
+    'cold_start': ready - start,
+    'modules': sorted(m for m in sys.modules if m.split('.')[0] in %r)
+}))
+"""
+
+MEASURE_GUI = """
+import json, sys, time
+start = time.perf_counter()
+import final
+imported = time.perf_counter()
+print(json.dumps({
+    'import_final': imported - start,
+    'modules': sorted(m for m in sys.modules if m.split('.')[0] in %r)
+}))
+"""
+
+
+def run_measurement(code, repeats=3):
+    # İlk çalıştırma disk önbelleğini ısıtır; en iyi sonuç kullanılır
+    here = os.path.dirname(os.path.abspath(__file__))
+    results = []
+    for _ in range(repeats + 1):
+        output = subprocess.run([sys.executable, '-c', code], cwd=here, capture_output=True, text=True, check=True)
+        results.append(json.loads(output.stdout))
+    best = dict(results[-1])
+    for key in best:
+        if key != 'modules':
+            best[key] = min(result[key] for result in results[1:])
+    return best
+
+
+def check_startup(repeats=3):
+    failures = []
+    headless = run_measurement(MEASURE_HEADLESS % (HEADLESS_FORBIDDEN,), repeats)
+    gui = run_measurement(MEASURE_GUI % (GUI_DEFERRED,), repeats)
+
+    timings = {key: value for result in (headless, gui) for key, value in result.items() if key != 'modules'}
+    for key, budget in STARTUP_BUDGETS.items():
+        if timings[key] > budget:
+            failures.append(f"{key}: {timings[key]:.3f} sn > bütçe {budget:.3f} sn")
+    if headless['modules']:
+        failures.append(f"Arayüzsüz çıkarım yüklememesi gereken modülleri yükledi: {', '.join(headless['modules'])}")
+    if gui['modules']:
+        failures.append(f"final.py içe aktarılırken ertelenmesi gereken modüller yüklendi: {', '.join(gui['modules'])}")
+    return timings, failures
+
+
+def main():
+    timings, failures = check_startup()
+    for key, value in timings.items():
+        print(f"{key:<22} {value:.3f} sn (bütçe {STARTUP_BUDGETS[key]:.3f} sn)")
+    for failure in failures:
+        print(f"HATA: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
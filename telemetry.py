@@ -0,0 +1,312 @@
+import argparse
+import csv
+import heapq
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+from fleet_store import FleetStore
+from fuzzy_engine import INPUT_NAMES, OUTPUT_NAMES
+from fuzzy_system import TireFuzzySystem
+
+# Günlük girdiler (kullanım süresi, ortalama hız) son 24 saatlik kayan pencereden hesaplanır
+WINDOW_SECONDS = 24 * 3600
+# Örnekler arasında bundan uzun boşluklar (kayıt kesintisi) kullanım süresine sayılmaz
+MAX_GAP_SECONDS = 300
+# Bu hızın altındaki aralıklar park halinde sayılır (km/s)
+MOVING_SPEED = 1.0
+# Üyelik dereceleri bundan fazla değişmediyse lastik yeniden puanlanmaz
+MEMBERSHIP_TOLERANCE = 1e-3
+
+LOG_COLUMNS = ['timestamp', 'tire_id', 'speed', 'pressure', 'temperature', 'road_type']
+UPDATE_COLUMNS = ['timestamp', 'tire_id'] + list(INPUT_NAMES) + list(OUTPUT_NAMES)
+
+
+class TireAggregate:
+    def __init__(self, road_type, window=WINDOW_SECONDS):
+        self.window = window
+        self.entries = deque()
+        self.last = None
+        self.last_road_type = road_type
+        self.moving_seconds = 0.0
+        self.distance = 0.0
+        self.road_seconds = 0.0
+        self.temperature_sum = 0.0
+        self.pressure_sum = 0.0
+
+    def add(self, timestamp, speed, pressure, temperature, road_type=None):
+        # Örnek başına sabit iş: yeni örnek toplamlara eklenir, pencereden çıkanlar çıkarılır (amortize O(1))
+        if road_type is None:
+            road_type = self.last_road_type
+        self.last_road_type = road_type
+
+        moving = distance = road = 0.0
+        if self.last is not None:
+            dt = timestamp - self.last[0]
+            segment_speed = 0.5 * (self.last[1] + speed)
+            if 0 < dt <= MAX_GAP_SECONDS and segment_speed > MOVING_SPEED:
+                moving = dt
+                distance = segment_speed * dt / 3600.0
+                road = road_type * dt
+        self.last = (timestamp, speed)
+
+        entry = (timestamp, moving, distance, road, temperature, pressure)
+        self.entries.append(entry)
+        self.update(entry, 1.0)
+        while self.entries[0][0] <= timestamp - self.window:
+            self.update(self.entries.popleft(), -1.0)
+
+    def update(self, entry, sign):
+        _, moving, distance, road, temperature, pressure = entry
+        self.moving_seconds += sign * moving
+        self.distance += sign * distance
+        self.road_seconds += sign * road
+        self.temperature_sum += sign * temperature
+        self.pressure_sum += sign * pressure
+
+    def inputs(self):
+        count = len(self.entries)
+        # Çıkarma ile biriken kayan nokta hatası sıfırın altına düşmesin
+        hours = max(self.moving_seconds, 0.0) / 3600.0
+        moving = hours > 1e-9
+        return {
+            'usage_time': hours,
+            'road_type': self.road_seconds / self.moving_seconds if moving else self.last_road_type,
+            'temperature': self.temperature_sum / count,
+            'average_speed': max(self.distance, 0.0) / hours if moving else 0.0,
+            'tire_pressure': self.pressure_sum / count
+        }
+
+
+class TelemetryIngestor:
+    def __init__(self, system, window=WINDOW_SECONDS, tolerance=MEMBERSHIP_TOLERANCE):
+        self.system = system
+        self.window = window
+        self.tolerance = tolerance
+        self.tires = {}
+        self.dirty = set()
+        self.memberships = {}
+        self.results = {}
+        self.samples = 0
+        self.flushes = 0
+        self.rescored = 0
+        self.skipped = 0
+
+    def add_sample(self, tire_id, timestamp, speed, pressure, temperature, road_type=None):
+        aggregate = self.tires.get(tire_id)
+        if aggregate is None:
+            aggregate = self.tires[tire_id] = TireAggregate(self.system.default_values['road_type'], self.window)
+        aggregate.add(timestamp, speed, pressure, temperature, road_type)
+        self.dirty.add(tire_id)
+        self.samples += 1
+
+    def flush(self):
+        # Son flush'tan beri örnek alan lastikler toplu olarak bulanıklaştırılır; yalnızca üyelik dereceleri
+        # değişenler puanlanır (çıktılar girdilere yalnızca üyelik dereceleri üzerinden bağlıdır)
+        if not self.dirty:
+            return []
+        self.flushes += 1
+        tire_ids = list(self.dirty)
+        self.dirty.clear()
+        rows = [self.tires[tire_id].inputs() for tire_id in tire_ids]
+        inputs = {name: np.array([row[name] for row in rows]) for name in INPUT_NAMES}
+
+        engine = self.system.engine
+        memberships = engine.fuzzify({name: inputs[name] for name in engine.antecedents})[:, :len(engine.term_columns)]
+        previous = np.array([self.memberships.get(tire_id, np.full(memberships.shape[1], np.nan))
+                             for tire_id in tire_ids])
+        with np.errstate(invalid='ignore'):
+            unchanged = np.abs(memberships - previous).max(axis=1) <= self.tolerance
+        changed = np.flatnonzero(~unchanged)
+        self.skipped += len(tire_ids) - len(changed)
+        if not len(changed):
+            return []
+
+        outputs = self.system.compute_batch({name: values[changed] for name, values in inputs.items()})
+        updates = []
+        for j, i in enumerate(changed):
+            tire_id = tire_ids[i]
+            self.memberships[tire_id] = memberships[i]
+            result = {name: float(outputs[name][j]) for name in OUTPUT_NAMES}
+            self.results[tire_id] = (rows[i], result)
+            updates.append((tire_id, rows[i], result))
+        self.rescored += len(changed)
+        return updates
+
+    def stats(self):
+        return {
+            'tires': len(self.tires),
+            'samples': self.samples,
+            'flushes': self.flushes,
+            'rescored': self.rescored,
+            'skipped': self.skipped
+        }
+
+
+def read_log(log_file):
+    # Kayıt zamana göre sıralı olmalıdır; road_type sütunu isteğe bağlıdır
+    reader = csv.DictReader(log_file)
+    missing = [name for name in LOG_COLUMNS[:-1] if name not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"Eksik sütunlar: {', '.join(missing)}")
+    for line, row in enumerate(reader, 2):
+        try:
+            road_type = row.get('road_type')
+            yield (float(row['timestamp']), row['tire_id'], float(row['speed']), float(row['pressure']),
+                   float(row['temperature']), float(road_type) if road_type not in (None, '') else None)
+        except (TypeError, ValueError):
+            raise ValueError(f"Satır {line}: geçersiz telemetri örneği: {row}")
+
+
+def replay(ingestor, samples, speed=3600.0, flush_interval=60.0, on_updates=None,
+           clock=time.monotonic, sleep=time.sleep):
+    # Kayıt, gerçek zamanın speed katı hızında oynatılır (speed <= 0: beklemeden).
+    # Yeniden puanlama kayıt zamanında her flush_interval saniyede bir toplu yapılır.
+    first = start = next_flush = None
+    timestamp = None
+    for timestamp, tire_id, tire_speed, pressure, temperature, road_type in samples:
+        if first is None:
+            first, start, next_flush = timestamp, clock(), timestamp + flush_interval
+        if timestamp >= next_flush:
+            updates = ingestor.flush()
+            if on_updates is not None and updates:
+                on_updates(next_flush, updates)
+            next_flush = timestamp + flush_interval
+        if speed > 0:
+            delay = (timestamp - first) / speed - (clock() - start)
+            if delay > 0:
+                sleep(delay)
+        ingestor.add_sample(tire_id, timestamp, tire_speed, pressure, temperature, road_type)
+
+    updates = ingestor.flush()
+    if on_updates is not None and updates:
+        on_updates(timestamp, updates)
+
+
+def generate_log(output_file, tires=20, hours=48.0, interval=10.0, seed=0, start=0.0):
+    # Test için sentetik kayıt: lastik başına günlük seyahatler, yavaş basınç kaybı ve gün içi sıcaklık
+    rng = np.random.default_rng(seed)
+    end = start + hours * 3600.0
+
+    def tire_samples(index):
+        tire_id = f"T{index}"
+        pressure = rng.uniform(26, 36)
+        leak = rng.uniform(0, 0.1) / 3600.0
+        road_type = float(rng.integers(0, 11))
+        cruise = rng.uniform(30, 150)
+        daily_trips = rng.integers(1, 5)
+        samples = []
+        day = start
+        while day < end:
+            trips = np.sort(rng.uniform(day, day + 86400.0, daily_trips))
+            for trip_start in trips:
+                duration = rng.uniform(0.25, 2.5) * 3600.0
+                t = trip_start
+                while t < min(trip_start + duration, end):
+                    samples.append((t, max(0.0, rng.normal(cruise, 10.0))))
+                    t += interval
+                samples.append((t, 0.0))
+            day += 86400.0
+        # Park halinde on dakikada bir durum örneği
+        samples += [(t, 0.0) for t in np.arange(start, end, 600.0)]
+        samples.sort()
+        for t, speed in samples:
+            if t >= end:
+                break
+            temperature = 15 + 10 * np.sin(2 * np.pi * (t % 86400.0) / 86400.0) + rng.normal(0, 0.5)
+            yield (round(t, 1), tire_id, round(speed, 1), round(pressure - leak * (t - start), 2),
+                   round(temperature, 1), road_type)
+
+    writer = csv.writer(output_file)
+    writer.writerow(LOG_COLUMNS)
+    count = 0
+    for sample in heapq.merge(*[tire_samples(i) for i in range(tires)]):
+        writer.writerow(sample)
+        count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lastik telemetrisini akış halinde toplar ve değişen lastikleri yeniden puanlar.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    replay_parser = commands.add_parser('replay', help="Kaydedilmiş telemetriyi hızlandırılmış olarak oynat")
+    replay_parser.add_argument('log', help="Telemetri CSV kaydı ('-' standart girdi)")
+    replay_parser.add_argument('--speed', type=float, default=3600.0, help="Gerçek zamana göre oynatma hızı (0: beklemeden)")
+    replay_parser.add_argument('--flush-interval', type=float, default=60.0, help="Yeniden puanlama aralığı (kayıt saniyesi)")
+    replay_parser.add_argument('--window', type=float, default=WINDOW_SECONDS, help="Kayan pencere uzunluğu (sn)")
+    replay_parser.add_argument('--tolerance', type=float, default=MEMBERSHIP_TOLERANCE,
+                               help="Yeniden puanlama için en küçük üyelik derecesi değişimi")
+    replay_parser.add_argument('--output', help="Puan güncellemelerinin yazılacağı CSV dosyası")
+    replay_parser.add_argument('--store', metavar='DIR', help="Puan güncellemelerini bu filo deposuna da ekle")
+    replay_parser.add_argument('--definition', help="JSON/YAML sistem tanımı (varsayılan: tire_system.json)")
+    replay_parser.add_argument('--quiet', action='store_true', help="Özet dışında bilgi gösterme")
+
+    generate_parser = commands.add_parser('generate', help="Test için sentetik telemetri kaydı üret")
+    generate_parser.add_argument('output', help="Çıktı CSV dosyası ('-' standart çıktı)")
+    generate_parser.add_argument('--tires', type=int, default=20, help="Lastik sayısı")
+    generate_parser.add_argument('--hours', type=float, default=48.0, help="Kayıt süresi (saat)")
+    generate_parser.add_argument('--interval', type=float, default=10.0, help="Seyir halinde örnekleme aralığı (sn)")
+    generate_parser.add_argument('--seed', type=int, default=0, help="Rastgele tohum")
+    args = parser.parse_args(argv)
+
+    if args.command == 'generate':
+        output_file = sys.stdout if args.output == '-' else open(args.output, 'w', newline='', encoding='utf-8')
+        try:
+            count = generate_log(output_file, args.tires, args.hours, args.interval, args.seed)
+        finally:
+            if output_file is not sys.stdout:
+                output_file.close()
+        print(f"{count} örnek yazıldı", file=sys.stderr)
+        return 0
+
+    try:
+        system = TireFuzzySystem(definition=args.definition)
+        store = FleetStore(args.store) if args.store else None
+    except (OSError, ValueError) as e:
+        print(f"Hata oluştu: {e}", file=sys.stderr)
+        return 1
+    ingestor = TelemetryIngestor(system, window=args.window, tolerance=args.tolerance)
+    log_file = sys.stdin if args.log == '-' else open(args.log, newline='', encoding='utf-8')
+    output_file = open(args.output, 'w', newline='', encoding='utf-8') if args.output else None
+    writer = None
+    if output_file is not None:
+        writer = csv.writer(output_file)
+        writer.writerow(UPDATE_COLUMNS)
+
+    def on_updates(timestamp, updates):
+        if store is not None:
+            store.append([tire_id for tire_id, _, _ in updates],
+                         {name: [inputs[name] for _, inputs, _ in updates] for name in INPUT_NAMES},
+                         {name: [outputs[name] for _, _, outputs in updates] for name in OUTPUT_NAMES}, timestamp)
+        for tire_id, inputs, outputs in updates:
+            if writer is not None:
+                writer.writerow([timestamp, tire_id] + [f"{inputs[name]:.3f}" for name in INPUT_NAMES] +
+                                ['' if np.isnan(outputs[name]) else f"{outputs[name]:.2f}" for name in OUTPUT_NAMES])
+        if not args.quiet:
+            print(f"t={timestamp:.0f}: {len(updates)} lastik yeniden puanlandı", file=sys.stderr)
+
+    start = time.perf_counter()
+    try:
+        replay(ingestor, read_log(log_file), args.speed, args.flush_interval, on_updates)
+    except ValueError as e:
+        print(f"Hata oluştu: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if log_file is not sys.stdin:
+            log_file.close()
+        if output_file is not None:
+            output_file.close()
+
+    elapsed = time.perf_counter() - start
+    stats = ingestor.stats()
+    print(f"{stats['samples']} örnek, {stats['tires']} lastik, {elapsed:.1f} sn "
+          f"({stats['samples'] / max(elapsed, 1e-9):.0f} örnek/sn); {stats['flushes']} toplu değerlendirme, "
+          f"{stats['rescored']} yeniden puanlama, {stats['skipped']} atlandı (üyelikler değişmedi)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+import copy
+import json
+
+import pytest
+
+from fuzzy_definition import (DEFAULT_DEFINITION, build_definition, definition_hash, load_compiled, parse_antecedent,
+                              read_definition, validate_definition)
+
+
+@pytest.fixture(scope='module')
+def definition():
+    with open(DEFAULT_DEFINITION, encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope='module')
+def variables(definition):
+    return build_definition(definition)['variables']
+
+
+@pytest.mark.parametrize('expression, expected', [
+    # ~ > & > |, soldan birleşmeli
+    ("usage_time[low] | road_type[soft] & temperature[cold]",
+     "usage_time[low] OR (road_type[soft] AND temperature[cold])"),
+    ("usage_time[low] & road_type[soft] | temperature[cold]",
+     "(usage_time[low] AND road_type[soft]) OR temperature[cold]"),
+    ("(usage_time[low] | road_type[soft]) & temperature[cold]",
+     "(usage_time[low] OR road_type[soft]) AND temperature[cold]"),
+    ("~usage_time[low] & road_type[soft]", "(NOT-usage_time[low]) AND road_type[soft]"),
+    ("~(usage_time[low] & road_type[soft])", "NOT-(usage_time[low] AND road_type[soft])"),
+    ("usage_time[low] | road_type[soft] | temperature[cold]",
+     "(usage_time[low] OR road_type[soft]) OR temperature[cold]"),
+])
+def test_antecedent_precedence(variables, expression, expected):
+    assert str(parse_antecedent(expression, variables)) == expected
+
+
+@pytest.mark.parametrize('expression, message', [
+    ("(usage_time[low] & road_type[soft]", "kapanmamış parantez"),
+    ("usage_time[low] & road_type[soft])", "fazla belirteç"),
+    ("usage_time[low] &", "eksik bitiyor"),
+    ("usage_time[ancient]", "bilinmeyen terim"),
+    ("wheel_size[low]", "yalnızca girdileri"),
+    ("maintenance_priority[low]", "yalnızca girdileri"),
+    ("usage_time[low] + road_type[soft]", "çözümlenemedi"),
+])
+def test_antecedent_errors(variables, expression, message):
+    with pytest.raises(ValueError, match=message):
+        parse_antecedent(expression, variables)
+
+
+def modified(definition, change):
+    definition = copy.deepcopy(definition)
+    change(definition)
+    return definition
+
+
+@pytest.mark.parametrize('change', [
+    lambda d: d['inputs']['usage_time'].update(universe="0,10,1"),
+    lambda d: d['inputs']['usage_time'].update(universe=["0", 10, 1]),
+    lambda d: d['inputs']['usage_time'].update(universe=[0, 10, 20]),
+    lambda d: d['inputs']['usage_time'].update(universe=[10, 0, 1]),
+    lambda d: d['inputs']['usage_time']['terms'].update(low="0,0,3"),
+    lambda d: d['inputs']['usage_time']['terms'].update(low=[3, 0, 0]),
+    lambda d: d['outputs']['maintenance_priority']['terms'].update(high=[7, 10, 12]),
+    lambda d: d['rules'][0].update({'if': 5}),
+    lambda d: d['rules'][0].update(then={'maintenance_priority': 'low'}),
+    lambda d: d['rules'][0].update(then=3),
+    lambda d: d['rules'][0].update(weight=-1),
+    lambda d: d['rules'][0].update(weight=True),
+    lambda d: d.update(defaults={'usage_time': "5"}),
+    lambda d: d.update(defaults={'usage_time': 50}),
+    lambda d: d.update(defaults={'wheel_size': 5}),
+    lambda d: d['inputs'].pop('usage_time'),
+    lambda d: d.update(rules=[]),
+])
+def test_validation_rejects_with_value_error(definition, change):
+    with pytest.raises(ValueError):
+        validate_definition(modified(definition, change))
+
+
+def test_round_trip_keeps_fingerprint(definition, tmp_path):
+    # Biçimlendirme ve anahtar sırası önemsizdir: aynı içerik aynı motoru ve özeti verir
+    original = build_definition(definition)['engine'].fingerprint()
+    path = tmp_path / 'system.json'
+    reordered = {key: definition[key] for key in reversed(list(definition))}
+    path.write_text(json.dumps(reordered, indent=4, ensure_ascii=False), encoding='utf-8')
+
+    reread = read_definition(str(path))
+    assert definition_hash(reread) == definition_hash(definition)
+    assert build_definition(reread)['engine'].fingerprint() == original
+    compiled = load_compiled(str(path), cache_dir=str(tmp_path))
+    assert compiled['engine'].fingerprint() == original
+    # İkinci yükleme önbellekten gelir
+    assert load_compiled(str(path), cache_dir=str(tmp_path))['engine'].fingerprint() == original
+
+
+def test_yaml_matches_json(definition, tmp_path):
+    yaml = pytest.importorskip('yaml')
+    path = tmp_path / 'system.yaml'
+    path.write_text(yaml.safe_dump(definition, allow_unicode=True), encoding='utf-8')
+    assert definition_hash(read_definition(str(path))) == definition_hash(definition)
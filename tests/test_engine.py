@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from fuzzy_engine import (INPUT_NAMES, OUTPUT_NAMES, TOLERANCE, VectorizedEngine, analytic_centroid_rows,
+                          centroid_rows, triangle_rows)
+from fuzzy_system import TireFuzzySystem
+
+ROWS = 300
+
+# skfuzzy 0.5, numpy 2 ile np.maximum kullanımı için uyarı verir
+pytestmark = pytest.mark.filterwarnings('ignore::DeprecationWarning')
+
+
+@pytest.fixture(scope='module')
+def system():
+    return TireFuzzySystem()
+
+
+def random_inputs(system, seed):
+    # Evrenin biraz dışına taşan sürekli değerler ve kaydırıcı ızgarası karışık; hiçbir kuralın
+    # ateşlenmediği (NaN) satırlar da oluşur
+    rng = np.random.default_rng(seed)
+    inputs = {}
+    for name in INPUT_NAMES:
+        universe = system.engine.antecedents[name][0]
+        low, high = float(universe[0]), float(universe[-1])
+        margin = (high - low) * 0.05
+        values = rng.uniform(low - margin, high + margin, ROWS)
+        grid = rng.random(ROWS) < 0.5
+        values[grid] = rng.choice(universe, grid.sum())
+        inputs[name] = values
+    return inputs
+
+
+def skfuzzy_outputs(system, inputs):
+    simulation = system.simulation
+    reference = {name: np.full(ROWS, np.nan) for name in OUTPUT_NAMES}
+    for i in range(ROWS):
+        for name in INPUT_NAMES:
+            simulation.input[name] = inputs[name][i]
+        simulation.compute()
+        for name in OUTPUT_NAMES:
+            reference[name][i] = simulation.output.get(name, np.nan)
+    return reference
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_compute_matches_skfuzzy(system, seed):
+    inputs = random_inputs(system, seed)
+    outputs = system.engine.compute(inputs)
+    reference = skfuzzy_outputs(system, inputs)
+
+    for name in OUTPUT_NAMES:
+        missing = np.isnan(reference[name])
+        np.testing.assert_array_equal(np.isnan(outputs[name]), missing, err_msg=name)
+        np.testing.assert_allclose(outputs[name][~missing], reference[name][~missing], rtol=0, atol=TOLERANCE,
+                                   err_msg=name)
+
+
+def test_inputs_include_unfired_rows(system):
+    # Karşılaştırma, hiçbir kuralın ateşlenmediği satırları da kapsamalıdır
+    outputs = system.engine.compute(random_inputs(system, 0))
+    assert np.isnan(outputs['maintenance_priority']).any()
+    assert not np.isnan(outputs['maintenance_priority']).all()
+
+
+def test_compute_broadcasts_scalars(system):
+    inputs = random_inputs(system, 2)
+    fixed = dict(inputs, usage_time=5.0)
+    outputs = system.engine.compute(fixed)
+    expected = system.engine.compute(dict(inputs, usage_time=np.full(ROWS, 5.0)))
+    for name in OUTPUT_NAMES:
+        np.testing.assert_array_equal(outputs[name], expected[name])
+
+
+
+# Çok ince (0.001) örneklenmiş centroid ile analitik centroid arasındaki izin verilen en büyük fark;
+# örnekleme hatası kırılma noktalarında adımın karesi mertebesindedir (gözlenen en büyük ~2e-6)
+FINE_STEP = 0.001
+ANALYTIC_TOLERANCE = 1e-5
+
+
+def fine_centroid(universe, abcs, cuts):
+    # Kırpılmış üçgenlerin maksimumu ince ızgarada örneklenir; satır satır, bellek sınırlı kalır
+    x = np.arange(universe[0], universe[-1] + FINE_STEP / 2, FINE_STEP)
+    mfs = np.array([triangle_rows(x, a, b, c) for a, b, c in abcs])
+    result = np.empty(len(cuts))
+    for i, row in enumerate(cuts):
+        aggregated = np.minimum(row[:, None], mfs).max(axis=0)
+        result[i] = centroid_rows(x[None, :], aggregated[None, :])[0]
+    return result
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_analytic_centroid_matches_fine_sampling(system, seed):
+    # Rastgele girdiler ve rastgele kural ağırlıkları: kesim seviyeleri ağırlıklı ateşlemelerin maksimumudur
+    rng = np.random.default_rng(seed)
+    weights = rng.uniform(0.1, 1.0, len(system.rule_weights)).tolist()
+    engine = VectorizedEngine(system.control_system, rule_weights=weights, defuzzify='analytic')
+    firings = engine.evaluate_rules(engine.fuzzify(random_inputs(system, seed)))
+
+    for name in OUTPUT_NAMES:
+        universe = engine.consequents[name][0]
+        abcs = engine.consequent_triangles[name]
+        cuts = (firings[:, :, None] * engine.consequent_weights[name]).max(axis=1, initial=0.0)
+        exact = analytic_centroid_rows(universe, abcs, cuts)
+        reference = fine_centroid(universe, abcs, cuts)
+        missing = np.isnan(reference)
+        assert 0 < missing.sum() < len(missing)
+        np.testing.assert_array_equal(np.isnan(exact), missing, err_msg=name)
+        np.testing.assert_allclose(exact[~missing], reference[~missing], rtol=0, atol=ANALYTIC_TOLERANCE,
+                                   err_msg=name)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from fleet_store import CHANGE_THRESHOLD, FleetStore
+from fuzzy_engine import INPUT_NAMES, OUTPUT_NAMES
+
+
+def random_batch(rng, size, tire_count):
+    tire_ids = [f"T{i}" for i in rng.integers(0, tire_count, size)]
+    inputs = {name: rng.uniform(0, 10, size) for name in INPUT_NAMES}
+    # Eşitlikler ve hesaplanamayan (NaN) çıktılar sıralamayı zorlar
+    outputs = {name: rng.integers(0, 101, size).astype(float) for name in OUTPUT_NAMES}
+    for values in outputs.values():
+        values[rng.random(size) < 0.1] = np.nan
+    return tire_ids, inputs, outputs
+
+
+def brute_force(history):
+    # Lastik başına en güncel satır; değerler depodaki gibi float32
+    latest = {}
+    for row, (tire_id, priority, probability) in enumerate(history):
+        latest[tire_id] = (row, np.float32(priority), np.float32(probability))
+    top = sorted(((-priority, row) for row, priority, _ in latest.values() if not np.isnan(priority)))
+    change = sorted(((-probability, row) for row, _, probability in latest.values() if probability >= CHANGE_THRESHOLD))
+    return len(latest), [row for _, row in top], [row for _, row in change]
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_queries_match_brute_force_across_appends(tmp_path, seed):
+    rng = np.random.default_rng(seed)
+    # İki yazar aynı depoya sırayla ekler; her biri diğerinin satırlarına yetişmelidir
+    writers = [FleetStore(str(tmp_path)), FleetStore(str(tmp_path))]
+    history = []
+    for step in range(25):
+        size = int(rng.choice([1, 3, 40, 200]))
+        tire_ids, inputs, outputs = random_batch(rng, size, tire_count=150)
+        writers[step % 2].append(tire_ids, inputs, outputs)
+        history += zip(tire_ids, outputs['maintenance_priority'], outputs['change_probability'])
+
+        count, top, change = brute_force(history)
+        for store in writers + [FleetStore(str(tmp_path), readonly=True)]:
+            assert len(store) == count
+            assert store.top_priority(20) == top[:20]
+            assert store.change_at_least(CHANGE_THRESHOLD) == change
+
+    # Parçalar birleştirildiğinden sayıları satır sayısına göre logaritmik kalır
+    runs = writers[0].runs['maintenance_priority']
+    assert len(runs) <= 2 * np.log2(len(history)) + 1
+    assert sum(stop - start for start, stop, _ in runs) == len(history)
+
+
+def test_records_return_latest_values(tmp_path):
+    store = FleetStore(str(tmp_path))
+    inputs = {name: [1.0] for name in INPUT_NAMES}
+    store.append(['A'], inputs, {'maintenance_priority': [9.0], 'change_probability': [90.0]})
+    store.append(['A'], inputs, {'maintenance_priority': [2.0], 'change_probability': [10.0]})
+    store.append(['B'], inputs, {'maintenance_priority': [5.0], 'change_probability': [75.0]})
+
+    assert [record.tire_id for record in store.records(store.top_priority(10))] == ['B', 'A']
+    assert [record.tire_id for record in store.records(store.change_at_least())] == ['B']
+    assert store.record(store.top_priority(10)[1]).outputs['maintenance_priority'] == 2.0
@@ -0,0 +1,64 @@
+import os
+
+import numpy as np
+import pytest
+
+from fuzzy_system import TireFuzzySystem
+from lookup_table import LookupTable
+
+# Testler için kaba ızgara (tam ızgara ~5,7 milyon hücre)
+STEPS = {'usage_time': 5, 'road_type': 5, 'temperature': 25, 'average_speed': 50, 'tire_pressure': 10}
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return TireFuzzySystem().engine
+
+
+@pytest.fixture(scope='module')
+def table(engine, tmp_path_factory):
+    return LookupTable(engine, STEPS, cache_dir=str(tmp_path_factory.mktemp('lookup'))).load(workers=1)
+
+
+def grid_points(table):
+    meshes = np.meshgrid(*table.grids, indexing='ij')
+    return {name: mesh.ravel() for name, mesh in zip(table.input_names, meshes)}
+
+
+def test_on_grid_lookup_matches_engine(engine, table):
+    inputs = grid_points(table)
+    expected = engine.compute(inputs)
+    result = table.lookup(inputs)
+    for name in table.output_names:
+        # Tablo float32 saklar; NaN hücrelerde motor da NaN döner
+        np.testing.assert_allclose(result[name], expected[name], rtol=1e-6, atol=1e-4)
+
+
+def test_nan_corner_falls_back_to_engine(engine, table):
+    # NaN köşesine dayanan bir hücrenin ortasındaki nokta tablodan değil, motordan hesaplanır
+    invalid = np.isnan(table.table).any(axis=-1)
+    corners = np.argwhere(invalid[:-1, :-1, :-1, :-1, :-1])
+    inputs = {name: (grid[:-1] + grid[1:])[corners[:, axis]] / 2.0
+              for axis, (name, grid) in enumerate(zip(table.input_names, table.grids))}
+    expected = engine.compute(inputs)
+    # Orta noktada motorun hesaplayabildiği hücreler; interpolasyon burada NaN verirdi
+    computable = ~np.isnan(expected['maintenance_priority'])
+    assert computable.any()
+    result = table.lookup(inputs)
+    for name in table.output_names:
+        np.testing.assert_array_equal(result[name][computable], expected[name][computable])
+
+
+def test_parallel_build_matches_serial(engine, table, tmp_path):
+    parallel = LookupTable(engine, STEPS, cache_dir=str(tmp_path)).load(workers=2)
+    np.testing.assert_array_equal(parallel.table, table.table)
+
+
+def test_cancelled_build_leaves_no_file(engine, tmp_path):
+    def cancel(done, total):
+        raise RuntimeError("durduruldu")
+
+    lookup = LookupTable(engine, STEPS, cache_dir=str(tmp_path))
+    with pytest.raises(RuntimeError):
+        lookup.load(progress=cancel, workers=1)
+    assert os.listdir(str(tmp_path)) == []
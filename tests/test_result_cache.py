@@ -0,0 +1,84 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import fuzzy_definition
+from fuzzy_system import TireFuzzySystem
+from result_cache import ResultCache
+
+
+@pytest.fixture
+def system(tmp_path, monkeypatch):
+    # Derlenmiş sistem önbelleği ve tanım geçici dizinde
+    monkeypatch.setattr(fuzzy_definition, 'CACHE_DIR', str(tmp_path / 'cache'))
+    path = tmp_path / 'system.json'
+    with open(fuzzy_definition.DEFAULT_DEFINITION, encoding='utf-8') as f:
+        path.write_text(f.read(), encoding='utf-8')
+    return TireFuzzySystem(definition=str(path))
+
+
+def rewrite(path, change):
+    definition = json.loads(path.read_text(encoding='utf-8'))
+    change(definition)
+    path.write_text(json.dumps(definition, indent=4), encoding='utf-8')
+    # Değişiklik aynı zaman damgasına denk gelse bile algılansın
+    stat = os.stat(str(path))
+    os.utime(str(path), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def test_lru_eviction():
+    cache = ResultCache(maxsize=3)
+    for name in 'abc':
+        cache.put(name, {'value': name})
+    assert cache.get('a') == {'value': 'a'}
+    cache.put('d', {'value': 'd'})
+    # En uzun süre kullanılmayan 'b' çıkarılır; 'a' yeni kullanıldığı için kalır
+    assert cache.get('b') is None
+    assert [cache.contains(name) for name in 'acd'] == [True, True, True]
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['size'] == 3
+
+
+def test_keys_snap_to_slider_steps():
+    key = ResultCache.make_key({'average_speed': 45, 'usage_time': 3})
+    assert ResultCache.make_key({'usage_time': 3.0000000000004, 'average_speed': 44.99999999999}) == key
+    # Izgara dışı değerler tam değeriyle anahtarlanır
+    assert ResultCache.make_key({'average_speed': 45.4, 'usage_time': 3}) != key
+    assert ResultCache.make_key({'average_speed': 1.0}) != ResultCache.make_key({'average_speed': 5.0})
+
+
+def test_stale_put_is_ignored():
+    cache = ResultCache()
+    cache.bind('old')
+    cache.bind('new')
+    cache.put('key', {'value': 1}, fingerprint='old')
+    assert not cache.contains('key')
+    cache.put('key', {'value': 1}, fingerprint='new')
+    assert cache.contains('key')
+
+
+def test_identical_rebuild_keeps_entries(system):
+    outputs = system.compute(system.default_values)
+    system.create_fuzzy_system()
+    hits = system.cache_stats()['hits']
+    assert system.compute(system.default_values) == outputs
+    assert system.cache_stats()['hits'] == hits + 1
+
+    # Yalnızca biçimi değişen tanım yeniden kurulmaz, önbellek korunur
+    rewrite(Path(system.definition_path), lambda definition: None)
+    assert not system.reload_definition()
+    assert system.cache_stats()['size'] == 1
+
+
+def test_changed_definition_clears_entries(system):
+    system.compute(system.default_values)
+    assert system.cache_stats()['size'] == 1
+
+    def change(definition):
+        definition['rules'][0]['weight'] = 0.5
+
+    rewrite(Path(system.definition_path), change)
+    assert system.reload_definition()
+    assert system.cache_stats()['size'] == 0
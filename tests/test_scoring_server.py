@@ -0,0 +1,105 @@
+import asyncio
+import json
+import threading
+
+import numpy as np
+
+from fuzzy_engine import INPUT_NAMES
+from fuzzy_system import TireFuzzySystem
+from scoring_server import ScoringServer
+
+SYSTEM = TireFuzzySystem()
+VALID = {'usage_time': 9, 'road_type': 7, 'temperature': 21, 'average_speed': 45, 'tire_pressure': 26}
+
+
+class GatedSystem:
+    # Hesaplama, kapı açılana kadar bekler; bu sürede gelen istekler kuyrukta birikir
+    def __init__(self, system):
+        self.system = system
+        self.gate = threading.Event()
+        self.started = threading.Event()
+
+    def compute_batch(self, inputs):
+        self.started.set()
+        self.gate.wait(5)
+        return self.system.compute_batch(inputs)
+
+    def __getattr__(self, name):
+        return getattr(self.system, name)
+
+
+async def request(port, method, path, body=b'', headers=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    head = f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+    for key, value in (headers or {'Content-Length': str(len(body))}).items():
+        head += f"{key}: {value}\r\n"
+    writer.write(head.encode('latin-1') + b'\r\n' + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    status_line, _, payload = response.partition(b'\r\n\r\n')
+    return int(status_line.split(b' ', 2)[1]), json.loads(payload)
+
+
+def run_server(system, test, **options):
+    async def main():
+        server = await ScoringServer(system, port=0, **options).start()
+        try:
+            return await test(server)
+        finally:
+            await server.close()
+    return asyncio.run(main())
+
+
+def test_score_matches_engine():
+    async def test(server):
+        return await request(server.port, 'POST', '/score', json.dumps(VALID).encode())
+
+    status, payload = run_server(SYSTEM, test)
+    expected = SYSTEM.compute_batch({name: np.array([float(VALID[name])]) for name in INPUT_NAMES})
+    assert status == 200
+    assert payload['maintenance_priority'] == expected['maintenance_priority'][0]
+    assert payload['change_probability'] == expected['change_probability'][0]
+    assert payload['priority_level'] == SYSTEM.get_priority_level(payload['maintenance_priority'])
+
+
+def test_malformed_requests_are_rejected():
+    async def test(server):
+        return [
+            await request(server.port, 'POST', '/score', b'{"usage_time": '),
+            await request(server.port, 'POST', '/score', json.dumps({**VALID, 'road_type': 'x'}).encode()),
+            await request(server.port, 'POST', '/score', json.dumps(VALID).encode(), {'Content-Length': '-5'}),
+            await request(server.port, 'POST', '/score', json.dumps(VALID).encode(), {'Content-Length': '1_0'}),
+            await request(server.port, 'GET', '/score')
+        ]
+
+    statuses = [status for status, _ in run_server(SYSTEM, test)]
+    assert statuses == [400, 400, 400, 400, 405]
+
+
+def test_backpressure_and_batching():
+    system = GatedSystem(SYSTEM)
+
+    async def test(server):
+        body = json.dumps(VALID).encode()
+        loop = asyncio.get_running_loop()
+        # İlk istek hesaplamayı meşgul eder; ardından gelen istekler bir sonraki yığında birleşir
+        first = asyncio.create_task(request(server.port, 'POST', '/score', body))
+        await loop.run_in_executor(None, system.started.wait, 5)
+        queued = [asyncio.create_task(request(server.port, 'POST', '/score', body)) for _ in range(3)]
+        while server.batcher.pending < 4:
+            await asyncio.sleep(0.01)
+        rejected = await request(server.port, 'POST', '/score', body)
+        system.gate.set()
+        results = await asyncio.gather(first, *queued)
+        stats = await request(server.port, 'GET', '/stats')
+        return rejected, results, stats
+
+    rejected, results, (_, stats) = run_server(system, test, max_pending=4, max_wait_ms=50)
+    assert rejected[0] == 503
+    assert [status for status, _ in results] == [200] * 4
+    assert stats['rejected'] == 1
+    assert stats['completed'] == 4
+    # Bekleyen üç istek tek yığında hesaplanır
+    assert stats['batches'] == 2
+    assert stats['mean_batch_size'] == 2.0
@@ -0,0 +1,15 @@
+from startup_check import MEASURE_HEADLESS, check_startup, run_measurement
+
+
+def test_startup_within_budget_without_forbidden_modules():
+    # Arayüzsüz çıkarım tkinter/matplotlib/skfuzzy/scipy yüklememeli, final.py içe aktarılırken
+    # matplotlib/skfuzzy/scipy ertelenmelidir
+    timings, failures = check_startup(repeats=1)
+    assert failures == []
+    assert set(timings) == {'import_fuzzy_system', 'cold_start', 'import_final'}
+
+
+def test_measurement_reports_loaded_modules():
+    # Denetimin kendisi: yüklenen bir modül listede görünmelidir
+    result = run_measurement(MEASURE_HEADLESS % (('numpy',),), repeats=1)
+    assert 'numpy' in result['modules']
@@ -0,0 +1,113 @@
+import io
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+from fuzzy_engine import INPUT_NAMES, OUTPUT_NAMES
+from fuzzy_system import TireFuzzySystem
+from telemetry import (MAX_GAP_SECONDS, MOVING_SPEED, TelemetryIngestor, TireAggregate, generate_log, read_log,
+                       replay)
+
+WINDOW = 6 * 3600.0
+
+
+@pytest.fixture(scope='module')
+def system():
+    return TireFuzzySystem()
+
+
+def synthetic_log(seed):
+    log = io.StringIO()
+    generate_log(log, tires=4, hours=20.0, interval=30.0, seed=seed)
+    log.seek(0)
+    return list(read_log(log))
+
+
+def brute_force_inputs(history, timestamp, window, default_road_type):
+    # Penceredeki örnekler baştan toplanır; her aralık, sonundaki örneğe aittir
+    moving_seconds = distance = road_seconds = 0.0
+    temperatures, pressures = [], []
+    road_type = default_road_type
+    for i, (t, speed, pressure, temperature, road) in enumerate(history):
+        road_type = road_type if road is None else road
+        if t <= timestamp - window:
+            continue
+        temperatures.append(temperature)
+        pressures.append(pressure)
+        if i:
+            dt = t - history[i - 1][0]
+            segment_speed = 0.5 * (history[i - 1][1] + speed)
+            if 0 < dt <= MAX_GAP_SECONDS and segment_speed > MOVING_SPEED:
+                moving_seconds += dt
+                distance += segment_speed * dt / 3600.0
+                road_seconds += road_type * dt
+    hours = moving_seconds / 3600.0
+    return {
+        'usage_time': hours,
+        'road_type': road_seconds / moving_seconds if hours > 1e-9 else road_type,
+        'temperature': np.mean(temperatures),
+        'average_speed': distance / hours if hours > 1e-9 else 0.0,
+        'tire_pressure': np.mean(pressures)
+    }
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_window_aggregates_match_brute_force(seed):
+    aggregates = {}
+    histories = defaultdict(list)
+    checked = 0
+    for n, (timestamp, tire_id, speed, pressure, temperature, road_type) in enumerate(synthetic_log(seed)):
+        aggregate = aggregates.setdefault(tire_id, TireAggregate(5.0, WINDOW))
+        aggregate.add(timestamp, speed, pressure, temperature, road_type)
+        histories[tire_id].append((timestamp, speed, pressure, temperature, road_type))
+        # Pencere birkaç kez dolup boşalır; karşılaştırma seyrek aralıklarla yapılır
+        if n % 11 == 0:
+            expected = brute_force_inputs(histories[tire_id], timestamp, WINDOW, 5.0)
+            actual = aggregate.inputs()
+            for name in INPUT_NAMES:
+                assert actual[name] == pytest.approx(expected[name], rel=1e-9, abs=1e-6), name
+            checked += 1
+    assert checked > 50
+
+
+def test_flush_matches_batch_scoring(system):
+    ingestor = TelemetryIngestor(system, window=WINDOW)
+    log = synthetic_log(2)
+    replay(ingestor, log, speed=0, flush_interval=600.0)
+    # Son puanlar, lastiklerin son puanlandığı girdilerle toplu hesaplamayla aynıdır
+    tire_ids = sorted(ingestor.results)
+    assert len(tire_ids) == 4
+    inputs = {name: np.array([ingestor.results[tire_id][0][name] for tire_id in tire_ids]) for name in INPUT_NAMES}
+    expected = system.compute_batch(inputs)
+    for i, tire_id in enumerate(tire_ids):
+        for name in OUTPUT_NAMES:
+            np.testing.assert_array_equal(ingestor.results[tire_id][1][name], expected[name][i])
+    stats = ingestor.stats()
+    assert stats['samples'] == len(log)
+    assert stats['flushes'] > 100
+    assert stats['rescored'] >= len(tire_ids)
+
+
+def test_unchanged_tires_are_not_rescored(system):
+    ingestor = TelemetryIngestor(system, window=WINDOW)
+    # Park halindeki lastiklerin girdileri aynı değerlerle yeni örnek geldiğinde değişmez
+    for tire_id, pressure in (('A', 30.0), ('B', 34.0)):
+        ingestor.add_sample(tire_id, 0.0, 0.0, pressure, 20.0, 3.0)
+    assert [tire_id for tire_id, _, _ in ingestor.flush()] in (['A', 'B'], ['B', 'A'])
+
+    ingestor.add_sample('A', 60.0, 0.0, 30.0, 20.0)
+    assert ingestor.flush() == []
+    assert ingestor.stats()['skipped'] == 1
+
+    # Üyelik derecesi tolerans altında değişen lastik de atlanır; önceki sonuç korunur
+    before = ingestor.results['A']
+    ingestor.add_sample('A', 120.0, 0.0, 30.00001, 20.0)
+    assert ingestor.flush() == []
+    assert ingestor.results['A'] is before
+
+    # Basıncı belirgin biçimde düşen lastik yeniden puanlanır; diğerine dokunulmaz
+    ingestor.add_sample('B', 180.0, 0.0, 22.0, 20.0)
+    updates = ingestor.flush()
+    assert [tire_id for tire_id, _, _ in updates] == ['B']
+    assert ingestor.stats() == {'tires': 2, 'samples': 5, 'flushes': 4, 'rescored': 3, 'skipped': 2}
@@ -0,0 +1,355 @@
+import argparse
+import copy
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+
+from csv_input import parse_inputs
+from fuzzy_definition import DEFAULT_DEFINITION, build_definition, definition_hash, read_definition, validate_definition
+from fuzzy_engine import INPUT_NAMES, aggregate_rows, analytic_centroid_rows, centroid_rows
+
+# Etiket sütunu -> çıktı; etiketler [0, 1] aralığında (ör. bakım gerekti mi, lastik değişti mi)
+LABEL_COLUMNS = {
+    'maintenance_needed': 'maintenance_priority',
+    'replaced': 'change_probability'
+}
+DEFAULT_POPULATION = 24
+DEFAULT_GENERATIONS = 40
+# Mutasyon adımı, parametre aralığının oranı olarak; her nesilde SIGMA_DECAY ile küçülür
+DEFAULT_SIGMA = 0.05
+SIGMA_DECAY = 0.95
+ELITE_FRACTION = 0.25
+# Yazılan tanımla değerlendirilen tanım aynı olsun diye adaylar bu basamağa yuvarlanır
+PARAMETER_DIGITS = 4
+# Bellek kullanımını sınırlamak için veri kümesi bu boyutta dilimlerle değerlendirilir
+EVALUATION_CHUNK = 65536
+
+
+def parameter_layout(definition):
+    # Ayarlanabilir parametreler: [(yol, alt sınır, üst sınır)]. Evren kenarındaki omuz noktaları sabittir,
+    # iç noktalar evren içinde kalır; kural ağırlıkları [0, 1] aralığındadır.
+    layout = []
+    for section in ('inputs', 'outputs'):
+        for name, spec in definition[section].items():
+            start, stop, _ = spec['universe']
+            for term, abc in spec['terms'].items():
+                for i, value in enumerate(abc):
+                    if start < value < stop:
+                        layout.append(((section, name, term, i), start, stop))
+    for i in range(len(definition['rules'])):
+        layout.append((('rules', i), 0.0, 1.0))
+    return layout
+
+
+def read_parameters(definition, layout):
+    values = []
+    for path, _, _ in layout:
+        if path[0] == 'rules':
+            values.append(float(definition['rules'][path[1]].get('weight', 1.0)))
+        else:
+            section, name, term, i = path
+            values.append(float(definition[section][name]['terms'][term][i]))
+    return np.array(values)
+
+
+def make_definition(base, layout, parameters):
+    definition = copy.deepcopy(base)
+    for (path, low, high), value in zip(layout, parameters):
+        value = round(float(np.clip(value, low, high)), PARAMETER_DIGITS)
+        if path[0] == 'rules':
+            definition['rules'][path[1]]['weight'] = value
+        else:
+            section, name, term, i = path
+            definition[section][name]['terms'][term][i] = value
+    # Mutasyon sonrası a <= b <= c korunur
+    for section in ('inputs', 'outputs'):
+        for spec in definition[section].values():
+            for term, abc in spec['terms'].items():
+                spec['terms'][term] = sorted(abc)
+    return definition
+
+
+def unique_rows(values):
+    # np.unique(axis=0) ile aynı sonuç, daha hızlı: sütunlar ayrı ayrı kodlanır, kodlar tek tamsayı anahtarda birleşir
+    key = np.zeros(len(values), dtype=np.int64)
+    radix = 1
+    for column in values.T:
+        levels, codes = np.unique(column, return_inverse=True)
+        radix *= len(levels)
+        if radix >= 2 ** 62:
+            unique, inverse = np.unique(values, axis=0, return_inverse=True)
+            return unique, inverse.ravel()
+        key = key * len(levels) + codes
+    _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+    return values[first], inverse
+
+
+class TuningEvaluator:
+    def __init__(self, inputs, labels, defuzzify='sampled'):
+        # inputs: {girdi: (n,)}, labels: {çıktı: (n,)}; eksik etiketler NaN.
+        # Adaylar, ayarlanan tanımı kullanacak uygulamalarla aynı durulaştırma yöntemiyle puanlanır
+        self.inputs = inputs
+        self.labels = labels
+        self.defuzzify = defuzzify
+        self.rows = len(inputs[INPUT_NAMES[0]])
+
+    def loss(self, definition):
+        # Normalleştirilmiş çıktı ile etiket arasındaki ortalama kare hata (Brier skoru);
+        # hiçbir kuralın ateşlenmediği satırlar kararsız (0.5) tahmin sayılır
+        engine = build_definition(definition, self.defuzzify)['engine']
+        total = count = 0.0
+        for start in range(0, self.rows, EVALUATION_CHUNK):
+            stop = min(start + EVALUATION_CHUNK, self.rows)
+            firings = engine.evaluate_rules(engine.fuzzify({name: self.inputs[name][start:stop]
+                                                            for name in engine.antecedents}))
+            for output, targets in self.labels.items():
+                targets = targets[start:stop]
+                universe, _, mfs = engine.consequents[output]
+                cuts = (firings[:, :, None] * engine.consequent_weights[output]).max(axis=1, initial=0.0)
+                # Aynı kesim vektörleri aynı centroidi verir; tekrarlı geçmiş verisinde satır sayısı çok azalır
+                unique, inverse = unique_rows(cuts)
+                if self.defuzzify == 'analytic':
+                    values = analytic_centroid_rows(universe, engine.consequent_triangles[output], unique)[inverse]
+                else:
+                    values = centroid_rows(*aggregate_rows(universe, mfs, unique))[inverse]
+                predicted = (values - universe[0]) / (universe[-1] - universe[0])
+                errors = (np.where(np.isnan(predicted), 0.5, predicted) - targets) ** 2
+                labelled = ~np.isnan(targets)
+                total += errors[labelled].sum()
+                count += labelled.sum()
+        return total / count if count else 0.0
+
+
+# Her işçi işlemde başlangıçta bir kez oluşturulur
+_evaluator = None
+
+
+def _init_worker(inputs, labels, defuzzify):
+    global _evaluator
+    _evaluator = TuningEvaluator(inputs, labels, defuzzify)
+
+
+def _evaluate(definition):
+    try:
+        return _evaluator.loss(definition)
+    except ValueError:
+        # Geçersiz aday (ör. analitik centroid için uygun olmayan üçgen) elenir
+        return np.inf
+
+
+def read_history(history_file):
+    reader = csv.DictReader(history_file)
+    fieldnames = reader.fieldnames or []
+    missing = [name for name in INPUT_NAMES if name not in fieldnames]
+    if missing:
+        raise ValueError(f"Eksik sütunlar: {', '.join(missing)}")
+    columns = [column for column in LABEL_COLUMNS if column in fieldnames]
+    if not columns:
+        raise ValueError(f"En az bir etiket sütunu gereklidir: {', '.join(LABEL_COLUMNS)}")
+
+    rows = list(reader)
+    inputs = parse_inputs(rows, 2)
+    labels = {}
+    for column in columns:
+        values = np.full(len(rows), np.nan)
+        for i, row in enumerate(rows):
+            if row[column] not in (None, ''):
+                try:
+                    values[i] = float(row[column])
+                except ValueError:
+                    values[i] = -1.0
+                if not 0.0 <= values[i] <= 1.0:
+                    raise ValueError(f"Satır {i + 2}: '{column}' etiketi 0 ile 1 arasında olmalıdır: {row[column]!r}")
+        labels[LABEL_COLUMNS[column]] = values
+    return inputs, labels
+
+
+def save_json(path, data):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, path)
+
+
+class Tuner:
+    # Elitist evrimsel arama: en iyi adaylar korunur, yeni adaylar iki elitin düzgün çaprazlaması ve
+    # Gauss mutasyonuyla üretilir. Her nesildeki adaylar işçi işlemlere dağıtılır.
+    def __init__(self, base, inputs, labels, population=DEFAULT_POPULATION, sigma=DEFAULT_SIGMA,
+                 workers=1, seed=0, defuzzify='sampled'):
+        validate_definition(base)
+        self.base = base
+        self.defuzzify = defuzzify
+        self.layout = parameter_layout(base)
+        self.low = np.array([low for _, low, _ in self.layout], dtype=np.float64)
+        self.high = np.array([high for _, _, high in self.layout], dtype=np.float64)
+        self.population_size = max(2, population)
+        self.sigma = sigma
+        self.rng = np.random.default_rng(seed)
+        self.rows = len(inputs[INPUT_NAMES[0]])
+        self.generation = 0
+        self.population = [self.normalize(read_parameters(base, self.layout))]
+        self.losses = [None]
+        self.best = self.population[0]
+        self.best_loss = None
+        self.initial_loss = None
+
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = None
+        if self.workers == 1:
+            _init_worker(inputs, labels, defuzzify)
+        else:
+            self.pool = multiprocessing.Pool(self.workers, initializer=_init_worker,
+                                             initargs=(inputs, labels, defuzzify))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def normalize(self, parameters):
+        # Yuvarlama, sınırlar ve sıralama uygulanmış hali; aynı tanım her zaman aynı vektörü verir
+        return read_parameters(make_definition(self.base, self.layout, parameters), self.layout)
+
+    def evaluate(self, candidates):
+        definitions = [make_definition(self.base, self.layout, parameters) for parameters in candidates]
+        if self.pool is None:
+            return [_evaluate(definition) for definition in definitions]
+        return self.pool.map(_evaluate, definitions, chunksize=max(1, len(definitions) // (self.workers * 2)))
+
+    def breed(self, elite):
+        span = self.high - self.low
+        children = []
+        while len(elite) + len(children) < self.population_size:
+            first, second = self.rng.choice(len(elite), 2, replace=len(elite) < 2)
+            mask = self.rng.random(len(span)) < 0.5
+            child = np.where(mask, elite[first], elite[second])
+            child = child + self.rng.normal(0.0, self.sigma, len(span)) * span
+            children.append(self.normalize(np.clip(child, self.low, self.high)))
+        return children
+
+    def score(self):
+        # Yalnızca henüz değerlendirilmemiş adaylar hesaplanır; elitlerin kaybı saklıdır
+        pending = [i for i, loss in enumerate(self.losses) if loss is None]
+        for i, loss in zip(pending, self.evaluate([self.population[i] for i in pending])):
+            self.losses[i] = loss
+        if self.initial_loss is None:
+            self.initial_loss = self.losses[0]
+
+        order = np.argsort(self.losses, kind='stable')
+        if self.best_loss is None or self.losses[order[0]] < self.best_loss:
+            self.best, self.best_loss = self.population[order[0]], self.losses[order[0]]
+        return order, len(pending)
+
+    def step(self):
+        order, evaluated = self.score()
+
+        elite_count = max(2, int(round(self.population_size * ELITE_FRACTION)))
+        elite = [self.population[i] for i in order[:elite_count]]
+        self.population = elite + self.breed(elite)
+        self.losses = [self.losses[i] for i in order[:elite_count]] + [None] * (len(self.population) - elite_count)
+        self.sigma *= SIGMA_DECAY
+        self.generation += 1
+        return evaluated
+
+    def best_definition(self):
+        return make_definition(self.base, self.layout, self.best)
+
+    def state(self):
+        return {
+            'definition_hash': definition_hash(self.base),
+            'defuzzify': self.defuzzify,
+            'generation': self.generation,
+            'sigma': self.sigma,
+            'population': [parameters.tolist() for parameters in self.population],
+            'losses': self.losses,
+            'best': self.best.tolist(),
+            'best_loss': self.best_loss,
+            'initial_loss': self.initial_loss,
+            'rng': self.rng.bit_generator.state
+        }
+
+    def restore(self, state):
+        if state.get('definition_hash') != definition_hash(self.base):
+            raise ValueError("Kontrol noktası farklı bir başlangıç tanımına ait.")
+        if state.get('defuzzify', 'analytic') != self.defuzzify:
+            raise ValueError(f"Kontrol noktası '{state.get('defuzzify', 'analytic')}' durulaştırma yöntemiyle oluşturulmuş.")
+        self.generation = state['generation']
+        self.sigma = state['sigma']
+        self.population = [np.array(parameters) for parameters in state['population']]
+        self.losses = state['losses']
+        self.best = np.array(state['best'])
+        self.best_loss = state['best_loss']
+        self.initial_loss = state['initial_loss']
+        self.rng.bit_generator.state = state['rng']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Üyelik fonksiyonlarını ve kural ağırlıklarını etiketli bakım geçmişine göre ayarlar.")
+    parser.add_argument('history', help="Girdiler ve etiketler (maintenance_needed, replaced) içeren CSV dosyası")
+    parser.add_argument('--output', default='tuned_system.json', help="En iyi tanımın yazılacağı JSON dosyası")
+    parser.add_argument('--definition', help="Başlangıç tanımı (varsayılan: tire_system.json)")
+    parser.add_argument('--generations', type=int, default=DEFAULT_GENERATIONS, help="Nesil sayısı")
+    parser.add_argument('--population', type=int, default=DEFAULT_POPULATION, help="Nesil başına aday sayısı")
+    parser.add_argument('--sigma', type=float, default=DEFAULT_SIGMA, help="Başlangıç mutasyon adımı (aralığın oranı)")
+    parser.add_argument('--workers', type=int, default=0, help="Paralel işçi işlem sayısı (0: tüm çekirdekler)")
+    parser.add_argument('--seed', type=int, default=0, help="Rastgele tohum")
+    parser.add_argument('--analytic', action='store_true',
+                        help="Adayları kapalı biçim centroid ile puanla (tanımı --analytic ile kullanacaksanız)")
+    parser.add_argument('--checkpoint', help="Her nesilden sonra güncellenen kontrol noktası; varsa kaldığı yerden devam edilir")
+    parser.add_argument('--quiet', action='store_true', help="Nesil bilgisini gösterme")
+    args = parser.parse_args(argv)
+
+    try:
+        base = read_definition(args.definition or DEFAULT_DEFINITION)
+        with open(args.history, newline='', encoding='utf-8') as f:
+            inputs, labels = read_history(f)
+        state = None
+        if args.checkpoint and os.path.exists(args.checkpoint):
+            with open(args.checkpoint, encoding='utf-8') as f:
+                state = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Hata oluştu: {e}", file=sys.stderr)
+        return 1
+
+    defuzzify = 'analytic' if args.analytic else 'sampled'
+    with Tuner(base, inputs, labels, args.population, args.sigma, args.workers, args.seed, defuzzify) as tuner:
+        try:
+            if state is not None:
+                tuner.restore(state)
+        except (KeyError, ValueError) as e:
+            print(f"Hata oluştu: {e}", file=sys.stderr)
+            return 1
+        while tuner.generation < args.generations:
+            start = time.perf_counter()
+            evaluated = tuner.step()
+            elapsed = time.perf_counter() - start
+            if args.checkpoint:
+                save_json(args.checkpoint, tuner.state())
+            if not args.quiet:
+                print(f"Nesil {tuner.generation}/{args.generations}: en iyi kayıp {tuner.best_loss:.5f} "
+                      f"(başlangıç {tuner.initial_loss:.5f}), {elapsed:.1f} sn, "
+                      f"{evaluated * tuner.rows / max(elapsed, 1e-9):.0f} lastik-aday/sn", file=sys.stderr, flush=True)
+        if tuner.best_loss is None:
+            # Hiç nesil çalışmadıysa (--generations 0) yalnızca başlangıç tanımı değerlendirilir
+            tuner.score()
+        save_json(args.output, tuner.best_definition())
+
+    print(f"En iyi kayıp {tuner.best_loss:.5f} (başlangıç {tuner.initial_loss:.5f}); tanım yazıldı: {args.output}",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
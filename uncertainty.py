@@ -0,0 +1,207 @@
+import argparse
+import csv
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from csv_input import parse_inputs, read_chunks
+from fuzzy_engine import INPUT_NAMES, OUTPUT_NAMES
+from fuzzy_system import PRIORITY_LEVELS, PROBABILITY_LEVELS, TireFuzzySystem
+
+# Sensör gürültüsü: girdi -> (model, ölçek); normal: standart sapma, uniform: ± yarı genişlik
+DEFAULT_NOISE = {
+    'tire_pressure': ('normal', 0.5),
+    'temperature': ('normal', 1.0)
+}
+NOISE_KINDS = ('normal', 'uniform')
+DEFAULT_SAMPLES = 1000
+DEFAULT_PERCENTILES = (5, 50, 95)
+# Tek seferde değerlendirilen en fazla satır (lastik x örnek); bellek kullanımını sınırlar
+MAX_BATCH_ROWS = 200000
+
+# Çıktı -> (CSV sütun öneki, seviyeler)
+OUTPUT_LEVELS = {
+    'maintenance_priority': ('priority', PRIORITY_LEVELS),
+    'change_probability': ('probability', PROBABILITY_LEVELS)
+}
+
+
+def parse_noise(specs):
+    # "tire_pressure=normal:0.5" biçimindeki tanımlar; ölçek 0 veya "none" gürültüyü kapatır
+    noise = dict(DEFAULT_NOISE)
+    for spec in specs:
+        try:
+            name, model = spec.split('=', 1)
+            kind, scale = ('normal', 0.0) if model == 'none' else model.split(':', 1)
+            scale = float(scale)
+        except ValueError:
+            raise ValueError(f"Geçersiz gürültü tanımı: '{spec}' (girdi=model:ölçek olmalıdır)")
+        if name not in INPUT_NAMES or kind not in NOISE_KINDS or scale < 0:
+            raise ValueError(f"Geçersiz gürültü tanımı: '{spec}' (modeller: {', '.join(NOISE_KINDS)})")
+        if scale == 0:
+            noise.pop(name, None)
+        else:
+            noise[name] = (kind, scale)
+    return noise
+
+
+class UncertaintyAnalyzer:
+    def __init__(self, system, noise=None, samples=DEFAULT_SAMPLES, percentiles=DEFAULT_PERCENTILES, seed=None):
+        self.system = system
+        self.noise = DEFAULT_NOISE if noise is None else noise
+        self.samples = samples
+        self.percentiles = tuple(percentiles)
+        self.rng = np.random.default_rng(seed)
+
+    def perturb(self, inputs):
+        # (lastik, örnek) biçiminde bozulmuş girdiler; değerler girdi evreniyle sınırlanır
+        count = len(inputs[INPUT_NAMES[0]])
+        shape = (count, self.samples)
+        perturbed = {}
+        for name in INPUT_NAMES:
+            values = np.broadcast_to(np.asarray(inputs[name], dtype=np.float64)[:, None], shape)
+            if name in self.noise:
+                kind, scale = self.noise[name]
+                if kind == 'normal':
+                    values = values + self.rng.normal(0.0, scale, shape)
+                else:
+                    values = values + self.rng.uniform(-scale, scale, shape)
+                universe = self.system.engine.antecedents[name][0]
+                values = np.clip(values, universe[0], universe[-1])
+            perturbed[name] = values
+        return perturbed
+
+    def analyze(self, inputs):
+        # Tüm lastiklerin tüm örnekleri tek bir toplu çağrıda (bellek sınırı için bloklar halinde) değerlendirilir.
+        # Bozulmuş girdiler ızgara dışında kaldığından tablo yerine her zaman motor kullanılır
+        count = len(inputs[INPUT_NAMES[0]])
+        block = max(1, MAX_BATCH_ROWS // self.samples)
+        parts = []
+        for start in range(0, count, block):
+            perturbed = self.perturb({name: np.asarray(inputs[name])[start:start + block] for name in INPUT_NAMES})
+            size = perturbed[INPUT_NAMES[0]].shape[0]
+            outputs = self.system.engine.compute({name: values.ravel() for name, values in perturbed.items()})
+            parts.append({name: np.asarray(outputs[name]).reshape(size, self.samples) for name in OUTPUT_NAMES})
+        return {name: self.summarize(np.concatenate([part[name] for part in parts]) if parts
+                                     else np.empty((0, self.samples)), OUTPUT_LEVELS[name][1])
+                for name in OUTPUT_NAMES}
+
+    def summarize(self, values, levels):
+        # Hesaplanamayan (NaN) örnekler istatistiklere ve sınıf olasılıklarına katılmaz
+        valid = ~np.isnan(values)
+        counts = valid.sum(axis=1)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            summary = {
+                'mean': np.nanmean(values, axis=1),
+                'std': np.nanstd(values, axis=1),
+                'percentiles': dict(zip(self.percentiles, np.nanpercentile(values, self.percentiles, axis=1))),
+                'valid': counts / self.samples
+            }
+        classes = np.searchsorted([limit for limit, _, _ in levels[:-1]], values, side='left')
+        summary['classes'] = {
+            key: np.divide(((classes == i) & valid).sum(axis=1), counts, out=np.full(len(counts), np.nan),
+                           where=counts > 0)
+            for i, (_, key, _) in enumerate(levels)
+        }
+        return summary
+
+
+def result_columns(percentiles):
+    columns = []
+    for name in OUTPUT_NAMES:
+        prefix, levels = OUTPUT_LEVELS[name]
+        columns += [f"{name}_mean", f"{name}_std"] + [f"{name}_p{p:g}" for p in percentiles]
+        columns += [f"{prefix}_{key}" for _, key, _ in levels]
+    return columns
+
+
+def format_results(rows, results, percentiles):
+    for i, row in enumerate(rows):
+        for name in OUTPUT_NAMES:
+            prefix, levels = OUTPUT_LEVELS[name]
+            summary = results[name]
+            values = {f"{name}_mean": summary['mean'][i], f"{name}_std": summary['std'][i]}
+            values.update({f"{name}_p{p:g}": summary['percentiles'][p][i] for p in percentiles})
+            values.update({f"{prefix}_{key}": summary['classes'][key][i] for _, key, _ in levels})
+            for column, value in values.items():
+                row[column] = '' if np.isnan(value) else f"{value:.3f}"
+    return rows
+
+
+def describe(results, index=0):
+    # Arayüz açıklaması için tek lastiğin özeti
+    lines = []
+    for name, title in (('maintenance_priority', "Bakım Önceliği"), ('change_probability', "Değişim İhtimali")):
+        summary = results[name]
+        percentiles = summary['percentiles']
+        low, high = percentiles[min(percentiles)][index], percentiles[max(percentiles)][index]
+        lines.append(f"- {title}: ortalama {summary['mean'][index]:.2f}, "
+                     f"%{max(percentiles) - min(percentiles):g} aralık {low:.2f} - {high:.2f}")
+        lines.append("  " + ", ".join(f"{label}: %{summary['classes'][key][index] * 100:.0f}"
+                                      for _, key, label in OUTPUT_LEVELS[name][1]))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gürültülü sensör girdileri için Monte Carlo belirsizlik analizi yapar.")
+    parser.add_argument('input', help="Girdi CSV dosyası ('-' standart girdi)")
+    parser.add_argument('output', help="Çıktı CSV dosyası ('-' standart çıktı)")
+    parser.add_argument('--samples', type=int, default=DEFAULT_SAMPLES, help="Lastik başına örnek sayısı")
+    parser.add_argument('--noise', action='append', default=[], metavar='GIRDI=MODEL:OLCEK',
+                        help="Girdi gürültü modeli, ör. tire_pressure=normal:0.5 veya temperature=none (tekrarlanabilir)")
+    parser.add_argument('--percentiles', default=','.join(map(str, DEFAULT_PERCENTILES)), help="Yüzdelikler (virgülle)")
+    parser.add_argument('--seed', type=int, help="Rastgele tohum")
+    parser.add_argument('--chunk-size', type=int, default=1000, help="Tek seferde okunacak lastik sayısı")
+    parser.add_argument('--definition', help="JSON/YAML sistem tanımı (varsayılan: tire_system.json)")
+    parser.add_argument('--analytic', action='store_true', help="Üçgen çıktı kümeleri için kapalı biçim centroid kullan")
+    parser.add_argument('--quiet', action='store_true', help="İlerleme bilgisini gösterme")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.samples < 1:
+            raise ValueError("--samples en az 1 olmalıdır")
+        noise = parse_noise(args.noise)
+        percentiles = [float(p) for p in args.percentiles.split(',')]
+        system = TireFuzzySystem(defuzzify='analytic' if args.analytic else 'sampled', definition=args.definition)
+    except (OSError, ValueError) as e:
+        print(f"Hata oluştu: {e}", file=sys.stderr)
+        return 1
+    analyzer = UncertaintyAnalyzer(system, noise, args.samples, percentiles, args.seed)
+
+    input_file = sys.stdin if args.input == '-' else open(args.input, newline='', encoding='utf-8')
+    output_file = sys.stdout if args.output == '-' else open(args.output, 'w', newline='', encoding='utf-8')
+    total = 0
+    start = time.perf_counter()
+    try:
+        reader = csv.DictReader(input_file)
+        missing = [name for name in INPUT_NAMES if name not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"Eksik sütunlar: {', '.join(missing)}")
+        writer = csv.DictWriter(output_file, fieldnames=list(reader.fieldnames) + result_columns(percentiles))
+        writer.writeheader()
+        for rows in read_chunks(reader, args.chunk_size):
+            results = analyzer.analyze(parse_inputs(rows, total + 2))
+            writer.writerows(format_results(rows, results, percentiles))
+            total += len(rows)
+            if not args.quiet:
+                elapsed = time.perf_counter() - start
+                print(f"{total} lastik işlendi ({total * args.samples / elapsed:.0f} örnek/sn)", file=sys.stderr, flush=True)
+    except ValueError as e:
+        print(f"Hata oluştu: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+    if not args.quiet:
+        print(f"Toplam {total} lastik, {time.perf_counter() - start:.1f} sn", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())